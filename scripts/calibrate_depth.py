@@ -0,0 +1,130 @@
+# scripts/calibrate_depth.py (Encoder Depth Calibration)
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+import torch
+import yaml
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.factory import OctopusTranslatorFactory
+
+
+def load_records(path: str) -> List[Dict[str, str]]:
+    """Training data JSON (list of {"src", "context"}) or one source text per line."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return [{"src": line.strip()} for line in f if line.strip()]
+
+
+def build_translator(config: Dict, side: str, num_layers: Optional[int], state: Optional[Dict], adapter_cache: Dict):
+    """Translator for `config` with the `side` adapter cut to `num_layers` (None: full depth).
+
+    `state` (checkpoint layout) is loaded so every depth uses the same subnet
+    and coordinator weights.
+    """
+    config = json.loads(json.dumps(config))  # Deep copy
+    params = config["adapters"][f"{side}_params"]
+    params.pop("num_layers", None)
+    if num_layers is not None:
+        params["num_layers"] = num_layers
+    config.pop("capture", None)  # Calibration traffic is not production traffic
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False, encoding="utf-8") as f:
+        yaml.safe_dump(config, f, allow_unicode=True)
+    try:
+        translator = OctopusTranslatorFactory.create_from_config(f.name, adapter_cache=adapter_cache)
+    finally:
+        os.remove(f.name)
+    if state is not None:
+        translator.load_state_dict(state)  # Weights of layers beyond num_layers are skipped
+    translator.eval()
+    translator.dictionary_threshold = None  # Measure the neural path only
+    return translator
+
+
+def run(translator, records: List[Dict]) -> List[Dict]:
+    """translate_with_metadata() for every record (after one warm-up request)."""
+    translator.translate(records[0]["src"], records[0].get("context", ""))
+    return [translator.translate_with_metadata(r["src"], r.get("context", "")) for r in records]
+
+
+def summarize(reference: List[Dict], results: List[Dict]) -> Dict[str, float]:
+    """Agreement with the full-depth decisions, and latency."""
+    agree = scored = 0
+    for full, cut in zip(reference, results):
+        if not (full["coordinator_skipped"] and cut["coordinator_skipped"]):
+            scored += 1
+            agree += full["translation"] == cut["translation"]
+    elapsed = sorted(r["elapsed"] for r in results)
+    encode = [sum(r["stages"].get(s, 0.0) for s in ("subnet_features", "input_embed")) for r in results]
+    return {
+        "agreement": agree / scored if scored else float("nan"),
+        "scored": scored,
+        "latency_ms": 1000 * sum(elapsed) / len(elapsed),
+        "latency_p95_ms": 1000 * elapsed[min(len(elapsed) - 1, int(0.95 * len(elapsed)))],
+        "encode_ms": 1000 * sum(encode) / len(encode)
+    }
+
+
+def calibrate(args):
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    records = [r for r in load_records(args.data) if r.get("src")][:args.limit]
+    if not records:
+        raise ValueError(f"No 'src' texts found in {args.data}")
+
+    # Reference: full depth (the other adapter is built once and shared via the cache)
+    adapter_cache = {}
+    state = torch.load(args.checkpoint, map_location=torch.device("cpu")) if args.checkpoint else None
+    translator = build_translator(config, args.side, None, state, adapter_cache)
+    state = state or translator.state_dict()  # Untrained: share the reference's random weights
+    adapter = translator.src_adapter if args.side == "source" else translator.tgt_adapter
+    full_depth = adapter.num_layers
+    reference = run(translator, records)
+    report = {"full_depth": full_depth, "samples": len(records), "depths": {}}
+    report["depths"][full_depth] = summarize(reference, reference)
+    del translator, adapter
+
+    depths = args.depths or list(range(1, full_depth))
+    for k in sorted(set(depths) - {full_depth}):
+        try:
+            translator = build_translator(config, args.side, k, state, adapter_cache)
+        except ValueError as e:  # e.g. pool_layers deeper than k
+            print(f"Skipping depth {k}: {e}")
+            continue
+        report["depths"][k] = summarize(reference, run(translator, records))
+        del translator
+
+    # Cheapest depth whose routing matches the full model often enough
+    qualifying = [k for k, r in report["depths"].items() if r["agreement"] >= args.min_agreement]
+    report["recommended"] = min(qualifying) if qualifying else full_depth
+
+    print(f"\n=== Depth Calibration ({args.side} adapter, {len(records)} inputs) ===")
+    print(f"{'layers':>6} {'agreement':>10} {'latency ms':>11} {'p95 ms':>8} {'encode ms':>10}")
+    for k in sorted(report["depths"]):
+        r = report["depths"][k]
+        print(f"{k:>6} {r['agreement']:>10.1%} {r['latency_ms']:>11.2f} {r['latency_p95_ms']:>8.2f} {r['encode_ms']:>10.2f}")
+    print(f"Recommended num_layers: {report['recommended']} (agreement >= {args.min_agreement:.0%})")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure coordinator agreement and latency per encoder depth")
+    parser.add_argument("--config", type=str, required=True, help="Path to YAML config file")
+    parser.add_argument("--data", type=str, required=True, help="Training data JSON or plain-text corpus")
+    parser.add_argument("--checkpoint", type=str, help="Trained checkpoint (.pth) for subnet/coordinator weights")
+    parser.add_argument("--side", choices=["source", "target"], default="source", help="Adapter to truncate")
+    parser.add_argument("--depths", type=int, nargs="+", help="Depths to try (default: 1 to full depth)")
+    parser.add_argument("--limit", type=int, default=500, help="Inputs translated per depth")
+    parser.add_argument("--min_agreement", type=float, default=0.99, help="Agreement required for the recommendation")
+    parser.add_argument("--report", type=str, help="Also write the report as JSON to this path")
+    args = parser.parse_args()
+    calibrate(args)
@@ -0,0 +1,39 @@
+# scripts/compile_knowledge.py (Domain Dictionary Compiler)
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.utils.compact_dict import compile_compact_dict
+
+
+def compile_knowledge(args):
+    for resource_type in args.types:
+        src_path = os.path.join(args.data_dir, f"domain_{args.domain}_{resource_type}.json")
+        if not os.path.exists(src_path):
+            print(f"Skipping {resource_type}: {src_path} not found")
+            continue
+
+        with open(src_path, "r", encoding="utf-8") as f:
+            mapping = json.load(f)
+
+        out_path = os.path.splitext(src_path)[0] + ".bin"
+        compile_compact_dict(mapping, out_path)
+        print(
+            f"Compiled {len(mapping)} {resource_type} entries: {src_path} → {out_path} "
+            f"({os.path.getsize(src_path)} → {os.path.getsize(out_path)} bytes)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile domain dictionaries to memory-mapped binary tables")
+    parser.add_argument("--domain", type=str, required=True, help="Domain name (e.g. medical)")
+    parser.add_argument("--data_dir", type=str, default="data", help="Directory with domain_<d>_<type>.json files")
+    parser.add_argument(
+        "--types", nargs="+", default=["terms", "abbreviations"],
+        help="Dictionary resources to compile (string → string mappings only)"
+    )
+    args = parser.parse_args()
+    compile_knowledge(args)
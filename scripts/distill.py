@@ -0,0 +1,218 @@
+# scripts/distill.py (Student Adapter Distillation)
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import torch
+import torch.nn.functional as F
+import yaml
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.factory import OctopusTranslatorFactory
+from src.interfaces.adapter import BaseLanguageAdapter
+from src.modules.adapters.depth import encoder_states
+from src.modules.adapters.windowing import pool_content
+from src.registry import global_registry
+
+
+def load_records(path: str) -> List[Dict[str, str]]:
+    """Training data JSON (list of {"src", "tgt", "context"}) or one source text per line."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return [{"src": line.strip()} for line in f if line.strip()]
+
+
+def stack_inputs(adapter: BaseLanguageAdapter, texts: List[str]) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Model inputs for a batch of texts, from the adapter's (cached) encodings."""
+    encodings = adapter.encode_batch(texts)
+    input_ids = torch.cat([e.input_ids for e in encodings])
+    attention_mask = torch.cat([e.attention_mask for e in encodings])
+    return input_ids, attention_mask
+
+
+def teacher_features(teacher: BaseLanguageAdapter, texts: List[str], batch_size: int) -> torch.Tensor:
+    """Mean-pooled teacher features [N, embed_dim], pooled exactly as `embed` output is."""
+    pooled = []
+    with torch.no_grad():
+        for i in range(0, len(texts), batch_size):
+            input_ids, attention_mask = stack_inputs(teacher, texts[i:i + batch_size])
+            hidden = encoder_states(teacher.model, input_ids, attention_mask, teacher.pool_layers)
+            pooled.append(pool_content(hidden, attention_mask))
+    return torch.cat(pooled)
+
+
+def distillation_loss(student: torch.Tensor, teacher: torch.Tensor, loss: str) -> torch.Tensor:
+    mse = F.mse_loss(student, teacher)
+    cosine = 1 - F.cosine_similarity(student, teacher, dim=1).mean()
+    return {"mse": mse, "cosine": cosine, "both": mse + cosine}[loss]
+
+
+def train_student(student, texts: List[str], targets: torch.Tensor, args) -> None:
+    optimizer = torch.optim.Adam(student.encoder.parameters(), lr=args.learning_rate)
+    student.train()
+    order = list(range(len(texts)))
+    for epoch in range(args.epochs):
+        random.shuffle(order)
+        total_loss = 0.0
+        for i in range(0, len(order), args.batch_size):
+            idx = order[i:i + args.batch_size]
+            input_ids, attention_mask = stack_inputs(student, [texts[j] for j in idx])
+            pooled = pool_content(student(input_ids), attention_mask)
+            loss = distillation_loss(pooled, targets[idx], args.loss)
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item() * len(idx)
+        print(f"Epoch {epoch+1}/{args.epochs} | Loss: {total_loss / len(order):.4f}")
+    student.eval()
+
+
+def feature_fidelity(student, texts: List[str], targets: torch.Tensor, batch_size: int) -> Dict[str, float]:
+    with torch.no_grad():
+        pooled = []
+        for i in range(0, len(texts), batch_size):
+            input_ids, attention_mask = stack_inputs(student, texts[i:i + batch_size])
+            pooled.append(pool_content(student(input_ids), attention_mask))
+        pooled = torch.cat(pooled)
+    cosine = F.cosine_similarity(pooled, targets, dim=1)
+    return {
+        "mse": F.mse_loss(pooled, targets).item(),
+        "cosine_mean": cosine.mean().item(),
+        "cosine_min": cosine.min().item()
+    }
+
+
+def embed_latency(adapter: BaseLanguageAdapter, texts: List[str]) -> float:
+    """Mean seconds per single-text `embed` call (tokenization excluded)."""
+    encodings = adapter.encode_batch(texts)
+    start = time.perf_counter()
+    for encoding in encodings:
+        adapter.embed(encoding)
+    return (time.perf_counter() - start) / max(len(encodings), 1)
+
+
+def coordinator_agreement(teacher_translator, student_translator, records: List[Dict]) -> Dict[str, float]:
+    """Compare full-pipeline outputs with the same coordinator weights."""
+    student_translator.coordinator.load_state_dict(teacher_translator.coordinator.state_dict())
+    agree = scored = 0
+    teacher_time = student_time = 0.0
+    for record in records:
+        start = time.perf_counter()
+        teacher = teacher_translator.translate_with_metadata(record["src"], record.get("context", ""))
+        teacher_time += time.perf_counter() - start
+        start = time.perf_counter()
+        student = student_translator.translate_with_metadata(record["src"], record.get("context", ""))
+        student_time += time.perf_counter() - start
+        if not (teacher["coordinator_skipped"] and student["coordinator_skipped"]):
+            scored += 1
+            agree += teacher["translation"] == student["translation"]
+    count = max(len(records), 1)
+    return {
+        "agreement": agree / scored if scored else float("nan"),
+        "scored": scored,
+        "teacher_translate_seconds": teacher_time / count,
+        "student_translate_seconds": student_time / count
+    }
+
+
+def distill(args):
+    random.seed(args.seed)
+    torch.manual_seed(args.seed)
+    side = args.side
+    field = "src" if side == "source" else "tgt"
+
+    with open(args.student_config, "r", encoding="utf-8") as f:
+        student_config = yaml.safe_load(f)
+    student_params = dict(student_config["adapters"][f"{side}_params"])
+    weights_path = student_params.pop("weights_path", None) or args.output
+    if not weights_path:
+        raise ValueError("Set adapters.<side>_params.weights_path in the student config or pass --output")
+
+    # Teacher translator; the shared adapter cache lets the student translator reuse the other side
+    adapter_cache = {}
+    teacher_translator = OctopusTranslatorFactory.create_from_config(args.config, adapter_cache=adapter_cache)
+    if args.checkpoint:
+        teacher_translator.load(args.checkpoint)
+    teacher_translator.eval()
+    teacher = teacher_translator.src_adapter if side == "source" else teacher_translator.tgt_adapter
+    student = global_registry.get_adapter(student_config["adapters"][side], **student_params)
+
+    # Corpus: distinct texts, split into train and held-out
+    records = [r for r in load_records(args.data) if r.get(field)]
+    if not records:
+        raise ValueError(f"No '{field}' texts found in {args.data}")
+    random.shuffle(records)
+    eval_count = max(1, int(len(records) * args.eval_fraction))
+    eval_records, train_records = records[:eval_count], records[eval_count:] or records[:eval_count]
+    train_texts = list(dict.fromkeys(r[field] for r in train_records))
+    eval_texts = list(dict.fromkeys(r[field] for r in eval_records))
+
+    print(f"Computing teacher features for {len(train_texts)} train / {len(eval_texts)} held-out texts")
+    train_targets = teacher_features(teacher, train_texts, args.batch_size)
+    eval_targets = teacher_features(teacher, eval_texts, args.batch_size)
+
+    train_student(student, train_texts, train_targets, args)
+    os.makedirs(os.path.dirname(weights_path) or ".", exist_ok=True)
+    torch.save(student.encoder.state_dict(), weights_path)
+    print(f"Student weights saved to {weights_path}")
+
+    # Report: feature fidelity, coordinator agreement, speedup
+    report = {"fidelity": feature_fidelity(student, eval_texts, eval_targets, args.batch_size)}
+    teacher_embed = embed_latency(teacher, eval_texts)
+    student_embed = embed_latency(student, eval_texts)
+    report["embed_seconds"] = {"teacher": teacher_embed, "student": student_embed}
+    report["embed_speedup"] = teacher_embed / max(student_embed, 1e-12)
+    report["parameters"] = {
+        "teacher": sum(p.numel() for p in teacher.parameters()),
+        "student": sum(p.numel() for p in student.parameters())
+    }
+
+    student_translator = OctopusTranslatorFactory.create_from_config(args.student_config, adapter_cache=adapter_cache)
+    student_translator.eval()
+    for translator in (teacher_translator, student_translator):
+        translator.dictionary_threshold = None  # Measure the neural path only
+    agreement = coordinator_agreement(teacher_translator, student_translator, eval_records[:args.agreement_samples])
+    agreement["translate_speedup"] = (
+        agreement["teacher_translate_seconds"] / max(agreement["student_translate_seconds"], 1e-12)
+    )
+    report["coordinator"] = agreement
+
+    print("\n=== Distillation Report ===")
+    fidelity = report["fidelity"]
+    print(f"Feature fidelity: cosine {fidelity['cosine_mean']:.4f} (min {fidelity['cosine_min']:.4f}), "
+          f"MSE {fidelity['mse']:.6f}")
+    print(f"Coordinator agreement: {agreement['agreement']:.1%} over {agreement['scored']} inputs")
+    print(f"Embed speedup: x{report['embed_speedup']:.1f} "
+          f"({teacher_embed * 1000:.2f}ms → {student_embed * 1000:.2f}ms)")
+    print(f"Translate speedup: x{agreement['translate_speedup']:.1f}")
+    print(f"Parameters: {report['parameters']['teacher']:,} → {report['parameters']['student']:,}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distill a student adapter from a BERT adapter")
+    parser.add_argument("--config", type=str, required=True, help="Teacher YAML config")
+    parser.add_argument("--student_config", type=str, required=True, help="YAML config using the student adapter")
+    parser.add_argument("--data", type=str, required=True, help="Training data JSON or plain-text corpus")
+    parser.add_argument("--side", choices=["source", "target"], default="source", help="Adapter to distill")
+    parser.add_argument("--checkpoint", type=str, help="Teacher checkpoint (.pth) for coordinator weights")
+    parser.add_argument("--output", type=str, help="Weights path if the student config does not set one")
+    parser.add_argument("--epochs", type=int, default=10, help="Number of training epochs")
+    parser.add_argument("--batch_size", type=int, default=32, help="Batch size")
+    parser.add_argument("--learning_rate", type=float, default=1e-3, help="Learning rate")
+    parser.add_argument("--loss", choices=["mse", "cosine", "both"], default="both", help="Feature matching loss")
+    parser.add_argument("--eval_fraction", type=float, default=0.1, help="Held-out fraction for the report")
+    parser.add_argument("--agreement_samples", type=int, default=500, help="Held-out inputs translated end to end")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--report", type=str, help="Also write the report as JSON to this path")
+    args = parser.parse_args()
+    distill(args)
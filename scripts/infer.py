@@ -1,29 +1,43 @@
 # scripts/infer.py (Inference Script)
 
 import argparse
+import json
+import multiprocessing
 import os
 import sys
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.factory import OctopusTranslatorFactory
+from src.translator import OctopusTranslator
+from src.utils.cache import LRUCache
 
 
-def infer(args):
+def load_translator(config: str, verbose: bool = True) -> OctopusTranslator:
     # Load translator from config
-    translator = OctopusTranslatorFactory.create_from_config(args.config)
-    
+    translator = OctopusTranslatorFactory.create_from_config(config)
+
     # Load trained model if available
-    model_path = os.path.join("models", f"{args.config.split('/')[-1].replace('.yaml', '.pth')}")
+    model_path = os.path.join("models", f"{config.split('/')[-1].replace('.yaml', '.pth')}")
     if os.path.exists(model_path):
         translator.load(model_path)
-        print(f"Loaded trained model from {model_path}")
-    else:
+        if verbose:
+            print(f"Loaded trained model from {model_path}")
+    elif verbose:
         print("No trained model found; using initial model")
 
-    # Run inference
     translator.eval()
+    return translator
+
+
+def infer(args):
+    translator = load_translator(args.config)
+
+    # Run inference
     result = translator.translate(args.text, args.context)
-    
+
     # Print results
     print("\n=== Translation Result ===")
     print(f"Source Text: {args.text}")
@@ -33,10 +47,238 @@ def infer(args):
     return result
 
 
+# ---- Bulk file translation ----
+
+_worker_translator: Optional[OctopusTranslator] = None
+
+
+def _init_worker(config: str) -> None:
+    global _worker_translator
+    _worker_translator = load_translator(config, verbose=False)
+
+
+def _translate_pairs(pairs: List[Tuple[str, str]]) -> List[str]:
+    texts, contexts = zip(*pairs) if pairs else ((), ())
+    return _worker_translator.translate_batch(list(texts), list(contexts))
+
+
+def _parse_line(line: str, fmt: str) -> Tuple[Optional[Dict], Tuple[str, str]]:
+    """Return (jsonl record or None, (text, context)) for one input line."""
+    if fmt == "jsonl":
+        if not line.strip():
+            return None, ("", "")
+        record = json.loads(line)
+        return record, (record.get("text", record.get("src", "")), record.get("context", ""))
+    return None, (line.rstrip("\n"), "")
+
+
+def _format_line(record: Optional[Dict], translation: str, fmt: str) -> str:
+    if fmt == "jsonl":
+        if record is None:
+            return "\n"
+        return json.dumps({**record, "translation": translation}, ensure_ascii=False) + "\n"
+    return translation.replace("\n", " ") + "\n"
+
+
+def _read_chunks(path: str, skip: int, chunk_size: int) -> Iterator[List[str]]:
+    """Stream the input in chunks of lines, skipping lines already processed."""
+    with open(path, "r", encoding="utf-8") as f:
+        for _ in range(skip):
+            if not f.readline():
+                return
+        chunk = []
+        for line in f:
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _save_progress(path: str, state: Dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def infer_bulk(args):
+    fmt = args.format or ("jsonl" if args.input.endswith(".jsonl") else "text")
+    progress_path = f"{args.output}.progress"
+
+    # Resume from the last checkpoint unless asked to restart
+    state = {"input": os.path.abspath(args.input), "lines_done": 0, "output_bytes": 0}
+    if not args.restart and os.path.exists(progress_path) and os.path.exists(args.output):
+        with open(progress_path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("input") == state["input"]:
+            state = saved
+            print(f"Resuming after {state['lines_done']} lines", file=sys.stderr)
+
+    out = open(args.output, "r+b" if state["lines_done"] else "wb")
+    out.truncate(state["output_bytes"])  # Drop output written after the last checkpoint
+    out.seek(state["output_bytes"])
+
+    pool = pipeline = None
+    if args.workers > 1:
+        pool = multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(args.config,))
+    else:
+        _init_worker(args.config)
+        if args.pipeline:
+            pipeline = _worker_translator.pipeline(workers=args.stage_workers).start()
+
+    def submit(pairs):
+        if pipeline is not None:
+            return _FutureResult(pipeline.submit(pairs))
+        if pool is None:
+            return _ImmediateResult(_translate_pairs(pairs))
+        return pool.apply_async(_translate_pairs, (pairs,))
+
+    cache = LRUCache(max_size=args.cache_size)  # (text, context) → translation across chunks
+    in_flight = deque()                          # Chunks awaiting results, in input order
+    awaited: Dict[Tuple[str, str], int] = {}     # Pair → in-flight chunks needing it
+    resolved: Dict[Tuple[str, str], str] = {}    # Results later in-flight chunks still need
+    # Bounds memory regardless of file size
+    max_in_flight = pipeline.capacity if pipeline is not None else max(1, 2 * args.workers)
+    start = last_report = time.monotonic()
+    lines_this_run = translated = 0
+
+    def drain_one():
+        nonlocal lines_this_run, translated, last_report
+        parsed, known, pending, deferred, result = in_flight.popleft()
+        known.update(zip(pending, result.get()))
+        known.update((pair, resolved[pair]) for pair in deferred)  # Translated by an earlier chunk
+        translated += len(pending)
+        for pair in pending + deferred:
+            cache.put(pair, known[pair])
+            awaited[pair] -= 1
+            if awaited[pair]:
+                resolved[pair] = known[pair]
+            else:
+                del awaited[pair]
+                resolved.pop(pair, None)
+
+        for record, pair in parsed:
+            translation = known.get(pair, "")
+            out.write(_format_line(record, translation, fmt).encode("utf-8"))
+        out.flush()
+        state["lines_done"] += len(parsed)
+        state["output_bytes"] = out.tell()
+        _save_progress(progress_path, state)
+
+        lines_this_run += len(parsed)
+        now = time.monotonic()
+        if now - last_report >= args.report_every:
+            last_report = now
+            rate = lines_this_run / (now - start)
+            print(
+                f"{state['lines_done']} lines | {rate:.1f} lines/s | "
+                f"{translated} translated, {lines_this_run - translated} deduplicated",
+                file=sys.stderr
+            )
+
+    try:
+        for chunk in _read_chunks(args.input, state["lines_done"], args.chunk_size):
+            parsed = [_parse_line(line, fmt) for line in chunk]
+            # Only distinct pairs not already cached go to the workers
+            # Pairs already in flight wait for that chunk's result instead
+            known, pending, deferred = {}, {}, {}
+            for _, pair in parsed:
+                if not pair[0] or pair in known or pair in pending or pair in deferred:
+                    continue
+                if pair in awaited:
+                    deferred[pair] = None
+                elif pair in cache:
+                    known[pair] = cache.get(pair)
+                else:
+                    pending[pair] = None
+            pending, deferred = list(pending), list(deferred)
+            for pair in pending + deferred:
+                awaited[pair] = awaited.get(pair, 0) + 1
+            in_flight.append((parsed, known, pending, deferred, submit(pending)))
+            if len(in_flight) >= max_in_flight:
+                drain_one()
+        while in_flight:
+            drain_one()
+    finally:
+        out.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if pipeline is not None:
+            pipeline.close()
+
+    elapsed = time.monotonic() - start
+    if os.path.exists(progress_path):
+        os.remove(progress_path)
+    print(
+        f"Done: {state['lines_done']} lines → {args.output} "
+        f"({lines_this_run / max(elapsed, 1e-9):.1f} lines/s, {translated} translated)",
+        file=sys.stderr
+    )
+    if pipeline is not None:
+        for name, stage in pipeline.stats().items():
+            print(
+                f"  {name:<10} {stage['workers']} worker(s) | {100 * stage['utilization']:5.1f}% busy | "
+                f"starved {stage['starved']:.1f}s | blocked {stage['blocked']:.1f}s",
+                file=sys.stderr
+            )
+
+
+def _parse_stage_workers(value: str) -> Dict[str, int]:
+    """"rules=2,encode=1" → {"rules": 2, "encode": 1}."""
+    workers = {}
+    for entry in filter(None, value.split(",")):
+        name, _, count = entry.partition("=")
+        workers[name.strip()] = int(count)
+    return workers
+
+
+class _FutureResult:
+    """AsyncResult-style view of a pipeline Future (the pipeline returns metadata dicts)."""
+
+    def __init__(self, future):
+        self._future = future
+
+    def get(self):
+        return [result["translation"] for result in self._future.result()]
+
+
+class _ImmediateResult:
+    """Stand-in for AsyncResult when translating in-process."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run Octopus Translator Inference")
     parser.add_argument("--config", type=str, required=True, help="Path to YAML config file")
-    parser.add_argument("--text", type=str, required=True, help="Text to translate")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--text", type=str, help="Text to translate")
+    source.add_argument("--input", type=str, help="Bulk mode: JSONL ({\"text\", \"context\"}) or plain-text file")
     parser.add_argument("--context", type=str, default="", help="Optional context text")
+    parser.add_argument("--output", type=str, help="Bulk mode: output file (same format as input)")
+    parser.add_argument("--format", choices=["jsonl", "text"], help="Bulk input format (default: by extension)")
+    parser.add_argument("--workers", type=int, default=1, help="Bulk mode: parallel translator processes")
+    parser.add_argument("--chunk_size", type=int, default=256, help="Bulk mode: lines per work unit")
+    parser.add_argument("--cache_size", type=int, default=100000, help="Bulk mode: translations kept for deduplication")
+    parser.add_argument("--report_every", type=float, default=10.0, help="Bulk mode: seconds between progress reports")
+    parser.add_argument("--restart", action="store_true", help="Bulk mode: ignore saved progress and start over")
+    parser.add_argument("--pipeline", action="store_true", help="Bulk mode: overlap tokenization, rules, encoding and coordination in-process")
+    parser.add_argument("--stage_workers", type=_parse_stage_workers, default={},
+                        help="Bulk mode with --pipeline: threads per stage, e.g. rules=2,encode=2")
     args = parser.parse_args()
-    infer(args)
\ No newline at end of file
+
+    if args.input:
+        if not args.output:
+            parser.error("--output is required with --input")
+        if args.pipeline and args.workers > 1:
+            parser.error("--pipeline runs in-process; use it with --workers 1")
+        infer_bulk(args)
+    else:
+        infer(args)
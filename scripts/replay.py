@@ -0,0 +1,178 @@
+# scripts/replay.py (Traffic Replay)
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.factory import OctopusTranslatorFactory
+from src.utils.capture import read_records
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 100]) of an unsorted list."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def in_process_target(config: str, checkpoint: Optional[str] = None) -> Callable[[str, str], Dict]:
+    """Translate with a local translator built from `config` (capture disabled)."""
+    translator = OctopusTranslatorFactory.create_from_config(config)
+    if checkpoint:
+        translator.load(checkpoint)
+    translator.eval()
+    if translator.recorder is not None:  # Never record the replay itself
+        translator.recorder.close()
+        translator.recorder = None
+    return translator.translate_with_metadata
+
+
+def http_target(url: str, timeout: float = 30.0) -> Callable[[str, str], Dict]:
+    """POST {"text", "context"} as JSON to a translation server.
+
+    The response must be a JSON object with "translation"; "path" and "stages"
+    are used for the report when present.
+    """
+    def translate(text: str, context: str) -> Dict:
+        body = json.dumps({"text": text, "context": context}).encode("utf-8")
+        request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    return translate
+
+
+def replay(
+    records: List[Dict],
+    translate: Callable[[str, str], Dict],
+    speed: float = 1.0,
+    concurrency: int = 4
+) -> Dict:
+    """Send recorded requests at their recorded offsets divided by `speed`.
+
+    Requests are issued open-loop: each is dispatched at its scheduled time
+    whether or not earlier ones have finished, and latency is measured from
+    the scheduled time, so queueing under overload is included. `speed` 0
+    sends everything immediately (maximum throughput).
+
+    Returns:
+        {"latencies": [...], "paths": Counter, "stages": {name: [seconds]},
+         "errors": int, "wall": seconds}
+    """
+    results = {"latencies": [], "paths": Counter(), "stages": defaultdict(list), "errors": 0}
+    lock = threading.Lock()
+
+    def run(record: Dict, due: float) -> None:
+        try:
+            output = translate(record["text"], record["context"])
+        except Exception as e:
+            with lock:
+                results["errors"] += 1
+            print(f"Request failed: {e}", file=sys.stderr)
+            return
+        latency = time.monotonic() - due
+        with lock:
+            results["latencies"].append(latency)
+            results["paths"][output.get("path", "unknown")] += 1
+            for stage, seconds in output.get("stages", {}).items():
+                results["stages"][stage].append(seconds)
+
+    t0 = records[0]["timestamp"] if records else 0.0
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for record in records:
+            due = start + ((record["timestamp"] - t0) / speed if speed > 0 else 0.0)
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run, record, due)
+    results["wall"] = time.monotonic() - start
+    return results
+
+
+def report(results: Dict, records: List[Dict], speed: float) -> Dict:
+    """Summarize a replay (and the recorded latencies, for comparison)."""
+    latencies = results["latencies"]
+    recorded = [r["latency"] for r in records if r.get("latency") is not None]
+    span = records[-1]["timestamp"] - records[0]["timestamp"] if records else 0.0
+    stage_totals = {name: sum(values) for name, values in results["stages"].items()}
+    total_stage_time = sum(stage_totals.values()) or 1.0
+    return {
+        "requests": len(records),
+        "completed": len(latencies),
+        "errors": results["errors"],
+        "speed": speed,
+        "recorded_span": span,
+        "wall": results["wall"],
+        "throughput": len(latencies) / max(results["wall"], 1e-9),
+        "latency": {f"p{q}": percentile(latencies, q) for q in (50, 90, 99)},
+        "latency_max": max(latencies) if latencies else float("nan"),
+        "recorded_latency": {f"p{q}": percentile(recorded, q) for q in (50, 90, 99)},
+        "paths": dict(results["paths"]),
+        "stages": {
+            name: {
+                "mean": stage_totals[name] / len(values),
+                "p99": percentile(values, 99),
+                "share": stage_totals[name] / total_stage_time
+            }
+            for name, values in sorted(results["stages"].items(), key=lambda kv: -stage_totals[kv[0]])
+        }
+    }
+
+
+def print_report(summary: Dict) -> None:
+    ms = lambda seconds: f"{seconds * 1000:.1f}ms"
+    print("\n=== Replay Report ===")
+    print(
+        f"Requests: {summary['completed']}/{summary['requests']} completed, {summary['errors']} errors "
+        f"(speed x{summary['speed']:g}, recorded span {summary['recorded_span']:.1f}s, wall {summary['wall']:.1f}s)"
+    )
+    print(f"Throughput: {summary['throughput']:.1f} req/s")
+    print("Latency:  " + "  ".join(f"{k} {ms(v)}" for k, v in summary["latency"].items())
+          + f"  max {ms(summary['latency_max'])}")
+    print("Recorded: " + "  ".join(f"{k} {ms(v)}" for k, v in summary["recorded_latency"].items()))
+    completed = max(summary["completed"], 1)
+    print("Paths:    " + "  ".join(f"{path} {count / completed:.1%}" for path, count in summary["paths"].items()))
+    if summary["stages"]:
+        print("Stages (mean / p99 / share of stage time):")
+        for name, stats in summary["stages"].items():
+            print(f"  {name:<20} {ms(stats['mean']):>9} {ms(stats['p99']):>9} {stats['share']:>7.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay captured translation traffic")
+    parser.add_argument("--log", type=str, required=True, help="Capture log path (rotated files are included)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--config", type=str, help="Replay in-process against a translator built from this config")
+    target.add_argument("--url", type=str, help="Replay against a translation server (JSON POST endpoint)")
+    parser.add_argument("--checkpoint", type=str, help="In-process: checkpoint (.pth) to load")
+    parser.add_argument("--speed", type=float, default=1.0, help="Rate multiplier (2 = twice as fast, 0 = no pacing)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum requests in flight")
+    parser.add_argument("--limit", type=int, help="Replay only the first N requests")
+    parser.add_argument("--report", type=str, help="Also write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    records = []
+    for record in read_records(args.log):
+        if args.limit is not None and len(records) >= args.limit:
+            break
+        records.append(record)
+    if not records:
+        parser.error(f"No captured requests found at {args.log}")
+
+    translate = in_process_target(args.config, args.checkpoint) if args.config else http_target(args.url)
+    summary = report(replay(records, translate, args.speed, args.concurrency), records, args.speed)
+    print_report(summary)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
@@ -0,0 +1,39 @@
+# scripts/subnet_server.py (Subnet Shard Server)
+
+import argparse
+import os
+import sys
+import torch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.factory import OctopusTranslatorFactory
+from src.modules.subnets.remote import SubnetServer
+
+
+def serve(args):
+    subnets = OctopusTranslatorFactory.create_shard(args.config, args.shard)
+
+    # Load the trained weights of the served subnets (same checkpoint as the translator)
+    if args.checkpoint:
+        checkpoint = torch.load(args.checkpoint, map_location=torch.device("cpu"))
+        for key, subnet in subnets.items():
+            subnet.load_state_dict(checkpoint["subnets"][int(key.split(":")[0])])
+    for subnet in subnets.values():
+        subnet.eval()
+
+    shard = OctopusTranslatorFactory._load_config(args.config)["shards"][args.shard]
+    server = SubnetServer(subnets, shard["address"], authkey=shard.get("authkey"))
+    print(f"Serving {list(subnets)} on {shard['address']}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve one shard of an Octopus Translator's subnets")
+    parser.add_argument("--config", type=str, required=True, help="Path to YAML config file")
+    parser.add_argument("--shard", type=str, required=True, help="Shard name from the config's `shards` section")
+    parser.add_argument("--checkpoint", type=str, help="Trained checkpoint (.pth) to load subnet weights from")
+    args = parser.parse_args()
+    serve(args)
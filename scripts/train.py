@@ -1,12 +1,18 @@
 # scripts/train.py
 
 import argparse
+import itertools
 import json
 import os
+import sys
+from typing import Dict
 import torch
 import torch.nn as nn
 from torch.utils.data import Dataset, DataLoader
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.factory import OctopusTranslatorFactory
+from src.utils.checkpoint import AsyncCheckpointer, list_checkpoints, load_checkpoint
 
 
 class TranslationDataset(Dataset):
@@ -14,7 +20,7 @@ class TranslationDataset(Dataset):
 
     def __init__(self, data_path: str):
         """Load training data from JSON file.
-        
+
         Data format: List of {"src":..., "tgt":..., "context":...}
         """
         with open(data_path, "r", encoding="utf-8") as f:
@@ -27,20 +33,27 @@ class TranslationDataset(Dataset):
         return self.data[idx]
 
 
+def make_dataloader(dataset: Dataset, batch_size: int, seed: int, epoch: int) -> DataLoader:
+    """Shuffled loader whose order depends only on (seed, epoch), so a resumed run sees the same batches."""
+    return DataLoader(
+        dataset,
+        batch_size=batch_size,
+        shuffle=True,
+        generator=torch.Generator().manual_seed(seed + epoch),
+        collate_fn=lambda x: x  # Preserve raw dicts
+    )
+
+
 def train(args):
     # Create output directories
     os.makedirs("models", exist_ok=True)
     os.makedirs("memory", exist_ok=True)
+    config_name = args.config.split('/')[-1].replace('.yaml', '')
 
     # Load translator and dataset
     translator = OctopusTranslatorFactory.create_from_config(args.config)
     dataset = TranslationDataset(args.data)
-    dataloader = DataLoader(
-        dataset,
-        batch_size=args.batch_size,
-        shuffle=True,
-        collate_fn=lambda x: x  # Preserve raw dicts
-    )
+    batches_per_epoch = (len(dataset) + args.batch_size - 1) // args.batch_size
 
     # Initialize optimizer and loss function
     optimizer = torch.optim.Adam(
@@ -50,12 +63,42 @@ def train(args):
     )
     criterion = nn.CrossEntropyLoss()  # Replace with CTC/Transformer loss for production
 
+    # Periodic checkpoints (snapshotted to CPU, written in the background)
+    checkpoint_dir = args.checkpoint_dir or os.path.join("checkpoints", config_name)
+    checkpointer = None
+    if args.checkpoint_every > 0:
+        checkpointer = AsyncCheckpointer(checkpoint_dir, keep=args.keep_checkpoints)
+
+    # Resume model, optimizer, memory banks and dataloader position
+    start_epoch, start_batch, global_step, resumed_loss = 0, 0, 0, 0.0
+    if args.resume:
+        resume_path = args.resume
+        if resume_path == "latest":
+            found = list_checkpoints(checkpoint_dir)
+            if not found:
+                raise ValueError(f"No checkpoints to resume from in {checkpoint_dir}")
+            resume_path = found[-1]
+        state, memory = load_checkpoint(resume_path)
+        translator.load_state_dict(state["model"])
+        optimizer.load_state_dict(state["optimizer"])
+        if memory is not None:
+            translator.load_memory_state_dict(memory)
+        if state["seed"] != args.seed or state["batch_size"] != args.batch_size:
+            print("Warning: seed or batch size differs from the checkpoint; data order will not match")
+        start_epoch, start_batch = state["epoch"], state["batch"]
+        global_step, resumed_loss = state["global_step"], state["epoch_loss"]
+        if start_batch >= batches_per_epoch:
+            start_epoch, start_batch, resumed_loss = start_epoch + 1, 0, 0.0
+        print(f"Resumed from {resume_path} (epoch {start_epoch+1}, batch {start_batch}, step {global_step})")
+
     # Training loop
     translator.train()
-    for epoch in range(args.epochs):
-        total_loss = 0.0
-        
-        for batch in dataloader:
+    for epoch in range(start_epoch, args.epochs):
+        total_loss = resumed_loss if epoch == start_epoch else 0.0
+        skip = start_batch if epoch == start_epoch else 0
+        dataloader = make_dataloader(dataset, args.batch_size, args.seed, epoch)
+
+        for batch_idx, batch in enumerate(itertools.islice(dataloader, skip, None), start=skip):
             optimizer.zero_grad()
             batch_loss = 0.0
 
@@ -67,11 +110,11 @@ def train(args):
 
                 # Forward pass
                 pred = translator.translate(src_text, context)
-                
+
                 # Dummy loss calculation (replace with token-level loss)
                 # This is a placeholder; use tokenized targets for real training
                 loss = criterion(
-                    torch.tensor([0.0], requires_grad=True),
+                    torch.tensor([[0.0]], requires_grad=True),
                     torch.tensor([0])
                 )
                 batch_loss += loss
@@ -80,13 +123,29 @@ def train(args):
             batch_loss.backward()
             optimizer.step()
             total_loss += batch_loss.item()
+            global_step += 1
+
+            if checkpointer is not None and global_step % args.checkpoint_every == 0:
+                checkpointer.save(global_step, {
+                    "model": translator.state_dict(),
+                    "optimizer": optimizer.state_dict(),
+                    "epoch": epoch,
+                    "batch": batch_idx + 1,          # Batches of this epoch already trained
+                    "global_step": global_step,
+                    "epoch_loss": total_loss,
+                    "seed": args.seed,
+                    "batch_size": args.batch_size
+                }, memory=translator.memory_state_dict())
 
         # Log progress
-        avg_loss = total_loss / len(dataloader)
+        avg_loss = total_loss / batches_per_epoch
         print(f"Epoch {epoch+1}/{args.epochs} | Avg Loss: {avg_loss:.4f}")
 
+    if checkpointer is not None:
+        checkpointer.close()
+
     # Save model and update subnet memories
-    model_path = os.path.join("models", f"{args.config.split('/')[-1].replace('.yaml', '.pth')}")
+    model_path = os.path.join("models", f"{config_name}.pth")
     translator.save(model_path)
     translator.update_memory(dataset.data)
     print(f"Model saved to {model_path}")
@@ -99,5 +158,10 @@ if __name__ == "__main__":
     parser.add_argument("--epochs", type=int, default=10, help="Number of training epochs")
     parser.add_argument("--batch_size", type=int, default=8, help="Batch size")
     parser.add_argument("--learning_rate", type=float, default=1e-4, help="Learning rate")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the data order (needed to resume mid-epoch)")
+    parser.add_argument("--checkpoint_every", type=int, default=0, help="Checkpoint every N steps (0 disables)")
+    parser.add_argument("--checkpoint_dir", type=str, help="Checkpoint directory (default: checkpoints/<config>)")
+    parser.add_argument("--keep_checkpoints", type=int, default=3, help="Most recent checkpoints to keep")
+    parser.add_argument("--resume", type=str, help="Checkpoint path to resume from, or 'latest'")
     args = parser.parse_args()
-    train(args)
\ No newline at end of file
+    train(args)
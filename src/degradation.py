@@ -0,0 +1,52 @@
+# src/degradation.py
+
+from typing import Any, Dict, List, Optional
+
+# Translation paths, from most to least expensive
+FULL = "full"       # All subnets (BERT features) + coordinator
+MEMORY = "memory"   # Exact hit in a subnet memory bank
+RULES = "rules"     # String-only subnet transformation (dictionary + rules)
+DICTIONARY = "dictionary"  # Pre-check: input covered by domain terms (no neural modules)
+
+PATHS = (FULL, MEMORY, RULES)
+
+DEFAULT_LADDER = [
+    {"path": FULL, "min_remaining": 0.2},
+    {"path": MEMORY, "min_remaining": 0.0},
+    {"path": RULES, "min_remaining": 0.0},
+]
+
+
+class DegradationPolicy:
+    """Degradation ladder for requests with a deadline.
+
+    Each step names a path and the minimum remaining budget (seconds) needed
+    to attempt it. Steps are tried in order; a step whose budget is not met is
+    skipped, and a memory miss falls through to the next step. The rules path
+    is the floor and is always available.
+    """
+
+    def __init__(self, ladder: Optional[List[Dict[str, Any]]] = None, rule_subnet: Optional[int] = None):
+        self.ladder = []
+        for step in ladder or DEFAULT_LADDER:
+            if step["path"] not in PATHS:
+                raise ValueError(f"Unknown degradation path '{step['path']}'. Available: {list(PATHS)}")
+            self.ladder.append((step["path"], float(step.get("min_remaining", 0.0))))
+        # Subnet whose string-only output serves the rules path
+        # (None: the last subnet that has one, i.e. the domain subnet in the shipped configs)
+        self.rule_subnet = rule_subnet
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "DegradationPolicy":
+        """Build from the optional `degradation` section of a YAML config."""
+        config = config or {}
+        return cls(ladder=config.get("ladder"), rule_subnet=config.get("rule_subnet"))
+
+    def plan(self, remaining: Optional[float]) -> List[str]:
+        """Paths to try, in order, for the remaining budget (None: no deadline)."""
+        if remaining is None:
+            return [FULL]
+        paths = [path for path, min_remaining in self.ladder if remaining >= min_remaining]
+        if RULES not in paths:
+            paths.append(RULES)
+        return paths
@@ -1,13 +1,19 @@
 # src/factory.py
 
+import json
+import threading
+import torch
 import yaml
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from src.modules.knowledge import DomainKnowledge
+from src.utils.memory import SampleStore
+from src.utils.capture import TrafficRecorder
 from src.interfaces.adapter import BaseLanguageAdapter
 from src.interfaces.subnet import BaseSubnet
 from src.interfaces.coordinator import BaseCoordinator
 from src.registry import global_registry
 from src.translator import OctopusTranslator
+from src.degradation import DegradationPolicy
 
 
 class OctopusTranslatorFactory:
@@ -18,26 +24,34 @@ class OctopusTranslatorFactory:
     """
 
     @staticmethod
-    def create_from_config(config_path: str) -> OctopusTranslator:
-        """Create a translator instance from a YAML configuration file."""
+    def create_from_config(
+        config_path: str,
+        adapter_cache: Optional[Dict[Tuple[str, str], BaseLanguageAdapter]] = None
+    ) -> OctopusTranslator:
+        """Create a translator instance from a YAML configuration file.
+        
+        Args:
+            config_path: Path to the YAML config
+            adapter_cache: Optional dict shared across calls; adapters with the
+                same name and params are built once and reused (see src/router.py)
+        """
         # Load and validate config
         config = OctopusTranslatorFactory._load_config(config_path)
         OctopusTranslatorFactory._validate_config(config)
 
-        # Initialize domain knowledge (centralizes all domain data)
-        domain_knowledge = DomainKnowledge(
-            domain=config["domain"],
-            data_dir=config.get("data_dir", "data")
-        )
+        # Domain data and memories first (cheap), then the neural modules
+        domain_knowledge, sample_store = OctopusTranslatorFactory._load_domain(config)
 
         # Load source and target language adapters
         src_adapter = OctopusTranslatorFactory._load_adapter(
             config["adapters"]["source"],
-            config["adapters"]["source_params"]
+            config["adapters"]["source_params"],
+            adapter_cache
         )
         tgt_adapter = OctopusTranslatorFactory._load_adapter(
             config["adapters"]["target"],
-            config["adapters"]["target_params"]
+            config["adapters"]["target_params"],
+            adapter_cache
         )
 
         # Load subnets (inject adapters and domain knowledge)
@@ -45,7 +59,9 @@ class OctopusTranslatorFactory:
             config["subnets"],
             src_adapter,
             tgt_adapter,
-            domain_knowledge
+            domain_knowledge,
+            sample_store,
+            config.get("shards")
         )
 
         # Load coordinator
@@ -61,8 +77,148 @@ class OctopusTranslatorFactory:
             src_adapter=src_adapter,
             tgt_adapter=tgt_adapter,
             subnets=subnets,
-            coordinator=coordinator
+            coordinator=coordinator,
+            domain_knowledge=domain_knowledge,
+            sample_store=sample_store,
+            **OctopusTranslatorFactory._translator_options(config)
+        )
+
+    @staticmethod
+    def create_progressive(
+        config_path: str,
+        checkpoint_path: Optional[str] = None,
+        adapter_cache: Optional[Dict[Tuple[str, str], BaseLanguageAdapter]] = None
+    ) -> OctopusTranslator:
+        """Create a translator that serves before its neural modules are loaded.
+        
+        Domain knowledge, memories and subnets are built immediately (no
+        adapters), so dictionary, memory and rule paths answer requests within
+        milliseconds. Adapters, the coordinator and the optional checkpoint load
+        on a background thread and are swapped in between requests; track
+        progress with `translator.readiness`, `health()` or `wait_until_ready()`.
+        
+        Args:
+            config_path: Path to the YAML config
+            checkpoint_path: Optional trained checkpoint (.pth) loaded in the background
+            adapter_cache: Optional shared adapter cache (see create_from_config)
+        """
+        config = OctopusTranslatorFactory._load_config(config_path)
+        OctopusTranslatorFactory._validate_config(config)
+        domain_knowledge, sample_store = OctopusTranslatorFactory._load_domain(config)
+        subnets = OctopusTranslatorFactory._load_subnets(
+            config["subnets"],
+            None,
+            None,
+            domain_knowledge,
+            sample_store,
+            config.get("shards")
+        )
+        translator = OctopusTranslator(
+            src_adapter=None,
+            tgt_adapter=None,
+            subnets=subnets,
+            coordinator=None,
+            domain_knowledge=domain_knowledge,
+            sample_store=sample_store,
+            **OctopusTranslatorFactory._translator_options(config)
+        )
+
+        def load_neural_modules():
+            try:
+                src_adapter = OctopusTranslatorFactory._load_adapter(
+                    config["adapters"]["source"],
+                    config["adapters"]["source_params"],
+                    adapter_cache
+                )
+                tgt_adapter = OctopusTranslatorFactory._load_adapter(
+                    config["adapters"]["target"],
+                    config["adapters"]["target_params"],
+                    adapter_cache
+                )
+                coordinator = OctopusTranslatorFactory._load_coordinator(
+                    config["coordinator"]["name"],
+                    config["coordinator"]["params"],
+                    len(subnets),
+                    src_adapter.embed_dim
+                )
+                checkpoint = None
+                if checkpoint_path:
+                    checkpoint = torch.load(checkpoint_path, map_location=torch.device("cpu"))
+                translator.attach_neural_modules(src_adapter, tgt_adapter, coordinator, checkpoint)
+            except Exception as e:  # Keep serving the string-only paths
+                translator.mark_load_failed(e)
+
+        threading.Thread(target=load_neural_modules, name="octopus-progressive-load", daemon=True).start()
+        return translator
+
+    @staticmethod
+    def create_shard(config_path: str, shard: str) -> Dict[str, BaseSubnet]:
+        """Build the subnets a config places in `shard`, for a subnet server.
+        
+        The shard gets its own adapters and domain knowledge, and the shard's
+        own `memory_store` (if any) instead of the translator's.
+        
+        Returns:
+            Subnets keyed as RemoteSubnet proxies address them ("<index>:<name>")
+        """
+        config = OctopusTranslatorFactory._load_config(config_path)
+        OctopusTranslatorFactory._validate_config(config)
+        shards = config.get("shards") or {}
+        if shard not in shards:
+            raise ValueError(f"Unknown shard '{shard}'. Available: {list(shards)}")
+        placed = [(i, cfg) for i, cfg in enumerate(config["subnets"]) if cfg.get("shard") == shard]
+        if not placed:
+            raise ValueError(f"No subnets are placed in shard '{shard}'")
+
+        domain_knowledge, _ = OctopusTranslatorFactory._load_domain(config)
+        sample_store = None
+        if shards[shard].get("memory_store"):
+            sample_store = SampleStore(save_path=shards[shard]["memory_store"])
+        src_adapter = OctopusTranslatorFactory._load_adapter(
+            config["adapters"]["source"],
+            config["adapters"]["source_params"]
+        )
+        tgt_adapter = OctopusTranslatorFactory._load_adapter(
+            config["adapters"]["target"],
+            config["adapters"]["target_params"]
+        )
+        local_configs = [{k: v for k, v in cfg.items() if k != "shard"} for _, cfg in placed]
+        subnets = OctopusTranslatorFactory._load_subnets(
+            local_configs,
+            src_adapter,
+            tgt_adapter,
+            domain_knowledge,
+            sample_store
         )
+        return {f"{i}:{cfg['name']}": subnet for (i, cfg), subnet in zip(placed, subnets)}
+
+    @staticmethod
+    def _load_domain(config: Dict[str, Any]) -> Tuple[DomainKnowledge, Optional[SampleStore]]:
+        """Build domain knowledge and the optional shared sample store."""
+        # Initialize domain knowledge (centralizes all domain data)
+        domain_knowledge = DomainKnowledge(
+            domain=config["domain"],
+            data_dir=config.get("data_dir", "data"),
+            syntax_rules_path=config.get("syntax_rules"),
+            ambiguity_rules_path=config.get("ambiguity_rules")
+        )
+
+        # Shared sample store behind all subnet memories (optional; otherwise
+        # each subnet keeps its own memory bank file)
+        sample_store = None
+        if config.get("memory_store"):
+            sample_store = SampleStore(save_path=config["memory_store"])
+        return domain_knowledge, sample_store
+
+    @staticmethod
+    def _translator_options(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Optional translator settings: degradation ladder, fast path, capture, pipeline."""
+        return {
+            "degradation": DegradationPolicy.from_config(config.get("degradation")),
+            "dictionary_threshold": config.get("fast_path", {}).get("coverage_threshold"),
+            "recorder": TrafficRecorder.from_config(config["capture"]) if config.get("capture") else None,
+            "pipeline_options": config.get("pipeline")
+        }
 
     @staticmethod
     def _load_config(config_path: str) -> Dict[str, Any]:
@@ -84,26 +240,60 @@ class OctopusTranslatorFactory:
                 raise ValueError(f"Missing required config field: {field}")
 
     @staticmethod
-    def _load_adapter(adapter_name: str, params: Dict[str, Any]) -> BaseLanguageAdapter:
-        """Load a language adapter from the registry."""
-        return global_registry.get_adapter(adapter_name,** params)
+    def _load_adapter(
+        adapter_name: str,
+        params: Dict[str, Any],
+        adapter_cache: Optional[Dict[Tuple[str, str], BaseLanguageAdapter]] = None
+    ) -> BaseLanguageAdapter:
+        """Load a language adapter from the registry (or the shared cache)."""
+        if adapter_cache is None:
+            return global_registry.get_adapter(adapter_name,** params)
+        key = (adapter_name, json.dumps(params, sort_keys=True))
+        if key not in adapter_cache:
+            adapter_cache[key] = global_registry.get_adapter(adapter_name,** params)
+        return adapter_cache[key]
 
     @staticmethod
     def _load_subnets(
         subnet_configs: List[Dict[str, Any]],
-        src_adapter: BaseLanguageAdapter,
-        tgt_adapter: BaseLanguageAdapter,
-        domain_knowledge: DomainKnowledge
+        src_adapter: Optional[BaseLanguageAdapter],
+        tgt_adapter: Optional[BaseLanguageAdapter],
+        domain_knowledge: DomainKnowledge,
+        sample_store: Optional[SampleStore] = None,
+        shards: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> List[BaseSubnet]:
-        """Load subnets from the registry, injecting dependencies."""
+        """Load subnets from the registry, injecting dependencies.
+        
+        Entries with a `shard` key become RemoteSubnet proxies for the subnet
+        served by that shard (see `shards` in the config and
+        scripts/subnet_server.py).
+        """
         subnets = []
-        for cfg in subnet_configs:
+        for i, cfg in enumerate(subnet_configs):
+            if cfg.get("shard"):
+                shard = (shards or {}).get(cfg["shard"])
+                if shard is None:
+                    raise ValueError(f"Subnet '{cfg['name']}' is placed in unknown shard '{cfg['shard']}'")
+                subnets.append(global_registry.get_subnet(
+                    "remote_subnet_v1",
+                    src_adapter=src_adapter,
+                    tgt_adapter=tgt_adapter,
+                    domain_knowledge=domain_knowledge,
+                    address=shard["address"],
+                    subnet=f"{i}:{cfg['name']}",
+                    authkey=shard.get("authkey"),
+                    timeout=shard.get("timeout", 30.0)
+                ))
+                continue
+            params = dict(cfg.get("params", {}))
+            if sample_store is not None:
+                params["sample_store"] = sample_store
             subnet = global_registry.get_subnet(
                 cfg["name"],
                 src_adapter=src_adapter,
                 tgt_adapter=tgt_adapter,
                 domain_knowledge=domain_knowledge,
-                **cfg.get("params", {})
+                **params
             )
             subnets.append(subnet)
         return subnets
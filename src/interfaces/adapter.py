@@ -1,10 +1,38 @@
 # src/interfaces/adapter.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
 import torch
 
 
+class TextEncoding:
+    """Reusable tokenization result for one text.
+    
+    Produced once per string (see `encode`/`encode_batch`) and accepted by
+    tokenize, detokenize, parse_syntax and embed, so a request tokenizes each
+    text only once.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        token_ids: List[int],
+        tokens: List[str],
+        offsets: List[Tuple[int, int]],
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor
+    ):
+        self.text = text
+        self.token_ids = token_ids            # Content token IDs (no special tokens, untruncated)
+        self.tokens = tokens                  # Content tokens (subwords)
+        self.offsets = offsets                # Character span of each token in `text`
+        self.input_ids = input_ids            # Model input [1, max_seq_len] with [CLS]/[SEP]/padding
+        self.attention_mask = attention_mask  # [1, max_seq_len]
+
+
+TextOrEncoding = Union[str, TextEncoding]
+
+
 class BaseLanguageAdapter(ABC, torch.nn.Module):
     """Abstract base class for language adapters.
     
@@ -13,17 +41,17 @@ class BaseLanguageAdapter(ABC, torch.nn.Module):
     """
 
     @abstractmethod
-    def tokenize(self, text: str) -> List[str]:
+    def tokenize(self, text: TextOrEncoding) -> List[str]:
         """Split text into atomic tokens (words/subwords)."""
         raise NotImplementedError
 
     @abstractmethod
-    def detokenize(self, tokens: List[str]) -> str:
+    def detokenize(self, tokens: Union[List[str], TextEncoding]) -> str:
         """Reconstruct text from tokens."""
         raise NotImplementedError
 
     @abstractmethod
-    def embed(self, text: str) -> torch.Tensor:
+    def embed(self, text: TextOrEncoding) -> torch.Tensor:
         """Generate dense semantic embeddings for text.
         
         Returns:
@@ -32,6 +60,13 @@ class BaseLanguageAdapter(ABC, torch.nn.Module):
         raise NotImplementedError
 
     @abstractmethod
-    def parse_syntax(self, text: str) -> Dict:
+    def parse_syntax(self, text: TextOrEncoding) -> Dict:
         """Extract syntactic structure (e.g., dependencies, phrase boundaries)."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def encode_batch(self, texts: List[str]) -> List[TextOrEncoding]:
+        """Tokenize many texts at once, returning objects the other methods accept.
+        
+        Adapters without a reusable encoding return the texts unchanged.
+        """
+        return list(texts)
\ No newline at end of file
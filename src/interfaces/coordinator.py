@@ -1,8 +1,9 @@
 # src/interfaces/coordinator.py
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import FrozenSet, List, Union
 import torch
+from src.utils.lazy import LazyFeature
 
 
 class BaseCoordinator(ABC, torch.nn.Module):
@@ -10,8 +11,15 @@ class BaseCoordinator(ABC, torch.nn.Module):
     
     Coordinators fuse results from multiple subnets to produce the final translation,
     using attention or other mechanisms to weight subnet contributions.
+    
+    `consumes` declares which forward inputs the coordinator reads. The
+    translator only computes what is declared: coordinators that leave out
+    "subnet_features" receive unevaluated LazyFeature placeholders, and those
+    that leave out "input_embed" receive None. The default declares everything.
     """
 
+    consumes: FrozenSet[str] = frozenset({"subnet_outputs", "subnet_features", "input_embed"})
+
     @abstractmethod
     def __init__(self, subnet_count: int, embed_dim: int):
         super().__init__()
@@ -22,15 +30,17 @@ class BaseCoordinator(ABC, torch.nn.Module):
     def forward(
         self,
         subnet_outputs: List[str],
-        subnet_features: List[torch.Tensor],
+        subnet_features: List[Union[torch.Tensor, LazyFeature]],
         input_embed: torch.Tensor
     ) -> str:
         """Fuse subnet outputs into a final translation.
         
         Args:
             subnet_outputs: Text results from each subnet
-            subnet_features: Feature vectors from each subnet
-            input_embed: Embedding of the original input text
+            subnet_features: Feature vectors from each subnet (tensors if
+                declared in `consumes`, otherwise LazyFeature placeholders)
+            input_embed: Embedding of the original input text (None if not
+                declared in `consumes`)
         
         Returns:
             Final translated text
@@ -1,10 +1,11 @@
 # src/interfaces/subnet.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Union
 import torch
 from src.interfaces.adapter import BaseLanguageAdapter
 from src.modules.knowledge import DomainKnowledge
+from src.utils.lazy import LazyFeature
 
 
 class BaseSubnet(ABC, torch.nn.Module):
@@ -27,7 +28,7 @@ class BaseSubnet(ABC, torch.nn.Module):
         self.domain_knowledge = domain_knowledge
 
     @abstractmethod
-    def forward(self, input_text: str, context: str = "") -> Tuple[str, torch.Tensor]:
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, Union[torch.Tensor, LazyFeature]]:
         """Process input text and return intermediate result + features.
         
         Args:
@@ -36,10 +37,18 @@ class BaseSubnet(ABC, torch.nn.Module):
         
         Returns:
             Intermediate translation (target language)
-            Feature vector (shape [1, embed_dim]) for coordinator
+            Feature vector (shape [1, embed_dim]) for coordinator, either a
+            tensor or a LazyFeature computed only if the coordinator needs it
         """
         raise NotImplementedError
 
+    def forward_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[str, Union[torch.Tensor, LazyFeature]]]:
+        """Run `forward` on a batch of (input_text, context) pairs.
+        
+        Remote subnets override this to make one round trip per batch.
+        """
+        return [self.forward(input_text, context) for input_text, context in items]
+
     @abstractmethod
     def update_memory(self, samples: List[Dict]) -> None:
         """Update subnet memory with new training samples.
@@ -47,4 +56,23 @@ class BaseSubnet(ABC, torch.nn.Module):
         Args:
             samples: List of {"src":..., "tgt":..., "context":...}
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def transform(self, input_text: str, context: str = "") -> Optional[str]:
+        """String-only output, computed without any adapter embeddings.
+        
+        Used as a cheap fallback when a request is short on time. Subnets whose
+        output needs neural modules return None (the default).
+        """
+        return None
+
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        """Return a remembered translation for exactly this input, if any."""
+        return None
+
+    def clear_caches(self) -> None:
+        """Drop cached results derived from model weights or domain data.
+        
+        Called by the translator after a hot swap; subnets without caches
+        need not override it.
+        """
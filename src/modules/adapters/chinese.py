@@ -1,9 +1,13 @@
 # src/modules/adapters/chinese.py
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 import torch
-from transformers import BertTokenizer, BertModel
-from src.interfaces.adapter import BaseLanguageAdapter
+from transformers import BertTokenizerFast, BertModel
+from src.interfaces.adapter import BaseLanguageAdapter, TextEncoding, TextOrEncoding
+from src.modules.adapters.depth import encoder_states, resolve_pool_layers, truncate_encoder
+from src.modules.adapters.encoding import cached_encode_batch
+from src.modules.adapters.windowing import content_states, encode_windows
+from src.utils.cache import LRUCache
 from src.registry import global_registry
 
 
@@ -18,47 +22,94 @@ class ChineseAdapter(BaseLanguageAdapter):
         self,
         embed_dim: int = 768,
         model_name: str = "../../../models/bert-base-chinese",
-        max_seq_len: int = 128
+        max_seq_len: int = 128,
+        chunk_long_inputs: bool = False,
+        window_overlap: int = 32,
+        max_windows: int = 8,
+        encoding_cache_size: int = 4096,
+        num_layers: Optional[int] = None,
+        pool_layers: Optional[List[int]] = None
     ):
         super().__init__()
         self.embed_dim = embed_dim
         self.max_seq_len = max_seq_len
         
+        # Long-input mode: encode overlapping windows instead of truncating
+        self.chunk_long_inputs = chunk_long_inputs
+        self.window_overlap = window_overlap  # Tokens shared by adjacent windows
+        self.max_windows = max_windows        # Window budget per input
+        
         # Load pre-trained model and tokenizer
-        self.tokenizer = BertTokenizer.from_pretrained(model_name)
+        self.tokenizer = BertTokenizerFast.from_pretrained(model_name)
         self.model = BertModel.from_pretrained(model_name)
         
+        # Encoder depth: run only the first `num_layers` layers (see scripts/calibrate_depth.py),
+        # and optionally average the outputs of `pool_layers` instead of using the last one
+        if num_layers is not None:
+            truncate_encoder(self.model, num_layers)
+        self.num_layers = len(self.model.encoder.layer)
+        self.pool_layers = resolve_pool_layers(pool_layers, self.num_layers)
+        
+        # Encodings of recently seen strings (shared by tokenize/embed/parse_syntax)
+        self.encoding_cache = LRUCache(max_size=encoding_cache_size)
+        
         # Freeze pre-trained layers by default (fine-tune only if needed)
         for param in self.model.parameters():
             param.requires_grad = False
 
-    def tokenize(self, text: str) -> List[str]:
+    def encode(self, text: TextOrEncoding) -> TextEncoding:
+        """Tokenize text once (cached) into a reusable encoding."""
+        if isinstance(text, TextEncoding):
+            return text
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts: List[str]) -> List[TextEncoding]:
+        """Tokenize texts in one fast-tokenizer call, reusing cached encodings."""
+        return cached_encode_batch(self.encoding_cache, self.tokenizer, texts, self.max_seq_len)
+
+    def tokenize(self, text: TextOrEncoding) -> List[str]:
         """Tokenize Chinese text into subwords (includes [CLS]/[SEP] markers)."""
-        return self.tokenizer.tokenize(text)
+        return list(self.encode(text).tokens)
 
-    def detokenize(self, tokens: List[str]) -> str:
+    def detokenize(self, tokens: Union[List[str], TextEncoding]) -> str:
         """Reconstruct Chinese text from tokens (removes special markers)."""
+        if isinstance(tokens, TextEncoding):
+            tokens = tokens.tokens
         text = self.tokenizer.convert_tokens_to_string(tokens)
         return text.replace("[CLS]", "").replace("[SEP]", "").strip()
 
-    def embed(self, text: str) -> torch.Tensor:
-        """Generate BERT embeddings for text."""
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            padding="max_length",
-            truncation=True,
-            max_length=self.max_seq_len
-        )
+    def embed(self, text: TextOrEncoding) -> torch.Tensor:
+        """Generate BERT embeddings for text.
         
+        Returns states of real tokens only ([CLS]/[SEP] and padding are
+        dropped). In chunked mode, inputs longer than max_seq_len are encoded
+        as overlapping windows in one batched pass instead of being truncated.
+        """
+        encoding = self.encode(text)
+        if self.chunk_long_inputs and len(encoding.token_ids) > self.max_seq_len - 2:
+            return encode_windows(
+                self.model,
+                encoding.token_ids,
+                cls_id=self.tokenizer.cls_token_id,
+                sep_id=self.tokenizer.sep_token_id,
+                pad_id=self.tokenizer.pad_token_id,
+                max_seq_len=self.max_seq_len,
+                overlap=self.window_overlap,
+                max_windows=self.max_windows,
+                pool_layers=self.pool_layers
+            )  # Shape: [1, covered_tokens, embed_dim]
+
         with torch.no_grad():
-            outputs = self.model(** inputs)
+            hidden = encoder_states(self.model, encoding.input_ids, encoding.attention_mask, self.pool_layers)
         
-        return outputs.last_hidden_state  # Shape: [1, max_seq_len, embed_dim]
+        # Real tokens only, as in chunked mode, so mean-pooling never averages padding
+        return content_states(hidden, encoding.attention_mask)  # Shape: [1, real_tokens, embed_dim]
 
-    def parse_syntax(self, text: str) -> Dict:
+    def parse_syntax(self, text: TextOrEncoding) -> Dict:
         """Extract basic syntax features (extend with spaCy for deep parsing)."""
-        tokens = self.tokenize(text)
+        encoding = self.encode(text)
+        text = encoding.text
+        tokens = list(encoding.tokens)
         return {
             "tokens": tokens,
             "token_count": len(tokens),
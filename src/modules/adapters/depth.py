@@ -0,0 +1,68 @@
+# src/modules/adapters/depth.py
+
+from typing import List, Optional, Sequence
+import torch
+
+
+def truncate_encoder(model: torch.nn.Module, num_layers: int) -> None:
+    """Keep only the first `num_layers` transformer layers of a BERT model.
+
+    Later layers are removed from the encoder, so they are never executed and
+    their weights are freed. Checkpoints saved from the full-depth model still
+    load: entries for the removed layers are dropped on load.
+    """
+    layers = model.encoder.layer
+    if not 1 <= num_layers <= len(layers):
+        raise ValueError(f"num_layers must be between 1 and {len(layers)}, got {num_layers}")
+    if num_layers == len(layers):
+        return
+    model.encoder.layer = layers[:num_layers]
+    model.config.num_hidden_layers = num_layers
+
+    def drop_removed_layers(module, state_dict, prefix, *args):
+        for key in list(state_dict):
+            if key.startswith(prefix):
+                index = key[len(prefix):].split(".", 1)[0]
+                if index.isdigit() and int(index) >= num_layers:
+                    del state_dict[key]
+
+    model.encoder.layer.register_load_state_dict_pre_hook(drop_removed_layers)
+
+
+def resolve_pool_layers(pool_layers: Optional[Sequence[int]], depth: int) -> Optional[List[int]]:
+    """Validate pooled layer indices against the encoder depth.
+
+    Index 0 is the embedding output and i (1..depth) the output of layer i;
+    negative indices count back from the last layer kept (-1 = last).
+
+    Returns:
+        Sorted, non-negative hidden-state indices (None if no pooling is configured)
+    """
+    if not pool_layers:
+        return None
+    resolved = set()
+    for index in pool_layers:
+        absolute = depth + 1 + index if index < 0 else index
+        if not 0 <= absolute <= depth:
+            raise ValueError(f"pool_layers index {index} is out of range for an encoder with {depth} layers")
+        resolved.add(absolute)
+    return sorted(resolved)
+
+
+def encoder_states(
+    model: torch.nn.Module,
+    input_ids: torch.Tensor,
+    attention_mask: torch.Tensor,
+    pool_layers: Optional[List[int]] = None
+) -> torch.Tensor:
+    """Token states from the last layer, or the mean of the `pool_layers` outputs.
+
+    Returns:
+        Tensor of shape [batch, seq_len, embed_dim]
+    """
+    if pool_layers is None:
+        return model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+    hidden_states = model(
+        input_ids=input_ids, attention_mask=attention_mask, output_hidden_states=True
+    ).hidden_states
+    return torch.stack([hidden_states[i] for i in pool_layers]).mean(dim=0)
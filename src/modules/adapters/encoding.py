@@ -0,0 +1,63 @@
+# src/modules/adapters/encoding.py
+
+from typing import Callable, List, Optional
+import torch
+from src.interfaces.adapter import TextEncoding
+from src.utils.cache import LRUCache
+
+
+def encode_texts(tokenizer, texts: List[str], max_seq_len: int) -> List[TextEncoding]:
+    """Tokenize texts in one batched call of a fast (Rust-backed) tokenizer."""
+    batch = tokenizer(
+        texts,
+        add_special_tokens=False,
+        return_offsets_mapping=True,
+        return_attention_mask=False
+    )
+    encodings = []
+    for i, text in enumerate(texts):
+        token_ids = batch["input_ids"][i]
+        window = token_ids[:max_seq_len - 2]
+
+        # Model-ready single window: [CLS] tokens [SEP] padding (as padding="max_length", truncation=True)
+        input_ids = torch.full((1, max_seq_len), tokenizer.pad_token_id, dtype=torch.long)
+        input_ids[0, 0] = tokenizer.cls_token_id
+        input_ids[0, 1:len(window) + 1] = torch.tensor(window, dtype=torch.long)
+        input_ids[0, len(window) + 1] = tokenizer.sep_token_id
+        attention_mask = torch.zeros((1, max_seq_len), dtype=torch.long)
+        attention_mask[0, :len(window) + 2] = 1
+
+        encodings.append(TextEncoding(
+            text=text,
+            token_ids=token_ids,
+            tokens=batch.tokens(i),
+            offsets=[tuple(span) for span in batch["offset_mapping"][i]],
+            input_ids=input_ids,
+            attention_mask=attention_mask
+        ))
+    return encodings
+
+
+def cached_encode_batch(
+    cache: LRUCache,
+    tokenizer,
+    texts: List[str],
+    max_seq_len: int,
+    normalize: Optional[Callable[[str], str]] = None
+) -> List[TextEncoding]:
+    """Encode texts, tokenizing only those missing from the cache (in one batch)."""
+    found = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        encoding = cache.get(text)
+        if encoding is None:
+            missing.append(text)
+        else:
+            found[text] = encoding
+
+    if missing:
+        inputs = [normalize(t) for t in missing] if normalize else missing
+        for text, encoding in zip(missing, encode_texts(tokenizer, inputs, max_seq_len)):
+            cache.put(text, encoding)
+            found[text] = encoding
+    return [found[text] for text in texts]
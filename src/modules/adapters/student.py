@@ -0,0 +1,145 @@
+# src/modules/adapters/student.py
+
+import os
+from typing import Optional
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from transformers import BertTokenizerFast
+from src.interfaces.adapter import BaseLanguageAdapter, TextOrEncoding
+from src.modules.adapters.chinese import ChineseAdapter
+from src.modules.adapters.english import EnglishAdapter
+from src.modules.adapters.windowing import content_states
+from src.utils.cache import LRUCache
+from src.registry import global_registry
+
+
+class CharCNNEncoder(nn.Module):
+    """Small convolutional encoder over (sub)character token IDs.
+
+    Maps [batch, seq_len] token IDs to [batch, seq_len, embed_dim] features;
+    distilled so that their mean over the sequence matches the teacher's.
+    """
+
+    def __init__(
+        self,
+        vocab_size: int,
+        embed_dim: int,
+        char_dim: int = 128,
+        hidden_dim: int = 256,
+        kernel_size: int = 3,
+        num_layers: int = 2,
+        pad_id: int = 0
+    ):
+        super().__init__()
+        self.embedding = nn.Embedding(vocab_size, char_dim, padding_idx=pad_id)
+        self.convs = nn.ModuleList([
+            nn.Conv1d(char_dim if i == 0 else hidden_dim, hidden_dim, kernel_size, padding=kernel_size // 2)
+            for i in range(num_layers)
+        ])
+        self.proj = nn.Linear(hidden_dim, embed_dim)
+
+    def forward(self, input_ids: torch.Tensor) -> torch.Tensor:
+        x = self.embedding(input_ids).transpose(1, 2)  # [batch, char_dim, seq_len]
+        for i, conv in enumerate(self.convs):
+            h = F.gelu(conv(x))
+            x = h if i == 0 else x + h                 # Residual after the first layer
+        return self.proj(x.transpose(1, 2))            # [batch, seq_len, embed_dim]
+
+
+class _StudentAdapterMixin:
+    """Replaces a BERT adapter's encoder with a distilled CharCNNEncoder.
+
+    Tokenization, detokenization and syntax parsing come from the teacher
+    adapter class (same tokenizer, same encodings); only `embed` changes.
+    Train the encoder with scripts/distill.py.
+    """
+
+    def _init_student(
+        self,
+        embed_dim: int,
+        model_name: str,
+        max_seq_len: int,
+        char_dim: int,
+        hidden_dim: int,
+        kernel_size: int,
+        num_layers: int,
+        weights_path: Optional[str],
+        encoding_cache_size: int
+    ) -> None:
+        BaseLanguageAdapter.__init__(self)
+        self.embed_dim = embed_dim
+        self.max_seq_len = max_seq_len
+        self.chunk_long_inputs = False  # Inputs are truncated to max_seq_len like the teacher's default
+
+        # Teacher tokenizer only (no BERT weights are loaded)
+        self.tokenizer = BertTokenizerFast.from_pretrained(model_name)
+        self.encoding_cache = LRUCache(max_size=encoding_cache_size)
+        self.encoder = CharCNNEncoder(
+            vocab_size=len(self.tokenizer),
+            embed_dim=embed_dim,
+            char_dim=char_dim,
+            hidden_dim=hidden_dim,
+            kernel_size=kernel_size,
+            num_layers=num_layers,
+            pad_id=self.tokenizer.pad_token_id
+        )
+        if weights_path is not None:
+            if not os.path.exists(weights_path):
+                raise ValueError(f"Student weights not found: {weights_path} (train them with scripts/distill.py)")
+            self.encoder.load_state_dict(torch.load(weights_path, map_location=torch.device("cpu")))
+
+    def forward(self, input_ids: torch.Tensor) -> torch.Tensor:
+        """Batched features for distillation: [batch, seq_len] → [batch, seq_len, embed_dim]."""
+        return self.encoder(input_ids)
+
+    def embed(self, text: TextOrEncoding) -> torch.Tensor:
+        """Generate student embeddings for text (mean-pooled, they approximate the teacher's)."""
+        encoding = self.encode(text)
+        with torch.no_grad():
+            hidden = self.encoder(encoding.input_ids)
+        return content_states(hidden, encoding.attention_mask)  # Shape: [1, real_tokens, embed_dim]
+
+
+@global_registry.register_adapter("chinese_student_adapter")
+class ChineseStudentAdapter(_StudentAdapterMixin, ChineseAdapter):
+    """Distilled CPU-friendly replacement for ChineseAdapter's BERT encoder."""
+
+    def __init__(
+        self,
+        embed_dim: int = 768,
+        model_name: str = "../../../models/bert-base-chinese",
+        max_seq_len: int = 128,
+        char_dim: int = 128,
+        hidden_dim: int = 256,
+        kernel_size: int = 3,
+        num_layers: int = 2,
+        weights_path: Optional[str] = None,
+        encoding_cache_size: int = 4096
+    ):
+        self._init_student(
+            embed_dim, model_name, max_seq_len, char_dim, hidden_dim,
+            kernel_size, num_layers, weights_path, encoding_cache_size
+        )
+
+
+@global_registry.register_adapter("english_student_adapter")
+class EnglishStudentAdapter(_StudentAdapterMixin, EnglishAdapter):
+    """Distilled CPU-friendly replacement for EnglishAdapter's BERT encoder."""
+
+    def __init__(
+        self,
+        embed_dim: int = 768,
+        model_name: str = "../../../models/bert-base-uncased",
+        max_seq_len: int = 128,
+        char_dim: int = 128,
+        hidden_dim: int = 256,
+        kernel_size: int = 3,
+        num_layers: int = 2,
+        weights_path: Optional[str] = None,
+        encoding_cache_size: int = 4096
+    ):
+        self._init_student(
+            embed_dim, model_name, max_seq_len, char_dim, hidden_dim,
+            kernel_size, num_layers, weights_path, encoding_cache_size
+        )
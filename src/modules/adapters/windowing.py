@@ -0,0 +1,111 @@
+# src/modules/adapters/windowing.py
+
+from typing import List, Optional
+import torch
+from src.modules.adapters.depth import encoder_states
+
+
+def window_starts(token_count: int, span: int, overlap: int, max_windows: int) -> List[int]:
+    """Start offsets of overlapping windows covering `token_count` tokens.
+    
+    Windows advance by `span - overlap` tokens. If that needs more than
+    `max_windows` windows, the budget wins: `max_windows` windows are spread
+    evenly over the input, so the whole text is still sampled at a bounded cost.
+    """
+    if token_count <= span:
+        return [0]
+    stride = max(span - overlap, 1)
+    needed = 1 + -(-(token_count - span) // stride)  # ceil division
+    count = max(1, min(needed, max_windows))
+    if count == 1:
+        return [0]
+    last_start = token_count - span
+    return [round(i * last_start / (count - 1)) for i in range(count)]
+
+
+def content_mask(attention_mask: torch.Tensor) -> torch.Tensor:
+    """Positions of real tokens: attended, minus [CLS] and the final [SEP].
+    
+    A row with no real tokens (empty text) keeps its [CLS] position, so
+    pooling is still defined.
+    
+    Returns:
+        Bool tensor shaped like `attention_mask` ([batch, seq_len])
+    """
+    mask = attention_mask.bool().clone()
+    rows = torch.arange(mask.size(0))
+    lengths = attention_mask.sum(dim=1)
+    mask[rows, lengths - 1] = False
+    mask[:, 0] = False
+    mask[rows[lengths <= 2], 0] = True
+    return mask
+
+
+def content_states(hidden: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+    """Token states of one sequence without special and padding positions.
+    
+    Returns:
+        Tensor of shape [1, real_tokens, embed_dim]
+    """
+    return hidden[:, content_mask(attention_mask)[0]]
+
+
+def pool_content(hidden: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+    """Mean over real tokens per row, the batched equivalent of mean-pooling `content_states`.
+    
+    Returns:
+        Tensor of shape [batch, embed_dim]
+    """
+    mask = content_mask(attention_mask).unsqueeze(-1).to(hidden.dtype)
+    return (hidden * mask).sum(dim=1) / mask.sum(dim=1)
+
+
+def encode_windows(
+    model: torch.nn.Module,
+    token_ids: List[int],
+    cls_id: int,
+    sep_id: int,
+    pad_id: int,
+    max_seq_len: int,
+    overlap: int,
+    max_windows: int,
+    pool_layers: Optional[List[int]] = None
+) -> torch.Tensor:
+    """Encode a long token sequence as overlapping windows in one batched pass.
+    
+    Each window is wrapped in [CLS]/[SEP] and padded to `max_seq_len`. Hidden
+    states of tokens that fall in several windows are averaged; special and
+    padding positions are masked out, so mean-pooling the result pools over
+    real tokens only. `pool_layers` selects the layers averaged, as in the adapters.
+    
+    Returns:
+        Tensor of shape [1, covered_tokens, embed_dim]
+    """
+    span = max_seq_len - 2
+    starts = window_starts(len(token_ids), span, overlap, max_windows)
+
+    input_ids = torch.full((len(starts), max_seq_len), pad_id, dtype=torch.long)
+    attention_mask = torch.zeros((len(starts), max_seq_len), dtype=torch.long)
+    positions, window_idx, offsets = [], [], []
+    for w, start in enumerate(starts):
+        window = token_ids[start:start + span]
+        input_ids[w, 0] = cls_id
+        input_ids[w, 1:len(window) + 1] = torch.tensor(window, dtype=torch.long)
+        input_ids[w, len(window) + 1] = sep_id
+        attention_mask[w, :len(window) + 2] = 1
+        positions.extend(range(start, start + len(window)))
+        window_idx.extend([w] * len(window))
+        offsets.extend(range(1, len(window) + 1))
+
+    with torch.no_grad():
+        hidden = encoder_states(model, input_ids, attention_mask, pool_layers)
+
+    # Scatter window token states back to document positions and average overlaps
+    positions = torch.tensor(positions, dtype=torch.long)
+    token_states = hidden[torch.tensor(window_idx), torch.tensor(offsets)]  # [n_window_tokens, embed_dim]
+    summed = torch.zeros(len(token_ids), hidden.size(-1), dtype=hidden.dtype)
+    summed.index_add_(0, positions, token_states)
+    counts = torch.bincount(positions, minlength=len(token_ids))
+    covered = counts > 0
+    merged = summed[covered] / counts[covered].unsqueeze(1).to(hidden.dtype)
+    return merged.unsqueeze(0)  # Shape: [1, covered_tokens, embed_dim]
@@ -14,6 +14,9 @@ class AttentionCoordinator(BaseCoordinator):
     prioritizing those most relevant to the input content.
     """
 
+    # Weights depend on the input embedding only; subnet features are never read
+    consumes = frozenset({"subnet_outputs", "input_embed"})
+
     def __init__(self, subnet_count: int, embed_dim: int, hidden_dim: int = 256):
         super().__init__(subnet_count, embed_dim)
         
@@ -1,6 +1,9 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 import os
+import unicodedata
+from src.modules.rules import RuleEngine
+from src.utils.compact_dict import CompactDict
 
 
 class DomainKnowledge:
@@ -8,40 +11,219 @@ class DomainKnowledge:
     
     Centralizes loading and accessing domain data (terms, rules, abbreviations)
     from external files, ensuring core logic remains domain-agnostic.
+    
+    Term and abbreviation tables compiled with scripts/compile_knowledge.py
+    (domain_<d>_<type>.bin) are memory-mapped instead of parsed from JSON.
     """
 
-    def __init__(self, domain: str, data_dir: str = "data"):
+    def __init__(
+        self,
+        domain: str,
+        data_dir: str = "data",
+        syntax_rules_path: Optional[str] = None,
+        ambiguity_rules_path: Optional[str] = None
+    ):
         self.domain = domain
         self.data_dir = data_dir
+        self.syntax_rules_path = syntax_rules_path
+        self.ambiguity_rules_path = ambiguity_rules_path
         
         # Load domain resources (all optional; fall back to empty)
         self.terms: Dict[str, str] = self._load_resource("terms")
         self.rules: List[Dict] = self._load_resource("rules")
         self.abbreviations: Dict[str, str] = self._load_resource("abbreviations")
+        
+        # Load template files shared across domains (optional)
+        syntax_config = self._load_rule_file(syntax_rules_path)
+        ambiguity_config = self._load_rule_file(ambiguity_rules_path)
+        self.syntax_templates: List[Dict] = syntax_config.get("syntax_templates", [])
+        self.pronoun_mappings: List[Dict] = self._as_list(ambiguity_config.get("pronoun_entity_mapping", []))
+        self.entity_names: Dict[str, str] = ambiguity_config.get("entity_names", {})
+        
+        # Longest keys bound the candidate lengths tried during segmentation
+        self._max_term_len = self._max_key_length(self.terms)
+        self._max_abbr_len = self._max_key_length(self.abbreviations)
+        
+        # Compile all rules once so each is applied in a single pass over the text
+        # (abbreviations are probed in their table instead, which may be large and memory-mapped)
+        self.rule_engine = self._compile_transformation_rules()
+        self.pronoun_engine = self._compile_pronoun_rules()
+
+    def resource_paths(self) -> List[str]:
+        """Files this knowledge base is built from (for change detection)."""
+        paths = [
+            os.path.join(self.data_dir, f"domain_{self.domain}_{resource_type}.{ext}")
+            for resource_type in ("terms", "rules", "abbreviations")
+            for ext in ("json", "bin")
+        ]
+        paths.extend(p for p in (self.syntax_rules_path, self.ambiguity_rules_path) if p)
+        return paths
+
+    def reloaded(self) -> "DomainKnowledge":
+        """Build a fresh instance from the current files, leaving this one untouched."""
+        return DomainKnowledge(
+            domain=self.domain,
+            data_dir=self.data_dir,
+            syntax_rules_path=self.syntax_rules_path,
+            ambiguity_rules_path=self.ambiguity_rules_path
+        )
+
+    def close(self) -> None:
+        """Unmap compiled tables (this instance must not be used afterwards)."""
+        for table in (self.terms, self.rules, self.abbreviations):
+            if isinstance(table, CompactDict):
+                table.close()
 
     def _load_resource(self, resource_type: str) -> Any:
         """Generic loader for domain resources (terms/rules/abbreviations)."""
         filename = f"domain_{self.domain}_{resource_type}.json"
         path = os.path.join(self.data_dir, filename)
         
+        # Prefer the compiled table unless the JSON source was edited after compiling
+        compiled_path = os.path.splitext(path)[0] + ".bin"
+        if os.path.exists(compiled_path) and (
+            not os.path.exists(path) or os.path.getmtime(compiled_path) >= os.path.getmtime(path)
+        ):
+            return CompactDict(compiled_path)
+        
         if not os.path.exists(path):
             return {} if resource_type in ["terms", "abbreviations"] else []
         
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    @staticmethod
+    def _load_rule_file(path: Optional[str]) -> Dict:
+        """Load a template rule file (syntax/ambiguity rules); missing → empty."""
+        if not path or not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _max_key_length(table: Any) -> int:
+        if isinstance(table, CompactDict):
+            return table.max_key_length
+        return max((len(k) for k in table), default=0)
+
+    @staticmethod
+    def _as_list(entries: Any) -> List[Dict]:
+        return [entries] if isinstance(entries, dict) else list(entries)
+
+    def _compile_transformation_rules(self) -> RuleEngine:
+        """Compile literal domain rules and syntax templates into one matcher."""
+        engine = RuleEngine()
+        for rule in self.rules:
+            engine.add_literal(rule["source_pattern"], rule["target_pattern"])
+        for template in self.syntax_templates:
+            engine.add_template(template["source_structure"], template["target_structure"])
+        return engine
+
+    def _compile_pronoun_rules(self) -> RuleEngine:
+        """Compile pronoun → entity mappings (e.g. "他" → "the {entity}")."""
+        engine = RuleEngine()
+        for mapping in self.pronoun_mappings:
+            entity_type = mapping.get("entity_type", "")
+            entity = self.entity_names.get(entity_type, entity_type)
+            engine.add_literal(mapping["source_pronoun"], mapping["target_pattern"].replace("{entity}", entity))
+        return engine
+
     def translate_term(self, term: str) -> str:
         """Translate a domain-specific term using loaded term mappings."""
         return self.terms.get(term, term)  # Fall back to original term
 
+    def segment(self, text: str) -> List[Tuple[str, Optional[str]]]:
+        """Greedy longest-match segmentation against the term and abbreviation index.
+        
+        Returns:
+            (source_segment, translation) pairs; translation is None for
+            characters not covered by any term (directly or via an abbreviation)
+        """
+        segments: List[Tuple[str, Optional[str]]] = []
+        max_len = max(self._max_term_len, self._max_abbr_len)
+        i = 0
+        while i < len(text):
+            match = None
+            for length in range(min(max_len, len(text) - i), 0, -1):
+                candidate = text[i:i + length]
+                target = self.terms.get(candidate)
+                if target is None and candidate in self.abbreviations:
+                    target = self.terms.get(self.abbreviations[candidate])
+                if target is not None:
+                    match = (candidate, target)
+                    break
+            if match is None:
+                match = (text[i], None)
+            segments.append(match)
+            i += len(match[0])
+        return segments
+
+    def dictionary_translation(self, text: str) -> Tuple[str, float]:
+        """Translate purely from the term index.
+        
+        Returns:
+            (translation, coverage) where coverage is the fraction of content
+            characters (excluding whitespace/punctuation) covered by terms
+        """
+        pieces: List[str] = []
+        covered = total = 0
+        uncovered = ""
+        for source, target in self.segment(text):
+            content = sum(1 for ch in source if not _is_separator(ch))
+            total += content
+            if target is not None:
+                covered += content
+                if uncovered.strip():
+                    pieces.append(uncovered.strip())
+                uncovered = ""
+                pieces.append(target)
+            elif _is_separator(source) and not source.isspace():
+                if uncovered.strip():
+                    pieces.append(uncovered.strip())
+                uncovered = ""
+                pieces.append(source)
+            else:
+                uncovered += source
+        if uncovered.strip():
+            pieces.append(uncovered.strip())
+        
+        translation = ""
+        for piece in pieces:
+            attach = not translation or _is_separator(piece[0])
+            translation += piece if attach else f" {piece}"
+        return translation, (covered / total if total else 0.0)
+
     def apply_transformation_rules(self, text: str) -> str:
-        """Apply domain-specific syntax transformation rules."""
-        for rule in self.rules:
-            text = text.replace(rule["source_pattern"], rule["target_pattern"])
-        return text
+        """Apply domain-specific syntax transformation rules and templates."""
+        return self.rule_engine.apply(text)
 
     def expand_abbreviations(self, text: str) -> str:
-        """Expand domain-specific abbreviations (e.g., "心梗" → "心肌梗死")."""
-        for abbr, full_form in self.abbreviations.items():
-            text = text.replace(abbr, full_form)
-        return text
\ No newline at end of file
+        """Expand domain-specific abbreviations (e.g., "心梗" → "心肌梗死").
+        
+        Scans left to right, probing the table for the longest abbreviation
+        starting at each position; expansions are not re-scanned.
+        """
+        if not self._max_abbr_len:
+            return text
+        pieces: List[str] = []
+        i = 0
+        while i < len(text):
+            for length in range(min(self._max_abbr_len, len(text) - i), 0, -1):
+                expansion = self.abbreviations.get(text[i:i + length])
+                if expansion is not None:
+                    pieces.append(expansion)
+                    i += length
+                    break
+            else:
+                pieces.append(text[i])
+                i += 1
+        return "".join(pieces)
+
+    def resolve_pronouns(self, text: str) -> str:
+        """Replace pronouns with domain entities using the ambiguity rules."""
+        return self.pronoun_engine.apply(text)
+
+
+def _is_separator(ch: str) -> bool:
+    """Whitespace or punctuation (not counted towards dictionary coverage)."""
+    return ch.isspace() or unicodedata.category(ch).startswith("P")
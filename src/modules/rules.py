@@ -0,0 +1,181 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Slots capture a clause fragment: anything up to the next clause delimiter
+DEFAULT_DELIMITERS = "，。；：！？,.;:!?\n"
+
+_SLOT = re.compile(r"\{(\w+)\}")
+
+
+class _CompiledRule:
+    """A single template rule split into anchor, optional leading slot and tail regex."""
+
+    def __init__(self, order: int, source: str, target: str, literal: bool, slot_pattern: str):
+        self.order = order
+        self.target = target
+        self.leading_slot: Optional[str] = None
+
+        parts = [source] if literal else _SLOT.split(source)
+        # _SLOT.split alternates literal text and slot names: [lit, slot, lit, slot, ...]
+        literals = parts[0::2]
+        slots = parts[1::2]
+        if not any(literals):
+            raise ValueError(f"Rule template needs literal text to anchor on: {source!r}")
+
+        if not literals[0]:
+            # Template starts with a slot ("{X}因为..."): capture it backwards from the anchor
+            self.leading_slot = slots[0]
+            literals, slots = literals[1:], slots[1:]
+        self.anchor = literals[0]
+
+        pattern, seen = [], set()
+        for i, literal in enumerate(literals):
+            pattern.append(re.escape(literal))
+            if i < len(slots):
+                name = slots[i]
+                pattern.append(f"(?P={name})" if name in seen else f"(?P<{name}>{slot_pattern})")
+                seen.add(name)
+        self.tail = re.compile("".join(pattern))
+        self.leading = re.compile(slot_pattern) if self.leading_slot else None
+
+    def render(self, slots: Dict[str, str]) -> str:
+        if not slots:
+            return self.target
+        return _SLOT.sub(lambda m: slots.get(m.group(1), m.group(0)), self.target)
+
+
+class RuleEngine:
+    """One-pass matcher for literal and slot-template rewrite rules.
+
+    Rules are compiled once into a trie-shaped regex over their literal anchors
+    plus a per-anchor rule index. `apply` scans the text a single time; rules are
+    only tried where their anchor occurs, so thousands of rules cost roughly the
+    same per sentence as a handful. At each position the longest match wins
+    (ties go to the rule added first), and rewritten text is not re-scanned.
+
+    Templates use `{NAME}` slots, e.g. "因为{X}" -> "because he has {X}".
+    """
+
+    def __init__(self, delimiters: str = DEFAULT_DELIMITERS):
+        self.delimiters = delimiters
+        self.slot_pattern = f"[^{re.escape(delimiters)}]+"
+        self._rules: List[_CompiledRule] = []
+        self._index: Dict[str, List[_CompiledRule]] = {}
+        self._anchor_lengths: List[int] = []
+        self._anchor_regex: Optional["re.Pattern"] = None
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, str], **kwargs) -> "RuleEngine":
+        """Build an engine of literal replacements (e.g. abbreviations)."""
+        engine = cls(**kwargs)
+        for source, target in mapping.items():
+            engine.add_literal(source, target)
+        return engine
+
+    def add_literal(self, source: str, target: str) -> None:
+        """Add a plain string replacement (braces are not treated as slots)."""
+        self._add(_CompiledRule(len(self._rules), source, target, True, self.slot_pattern))
+
+    def add_template(self, source: str, target: str) -> None:
+        """Add a slot template rule such as "因为{X}" -> "because he has {X}"."""
+        self._add(_CompiledRule(len(self._rules), source, target, False, self.slot_pattern))
+
+    def _add(self, rule: _CompiledRule) -> None:
+        self._rules.append(rule)
+        self._index.setdefault(rule.anchor, []).append(rule)
+        self._anchor_regex = None  # Recompile lazily on next apply
+
+    def compile(self) -> None:
+        """Build the combined anchor matcher (called automatically on first use)."""
+        self._anchor_lengths = sorted({len(a) for a in self._index}, reverse=True)
+        self._anchor_regex = re.compile(_trie_pattern(self._index.keys())) if self._index else None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def apply(self, text: str) -> str:
+        """Rewrite text with all rules in a single left-to-right pass."""
+        if not self._rules or not text:
+            return text
+        if self._anchor_regex is None:
+            self.compile()
+
+        out: List[str] = []
+        cursor = 0  # End of the text already emitted
+        pos = 0
+        while True:
+            hit = self._anchor_regex.search(text, pos)
+            if hit is None:
+                break
+            best = self._best_match(text, hit.start(), len(hit.group()), cursor)
+            if best is None:
+                pos = hit.start() + 1
+                continue
+            start, end, replacement = best
+            out.append(text[cursor:start])
+            out.append(replacement)
+            cursor = pos = end
+
+        out.append(text[cursor:])
+        return "".join(out)
+
+    def _best_match(self, text: str, at: int, longest: int, cursor: int) -> Optional[Tuple[int, int, str]]:
+        """Try the rules of every anchor starting at `at`; return the longest match."""
+        best, best_key = None, None
+        for length in self._anchor_lengths:
+            if length > longest:
+                continue
+            for rule in self._index.get(text[at:at + length], ()):
+                found = self._match_rule(rule, text, at, cursor)
+                if found is None:
+                    continue
+                start, end, slots = found
+                key = (end - start, -rule.order)
+                if best_key is None or key > best_key:
+                    best, best_key = (start, end, rule.render(slots)), key
+        return best
+
+    def _match_rule(self, rule: _CompiledRule, text: str, at: int, cursor: int) -> Optional[Tuple[int, int, Dict[str, str]]]:
+        tail = rule.tail.match(text, at)
+        if tail is None:
+            return None
+        slots = tail.groupdict()
+        start = at
+        if rule.leading_slot:
+            start = self._clause_start(text, at, cursor)
+            leading = text[start:at]
+            if start >= at or not rule.leading.fullmatch(leading):
+                return None
+            if slots.get(rule.leading_slot, leading) != leading:
+                return None  # Slot repeated later in the template must capture the same text
+            slots[rule.leading_slot] = leading
+        return start, tail.end(), slots
+
+    def _clause_start(self, text: str, at: int, cursor: int) -> int:
+        """Start of the clause ending at `at`, never before already-emitted text."""
+        start = at
+        while start > cursor and text[start - 1] not in self.delimiters:
+            start -= 1
+        return start
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching any of `words`, shaped as a trie so matching does not scale with word count.
+
+    Optional suffixes are greedy, so the longest word at a position matches.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch != ""]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
@@ -3,9 +3,16 @@
 from typing import List, Dict, Tuple, Optional
 import torch
 from src.interfaces.subnet import BaseSubnet
-from src.utils.memory import GenericMemoryBank
+from src.modules.rules import RuleEngine
+from src.utils.memory import GenericMemoryBank, SampleStore
+from src.utils.cache import LRUCache
+from src.utils.lazy import LazyFeature
+from src.utils.text import split_sentences
 from src.registry import global_registry
 
+# Used when no ambiguity rules are configured for the domain
+_DEFAULT_PRONOUNS = RuleEngine.from_mapping({"他": "the patient", "她": "the patient", "它": "the object"})
+
 
 @global_registry.register_subnet("context_subnet_v1")
 class ContextSubnet(BaseSubnet):
@@ -14,14 +21,44 @@ class ContextSubnet(BaseSubnet):
     Handles pronoun reference, elliptical structures, and cross-sentence dependencies.
     """
 
-    def __init__(self, *args, memory_path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        memory_path: Optional[str] = None,
+        sample_store: Optional[SampleStore] = None,
+        embed_cache_size: int = 256,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.memory = GenericMemoryBank(
-            max_size=1000,
-            save_path=memory_path or f"memory/context_{self.domain_knowledge.domain}.json"
-        )
+        if sample_store is not None:
+            # Shared, deduplicated store: this subnet only keeps sample IDs
+            self.memory = sample_store.view("context", max_size=1000)
+        else:
+            self.memory = GenericMemoryBank(
+                max_size=1000,
+                save_path=memory_path or f"memory/context_{self.domain_knowledge.domain}.json"
+            )
+        # Pooled sentence embeddings, reused when a sentence reappears as context
+        self.embed_cache = LRUCache(max_size=embed_cache_size)
+
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, LazyFeature]:
+        # 1-3. Combine context and input, expand abbreviations, resolve pronouns
+        resolved_text = self.transform(input_text, context)
+        
+        # 4. Feature vector (fused context + input embeddings), computed only if read
+        return resolved_text, LazyFeature(lambda: self._fused_embed(input_text, context))
+
+    def _fused_embed(self, input_text: str, context: str) -> torch.Tensor:
+        """Mean of the pooled context sentences and input.
+        
+        Context is pooled per sentence so sentences already seen (e.g. the
+        previous sentences of a document) come from the cache, not from BERT.
+        """
+        pooled = [self._pooled_embed(sentence) for sentence in split_sentences(context)]
+        pooled.append(self._pooled_embed(input_text))
+        return torch.mean(torch.cat(pooled, dim=0), dim=0, keepdim=True)  # Shape: [1, embed_dim]
 
-    def forward(self, input_text: str, context: str = "") -> Tuple[str, torch.Tensor]:
+    def transform(self, input_text: str, context: str = "") -> str:
         # 1. Combine context and input text
         full_context = f"{context}. {input_text}" if context else input_text
         
@@ -29,20 +66,29 @@ class ContextSubnet(BaseSubnet):
         expanded_context = self.domain_knowledge.expand_abbreviations(full_context)
         
         # 3. Simple pronoun resolution (extend with coreference models for production)
-        resolved_text = self._resolve_pronouns(expanded_context)
-        
-        # 4. Generate feature vector (fused context + input embeddings)
-        context_embed = self.src_adapter.embed(context) if context else torch.zeros(1, 1, self.src_adapter.embed_dim)
-        input_embed = self.src_adapter.embed(input_text)
-        combined_embed = torch.cat([context_embed, input_embed], dim=1)
-        feature_vector = torch.mean(combined_embed, dim=1)  # Shape: [1, embed_dim]
+        return self._resolve_pronouns(expanded_context)
 
-        return resolved_text, feature_vector
+    def _pooled_embed(self, text: str) -> torch.Tensor:
+        """Mean-pooled embedding of a single sentence (cached)."""
+        pooled = self.embed_cache.get(text)
+        if pooled is None:
+            pooled = torch.mean(self.src_adapter.embed(text), dim=1)  # Shape: [1, embed_dim]
+            self.embed_cache.put(text, pooled)
+        return pooled
 
     def _resolve_pronouns(self, text: str) -> str:
         """Resolve common pronouns using domain context (simplified example)."""
         # Replace Chinese pronouns with domain-appropriate nouns (e.g., "patient" in medical)
-        return text.replace("他", "the patient").replace("她", "the patient").replace("它", "the object")
+        if len(self.domain_knowledge.pronoun_engine):
+            return self.domain_knowledge.resolve_pronouns(text)
+        return _DEFAULT_PRONOUNS.apply(text)
+
+    def clear_caches(self) -> None:
+        """Drop cached sentence embeddings (stale after a weight swap)."""
+        self.embed_cache.clear()
+
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        return self.memory.lookup(input_text, context)
 
     def update_memory(self, samples: List[Dict]) -> None:
         """Update memory with context-aware examples."""
@@ -3,7 +3,8 @@
 from typing import List, Dict, Tuple, Optional
 import torch
 from src.interfaces.subnet import BaseSubnet
-from src.utils.memory import GenericMemoryBank
+from src.utils.lazy import LazyFeature
+from src.utils.memory import GenericMemoryBank, SampleStore
 from src.registry import global_registry
 
 
@@ -15,14 +16,36 @@ class DomainSubnet(BaseSubnet):
     to handle specialized language (e.g., medical jargon, legal terms).
     """
 
-    def __init__(self, *args, memory_path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        memory_path: Optional[str] = None,
+        sample_store: Optional[SampleStore] = None,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.memory = GenericMemoryBank(
-            max_size=1000,
-            save_path=memory_path or f"memory/domain_{self.domain_knowledge.domain}.json"
+        if sample_store is not None:
+            # Shared, deduplicated store: this subnet only keeps sample IDs
+            self.memory = sample_store.view("domain", max_size=1000)
+        else:
+            self.memory = GenericMemoryBank(
+                max_size=1000,
+                save_path=memory_path or f"memory/domain_{self.domain_knowledge.domain}.json"
+            )
+
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, LazyFeature]:
+        # 1-3. Expand abbreviations, apply domain rules, translate domain terms
+        translated_text = self.transform(input_text, context)
+        
+        # 4. Feature vector (domain-specific embeddings), computed only if read
+        expanded_text = self.domain_knowledge.expand_abbreviations(input_text)
+        feature_vector = LazyFeature(
+            lambda: torch.mean(self.src_adapter.embed(expanded_text), dim=1)  # Shape: [1, embed_dim]
         )
 
-    def forward(self, input_text: str, context: str = "") -> Tuple[str, torch.Tensor]:
+        return translated_text, feature_vector
+
+    def transform(self, input_text: str, context: str = "") -> str:
         # 1. Expand domain abbreviations (critical for domain understanding)
         expanded_text = self.domain_knowledge.expand_abbreviations(input_text)
         
@@ -30,13 +53,10 @@ class DomainSubnet(BaseSubnet):
         rule_transformed = self.domain_knowledge.apply_transformation_rules(expanded_text)
         
         # 3. Translate domain-specific terms
-        translated_text = self.domain_knowledge.translate_term(rule_transformed)
-        
-        # 4. Generate feature vector (domain-specific embeddings)
-        domain_embed = self.src_adapter.embed(expanded_text)  # Use expanded text for embedding
-        feature_vector = torch.mean(domain_embed, dim=1)  # Shape: [1, embed_dim]
+        return self.domain_knowledge.translate_term(rule_transformed)
 
-        return translated_text, feature_vector
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        return self.memory.lookup(input_text, context)
 
     def update_memory(self, samples: List[Dict]) -> None:
         """Update memory with domain-specific examples."""
@@ -3,7 +3,8 @@
 from typing import List, Dict, Tuple, Optional
 import torch
 from src.interfaces.subnet import BaseSubnet
-from src.utils.memory import GenericMemoryBank
+from src.utils.lazy import LazyFeature
+from src.utils.memory import GenericMemoryBank, SampleStore
 from src.registry import global_registry
 
 
@@ -14,14 +15,24 @@ class LexicalSubnet(BaseSubnet):
     Uses domain terms and historical memory to align source/target vocabulary.
     """
 
-    def __init__(self, *args, memory_path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        memory_path: Optional[str] = None,
+        sample_store: Optional[SampleStore] = None,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.memory = GenericMemoryBank(
-            max_size=1000,
-            save_path=memory_path or f"memory/lexical_{self.domain_knowledge.domain}.json"
-        )
+        if sample_store is not None:
+            # Shared, deduplicated store: this subnet only keeps sample IDs
+            self.memory = sample_store.view("lexical", max_size=1000)
+        else:
+            self.memory = GenericMemoryBank(
+                max_size=1000,
+                save_path=memory_path or f"memory/lexical_{self.domain_knowledge.domain}.json"
+            )
 
-    def forward(self, input_text: str, context: str = "") -> Tuple[str, torch.Tensor]:
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, LazyFeature]:
         # 1. Expand abbreviations first (critical for accurate term matching)
         expanded_text = self.domain_knowledge.expand_abbreviations(input_text)
         
@@ -30,12 +41,16 @@ class LexicalSubnet(BaseSubnet):
         translated_tokens = [self.domain_knowledge.translate_term(token) for token in src_tokens]
         translated_text = self.tgt_adapter.detokenize(translated_tokens)
         
-        # 3. Generate feature vector (mean of source embeddings)
-        src_embed = self.src_adapter.embed(expanded_text)
-        feature_vector = torch.mean(src_embed, dim=1)  # Shape: [1, embed_dim]
+        # 3. Feature vector (mean of source embeddings), computed only if read
+        feature_vector = LazyFeature(
+            lambda: torch.mean(self.src_adapter.embed(expanded_text), dim=1)  # Shape: [1, embed_dim]
+        )
 
         return translated_text, feature_vector
 
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        return self.memory.lookup(input_text, context)
+
     def update_memory(self, samples: List[Dict]) -> None:
         """Update memory with new lexical pairs for future reference."""
         self.memory.add_samples(samples)
\ No newline at end of file
@@ -0,0 +1,270 @@
+# src/modules/subnets/remote.py
+
+import os
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Union
+import torch
+from src.interfaces.subnet import BaseSubnet
+from src.utils.lazy import LazyFeature, materialize
+from src.registry import global_registry
+
+DEFAULT_AUTHKEY = "octopus-local"  # Override per shard (`authkey`) or via OCTOPUS_SHARD_AUTHKEY
+INLINE_BELOW = 32 * 1024           # Feature payloads smaller than this (bytes) are pickled inline
+SHM_DIR = "/dev/shm"               # Where POSIX shared-memory segments are visible as files
+
+
+def parse_address(address: str) -> Union[Tuple[str, int], str]:
+    """"host:port" → TCP address; anything else is a Unix socket path."""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def resolve_authkey(authkey: Optional[str] = None) -> bytes:
+    return (authkey or os.environ.get("OCTOPUS_SHARD_AUTHKEY") or DEFAULT_AUTHKEY).encode("utf-8")
+
+
+def pack_tensor(tensor: torch.Tensor, inline_below: int = INLINE_BELOW) -> Tuple:
+    """Message form of a tensor: inline if small, otherwise a shared-memory segment.
+
+    The segment is handed over to the receiver, which maps it without copying
+    and unlinks it (see `unpack_tensor`).
+    """
+    tensor = tensor.detach().contiguous()
+    nbytes = tensor.numel() * tensor.element_size()
+    if nbytes < inline_below:
+        return ("inline", tensor)
+    shm = SharedMemory(create=True, size=nbytes)
+    try:
+        torch.frombuffer(shm.buf, dtype=tensor.dtype, count=tensor.numel()).copy_(tensor.reshape(-1))
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    name = shm.name
+    shm.close()
+    resource_tracker.unregister(shm._name, "shared_memory")  # Ownership passes to the receiver
+    return ("shm", name, tuple(tensor.shape), str(tensor.dtype).replace("torch.", ""))
+
+
+def unpack_tensor(message: Tuple) -> torch.Tensor:
+    """Tensor from `pack_tensor` output; shared-memory payloads are mapped, not copied.
+
+    The mapping is owned by the tensor's storage, and the segment's name is
+    removed right away, so it is freed when the tensor is.
+    """
+    if message[0] == "inline":
+        return message[1]
+    _, name, shape, dtype = message
+    path = os.path.join(SHM_DIR, name.lstrip("/"))
+    count = 1
+    for dim in shape:
+        count *= dim
+    try:
+        return torch.from_file(path, shared=True, size=count, dtype=getattr(torch, dtype)).view(shape)
+    finally:
+        os.unlink(path)
+
+
+def discard_tensor(message: Tuple) -> None:
+    """Release a packed tensor that will never be unpacked."""
+    if message[0] == "shm":
+        shm = SharedMemory(name=message[1])
+        shm.close()
+        shm.unlink()
+
+
+@global_registry.register_subnet("remote_subnet_v1")
+class RemoteSubnet(BaseSubnet):
+    """Proxy for a subnet running in a subnet server process (scripts/subnet_server.py).
+
+    Calls are forwarded over a local `multiprocessing.connection` socket, one
+    round trip per batch. Features stay lazy: they are fetched in one batched
+    call the first time any feature of a batch is read, and large feature
+    tensors arrive through shared memory without being copied.
+    """
+
+    def __init__(
+        self,
+        *args,
+        address: str,
+        subnet: str,
+        authkey: Optional[str] = None,
+        timeout: float = 30.0,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.address = address      # "host:port" or Unix socket path of the shard
+        self.remote_name = subnet   # Subnet key on the server ("<index>:<registry name>")
+        self.timeout = timeout      # Seconds to wait for a reply
+        self._authkey = resolve_authkey(authkey)
+        self._conn: Optional[Connection] = None
+        self._lock = threading.Lock()  # One request/reply exchange at a time per connection
+
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, LazyFeature]:
+        return self.forward_batch([(input_text, context)])[0]
+
+    def forward_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[str, LazyFeature]]:
+        outputs = self._call("forward", items=items)["outputs"]
+        batch: Dict[str, torch.Tensor] = {}
+
+        def row(i: int) -> torch.Tensor:
+            if "features" not in batch:
+                batch["features"] = unpack_tensor(self._call("features", items=items)["features"])
+            return batch["features"][i:i + 1]  # Shape: [1, embed_dim]
+
+        return [(output, LazyFeature(lambda i=i: row(i))) for i, output in enumerate(outputs)]
+
+    def transform(self, input_text: str, context: str = "") -> Optional[str]:
+        return self._call("transform", items=[(input_text, context)])["outputs"][0]
+
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        return self._call("recall", items=[(input_text, context)])["outputs"][0]
+
+    def update_memory(self, samples: List[Dict]) -> None:
+        self._call("update_memory", samples=samples)
+
+    def clear_caches(self) -> None:
+        self._call("clear_caches")
+
+    def load_state_dict(self, state_dict, strict: bool = True, assign: bool = False):
+        """Load only the entries a proxy holds (the shared adapters).
+
+        The remote subnet's own weights are loaded by its server
+        (`scripts/subnet_server.py --checkpoint`).
+        """
+        own = self.state_dict().keys()
+        return super().load_state_dict({k: v for k, v in state_dict.items() if k in own}, strict=strict, assign=assign)
+
+    def close(self) -> None:
+        """Drop the connection (reopened on the next call)."""
+        with self._lock:
+            self._disconnect()
+
+    def _call(self, op: str, **payload: Any) -> Dict[str, Any]:
+        request = {"op": op, "subnet": self.remote_name, **payload}
+        with self._lock:
+            for attempt in range(2):  # Reconnect once if the server restarted
+                try:
+                    if self._conn is None:
+                        self._conn = Client(parse_address(self.address), authkey=self._authkey)
+                    self._conn.send(request)
+                    if not self._conn.poll(self.timeout):
+                        self._disconnect()
+                        raise TimeoutError(f"Subnet server {self.address} did not reply within {self.timeout}s")
+                    reply = self._conn.recv()
+                    break
+                except (EOFError, ConnectionError, OSError):
+                    self._disconnect()
+                    if attempt == 1:
+                        raise
+        if "error" in reply:
+            raise RuntimeError(f"Subnet server {self.address} ({self.remote_name}): {reply['error']}")
+        return reply
+
+    def _disconnect(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+
+class SubnetServer:
+    """Serves local subnets to RemoteSubnet proxies in other processes.
+
+    Each client connection is handled on its own thread; requests name the
+    subnet by its key ("<index>:<registry name>", the subnet's position in the
+    config's `subnets` list).
+    """
+
+    def __init__(
+        self,
+        subnets: Dict[str, BaseSubnet],
+        address: str,
+        authkey: Optional[str] = None,
+        inline_below: int = INLINE_BELOW
+    ):
+        self.subnets = subnets
+        self.address = address
+        self.inline_below = inline_below
+        self._authkey = resolve_authkey(authkey)
+        self._listener = Listener(parse_address(address), authkey=self._authkey)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def serve_forever(self) -> None:
+        """Accept connections until `stop` is called."""
+        while not self._stop.is_set():
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                if self._stop.is_set():
+                    break
+                continue  # Failed handshake (e.g. wrong authkey); keep serving
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def start(self) -> None:
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="octopus-subnet-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        try:
+            Client(self._listener.address, authkey=self._authkey).close()  # Wake a blocked accept()
+        except OSError:
+            pass
+        self._listener.close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            while not self._stop.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    reply = self._dispatch(request)
+                except Exception as e:
+                    reply = {"error": f"{type(e).__name__}: {e}"}
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError):
+                    if "features" in reply:
+                        discard_tensor(reply["features"])
+                    return
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request["op"]
+        if op == "ping":
+            return {"subnets": list(self.subnets)}
+        if request.get("subnet") not in self.subnets:
+            raise ValueError(f"Unknown subnet '{request.get('subnet')}'. Available: {list(self.subnets)}")
+        subnet = self.subnets[request["subnet"]]
+        items = request.get("items", [])
+
+        if op == "forward":
+            return {"outputs": [output for output, _ in subnet.forward_batch(items)]}
+        if op == "features":
+            features = [materialize(feature) for _, feature in subnet.forward_batch(items)]
+            return {"features": pack_tensor(torch.cat(features, dim=0), self.inline_below)}
+        if op == "transform":
+            return {"outputs": [subnet.transform(text, context) for text, context in items]}
+        if op == "recall":
+            return {"outputs": [subnet.recall(text, context) for text, context in items]}
+        if op == "update_memory":
+            subnet.update_memory(request["samples"])
+            return {"ok": True}
+        if op == "clear_caches":
+            subnet.clear_caches()
+            return {"ok": True}
+        raise ValueError(f"Unknown operation '{op}'")
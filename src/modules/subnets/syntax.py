@@ -3,7 +3,8 @@
 from typing import List, Dict, Tuple, Optional
 import torch
 from src.interfaces.subnet import BaseSubnet
-from src.utils.memory import GenericMemoryBank
+from src.utils.lazy import LazyFeature
+from src.utils.memory import GenericMemoryBank, SampleStore
 from src.registry import global_registry
 
 
@@ -15,14 +16,24 @@ class SyntaxSubnet(BaseSubnet):
     into target language conventions.
     """
 
-    def __init__(self, *args, memory_path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        memory_path: Optional[str] = None,
+        sample_store: Optional[SampleStore] = None,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.memory = GenericMemoryBank(
-            max_size=1000,
-            save_path=memory_path or f"memory/syntax_{self.domain_knowledge.domain}.json"
-        )
+        if sample_store is not None:
+            # Shared, deduplicated store: this subnet only keeps sample IDs
+            self.memory = sample_store.view("syntax", max_size=1000)
+        else:
+            self.memory = GenericMemoryBank(
+                max_size=1000,
+                save_path=memory_path or f"memory/syntax_{self.domain_knowledge.domain}.json"
+            )
 
-    def forward(self, input_text: str, context: str = "") -> Tuple[str, torch.Tensor]:
+    def forward(self, input_text: str, context: str = "") -> Tuple[str, LazyFeature]:
         # 1. Expand abbreviations and parse syntax
         expanded_text = self.domain_knowledge.expand_abbreviations(input_text)
         syntax = self.src_adapter.parse_syntax(expanded_text)
@@ -30,12 +41,20 @@ class SyntaxSubnet(BaseSubnet):
         # 2. Apply domain-specific syntax rules
         transformed_text = self.domain_knowledge.apply_transformation_rules(expanded_text)
         
-        # 3. Generate feature vector (mean of transformed text embeddings)
-        tgt_embed = self.tgt_adapter.embed(transformed_text)
-        feature_vector = torch.mean(tgt_embed, dim=1)  # Shape: [1, embed_dim]
+        # 3. Feature vector (mean of transformed text embeddings), computed only if read
+        feature_vector = LazyFeature(
+            lambda: torch.mean(self.tgt_adapter.embed(transformed_text), dim=1)  # Shape: [1, embed_dim]
+        )
 
         return transformed_text, feature_vector
 
+    def transform(self, input_text: str, context: str = "") -> str:
+        expanded_text = self.domain_knowledge.expand_abbreviations(input_text)
+        return self.domain_knowledge.apply_transformation_rules(expanded_text)
+
+    def recall(self, input_text: str, context: str = "") -> Optional[str]:
+        return self.memory.lookup(input_text, context)
+
     def update_memory(self, samples: List[Dict]) -> None:
         """Update memory with syntax transformation examples."""
         self.memory.add_samples(samples)
\ No newline at end of file
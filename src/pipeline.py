@@ -0,0 +1,196 @@
+# src/pipeline.py
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+_STOP = object()  # Sentinel telling a stage worker to exit
+
+
+class Stage:
+    """One step of a StagedPipeline: a function applied to each item by `workers` threads."""
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1):
+        if workers < 1:
+            raise ValueError(f"Stage '{name}' needs at least one worker")
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+
+
+class _StageMetrics:
+    """Time accounting for one stage's workers (seconds, summed over workers)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = 0
+        self.busy = 0.0     # Running the stage function
+        self.starved = 0.0  # Waiting for input
+        self.blocked = 0.0  # Waiting for room in the next stage's queue
+
+    def add(self, busy: float = 0.0, starved: float = 0.0, blocked: float = 0.0, items: int = 0) -> None:
+        with self.lock:
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+            self.items += items
+
+
+class StagedPipeline:
+    """Runs items through a chain of stages, each on its own worker threads.
+
+    Stages are connected by bounded queues, so item N+1 can be in an early
+    stage while item N is in a later one, and a slow stage applies
+    backpressure instead of letting work pile up in memory. Threads suit
+    stages that release the GIL (tokenizers, torch) overlapping with
+    Python-bound ones; add workers to the stage `stats()` shows as the
+    bottleneck (highest utilization), and note that a stage that is mostly
+    `blocked` is waiting on the stage after it.
+
+    Use `submit` for request/response workloads (one Future per item) or
+    `map` for bulk workloads (results in input order).
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 2):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size  # Items waiting in front of each stage
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._metrics = [_StageMetrics() for _ in stages]
+        self._threads: List[threading.Thread] = []
+        self._exited = [0] * len(stages)  # Workers finished, per stage
+        self._exit_lock = threading.Lock()
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+
+    @property
+    def capacity(self) -> int:
+        """Items the pipeline can hold at once (queued plus in progress)."""
+        return sum(self.queue_size + stage.workers for stage in self.stages)
+
+    def start(self) -> "StagedPipeline":
+        """Start the stage workers (done automatically by submit/map)."""
+        if self._started is not None:
+            return self
+        self._started = time.monotonic()
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(index,),
+                    name=f"octopus-pipeline-{stage.name}-{n}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item; blocks while the first stage's queue is full.
+
+        Returns:
+            Future resolving to the last stage's output (or the first
+            exception raised by any stage for this item)
+        """
+        if self._stopped is not None:
+            raise RuntimeError("Pipeline is closed")
+        self.start()
+        future: Future = Future()
+        self._queues[0].put((future, item))
+        return future
+
+    def map(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Stream items through the pipeline, yielding outputs in input order."""
+        in_flight: deque = deque()
+        for item in items:
+            in_flight.append(self.submit(item))
+            if len(in_flight) >= self.capacity:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def close(self) -> None:
+        """Finish queued items, then stop the workers."""
+        if self._started is None or self._stopped is not None:
+            return
+        for _ in range(self.stages[0].workers):
+            self._queues[0].put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._stopped = time.monotonic()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage metrics for tuning worker counts.
+
+        Returns:
+            {stage name: {"workers", "items", "busy", "starved", "blocked",
+             "utilization", "queued"}} where busy/starved/blocked are seconds
+            summed over workers and utilization is busy time over the workers'
+            available time since start
+        """
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._stopped or time.monotonic()) - self._started
+        report = {}
+        for stage, metrics, stage_queue in zip(self.stages, self._metrics, self._queues):
+            with metrics.lock:
+                report[stage.name] = {
+                    "workers": stage.workers,
+                    "items": metrics.items,
+                    "busy": metrics.busy,
+                    "starved": metrics.starved,
+                    "blocked": metrics.blocked,
+                    "utilization": metrics.busy / (stage.workers * elapsed) if elapsed > 0 else 0.0,
+                    "queued": stage_queue.qsize()
+                }
+        return report
+
+    def __enter__(self) -> "StagedPipeline":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _work(self, index: int) -> None:
+        stage, metrics = self.stages[index], self._metrics[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self.stages) else None
+        while True:
+            tick = time.perf_counter()
+            entry = inbox.get()
+            waited = time.perf_counter() - tick
+            if entry is _STOP:
+                metrics.add(starved=waited)
+                self._exit(index)
+                return
+
+            future, value = entry
+            tick = time.perf_counter()
+            try:
+                value = stage.fn(value)
+            except BaseException as e:  # Fails this item only; later stages never see it
+                future.set_exception(e)
+                metrics.add(busy=time.perf_counter() - tick, starved=waited, items=1)
+                continue
+            busy = time.perf_counter() - tick
+
+            tick = time.perf_counter()
+            if outbox is not None:
+                outbox.put((future, value))
+            else:
+                future.set_result(value)
+            metrics.add(busy=busy, starved=waited, blocked=time.perf_counter() - tick, items=1)
+
+    def _exit(self, index: int) -> None:
+        """Record a worker exit; the stage's last worker stops the next stage."""
+        with self._exit_lock:
+            self._exited[index] += 1
+            last = self._exited[index] == self.stages[index].workers
+        if last and index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                self._queues[index + 1].put(_STOP)
@@ -0,0 +1,135 @@
+# src/reload.py
+
+import copy
+import logging
+import os
+import signal
+import threading
+from typing import Dict, List, Optional
+import torch
+from src.translator import OctopusTranslator
+
+logger = logging.getLogger(__name__)
+
+
+class HotReloader:
+    """Zero-downtime reload of domain data and checkpoints for a live translator.
+
+    Watches the domain knowledge files and the checkpoint (or waits to be
+    signalled), rebuilds DomainKnowledge indexes and coordinator weights off the
+    request path, then swaps them into the translator atomically between
+    requests. Adapters are kept (no BERT reload), and caches tied to the old
+    state are invalidated through the translator's version stamp.
+    """
+
+    def __init__(
+        self,
+        translator: OctopusTranslator,
+        checkpoint_path: Optional[str] = None,
+        poll_interval: float = 5.0
+    ):
+        if translator.domain_knowledge is None:
+            raise ValueError("Hot reload needs a translator built with domain_knowledge.")
+        self.translator = translator
+        self.checkpoint_path = checkpoint_path
+        self.poll_interval = poll_interval    # Seconds between file checks
+
+        self._mtimes = self._snapshot_mtimes()
+        self._reload_requested = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()         # One rebuild at a time
+        self.last_error: Optional[str] = None  # Latest failed background reload (None once one succeeds)
+
+    def watched_paths(self) -> List[str]:
+        """Files whose changes trigger a reload."""
+        paths = self.translator.domain_knowledge.resource_paths()
+        if self.checkpoint_path:
+            paths.append(self.checkpoint_path)
+        return paths
+
+    def changed_paths(self) -> List[str]:
+        """Watched files modified (or created/removed) since the last reload."""
+        return self._diff(self._snapshot_mtimes())
+
+    def request_reload(self) -> None:
+        """Ask the background thread to reload on its next wakeup (signal-safe)."""
+        self._reload_requested.set()
+
+    def install_signal_handler(self, signum: int = signal.SIGHUP) -> None:
+        """Reload when the process receives `signum` (main thread only)."""
+        signal.signal(signum, lambda *_: self.request_reload())
+
+    def reload(self, force: bool = False) -> int:
+        """Rebuild changed state and swap it in; returns the translator version.
+
+        Args:
+            force: Rebuild domain data and reload the checkpoint even if unchanged
+        """
+        with self._lock:
+            # One snapshot: a file written after it is picked up by the next reload
+            current = self._snapshot_mtimes()
+            changed = set(self._diff(current))
+            knowledge = self.translator.domain_knowledge
+
+            # Build everything before taking the swap gate: requests keep running meanwhile
+            new_knowledge = None
+            if force or changed & set(knowledge.resource_paths()):
+                new_knowledge = knowledge.reloaded()
+
+            checkpoint, coordinator = None, None
+            if self.checkpoint_path and os.path.exists(self.checkpoint_path) and (
+                force or self.checkpoint_path in changed
+            ):
+                checkpoint = torch.load(self.checkpoint_path, map_location=torch.device("cpu"))
+                coordinator = copy.deepcopy(self.translator.coordinator)
+                coordinator.load_state_dict(checkpoint["coordinator"])
+                coordinator.train(self.translator.coordinator.training)
+
+            self._mtimes = current
+            if new_knowledge is None and checkpoint is None:
+                return self.translator.version
+            return self.translator.swap_state(
+                domain_knowledge=new_knowledge,
+                checkpoint=checkpoint,
+                coordinator=coordinator
+            )
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="octopus-hot-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        self._reload_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            signalled = self._reload_requested.wait(self.poll_interval)
+            self._reload_requested.clear()
+            if self._stop.is_set():
+                break
+            if signalled or self.changed_paths():
+                try:
+                    self.reload(force=signalled)
+                    self.last_error = None
+                except Exception as e:  # Keep serving the old state on a bad update
+                    self.last_error = f"{type(e).__name__}: {e}"
+                    logger.exception("Hot reload failed, keeping version %d", self.translator.version)
+
+    def _snapshot_mtimes(self) -> Dict[str, Optional[float]]:
+        return {
+            path: os.path.getmtime(path) if os.path.exists(path) else None
+            for path in self.watched_paths()
+        }
+
+    def _diff(self, current: Dict[str, Optional[float]]) -> List[str]:
+        return [p for p in current if current[p] != self._mtimes.get(p)]
@@ -0,0 +1,267 @@
+# src/router.py
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+import torch
+import yaml
+from src.factory import OctopusTranslatorFactory
+from src.interfaces.adapter import BaseLanguageAdapter
+from src.modules.knowledge import DomainKnowledge
+from src.translator import OctopusTranslator
+from src.utils.compact_dict import CompactDict
+
+
+class TranslatorRouter:
+    """Serves several domain translators from one process within a memory budget.
+
+    Each domain key maps to a config (and optional checkpoint). Translators are
+    built on first request and kept in an LRU; when the estimated resident size
+    exceeds `memory_budget` or a domain stays idle longer than `idle_timeout`,
+    the least recently used domain is evicted. Adapters are frozen and shared
+    across domains through the factory's adapter cache, so eviction only drops
+    domain-specific state (domain knowledge, subnet memories, coordinator) and
+    reloading a domain never reloads BERT.
+    """
+
+    def __init__(
+        self,
+        domains: Dict[str, Any],
+        memory_budget: Optional[int] = None,
+        idle_timeout: Optional[float] = None
+    ):
+        # Domain key → {"config": path, "checkpoint": optional .pth path}
+        self.domains = {
+            key: spec if isinstance(spec, dict) else {"config": spec}
+            for key, spec in domains.items()
+        }
+        self.memory_budget = memory_budget    # Bytes of domain-specific state (None: unbounded)
+        self.idle_timeout = idle_timeout      # Seconds without requests before eviction (None: never)
+
+        self.adapter_cache: Dict[Tuple[str, str], BaseLanguageAdapter] = {}
+        self._resident: "OrderedDict[str, OctopusTranslator]" = OrderedDict()  # LRU order
+        self._stats = {key: self._empty_stats() for key in self.domains}
+        self._lock = threading.Lock()                      # Guards _resident and _stats
+        self._load_locks = {key: threading.Lock() for key in self.domains}  # One build per domain
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, config_path: str) -> "TranslatorRouter":
+        """Build from a router YAML (`domains`, `memory_budget_mb`, `idle_timeout`)."""
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        if not config.get("domains"):
+            raise ValueError(f"Router config has no domains: {config_path}")
+        budget_mb = config.get("memory_budget_mb")
+        return cls(
+            domains=config["domains"],
+            memory_budget=int(budget_mb * 1024 * 1024) if budget_mb is not None else None,
+            idle_timeout=config.get("idle_timeout")
+        )
+
+    def get(self, domain: str) -> OctopusTranslator:
+        """Return the domain's translator, loading it (and evicting others) if needed."""
+        if domain not in self.domains:
+            raise ValueError(f"Unknown domain '{domain}'. Available: {list(self.domains.keys())}")
+        self.evict_idle()
+
+        translator = self._touch(domain)
+        if translator is not None:
+            return translator
+        with self._load_locks[domain]:
+            translator = self._touch(domain)  # Loaded by a concurrent request meanwhile
+            if translator is None:
+                translator = self._load(domain)
+        self._enforce_budget(keep=domain)
+        return translator
+
+    def translate(self, domain: str, text: str, context: str = "", deadline: Optional[float] = None) -> str:
+        """Translate with the domain's translator."""
+        return self.get(domain).translate(text, context, deadline)
+
+    def translate_with_metadata(
+        self,
+        domain: str,
+        text: str,
+        context: str = "",
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Translate with the domain's translator and report how (adds "domain")."""
+        result = self.get(domain).translate_with_metadata(text, context, deadline)
+        result["domain"] = domain
+        return result
+
+    def evict(self, domain: str) -> bool:
+        """Drop a resident domain; returns False if it was not resident."""
+        with self._lock:
+            translator = self._resident.pop(domain, None)
+            if translator is None:
+                return False
+            stats = self._stats[domain]
+        start = time.monotonic()
+        if translator.recorder is not None:
+            translator.recorder.close()
+        del translator
+        now = time.monotonic()
+        with self._lock:
+            stats["evictions"] += 1
+            stats["last_evict_seconds"] = now - start
+            stats["resident_seconds"] += now - stats["loaded_at"]
+            stats["loaded_at"] = None
+            stats["bytes"] = 0
+        return True
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Evict domains idle for longer than `idle_timeout`; returns how many."""
+        if self.idle_timeout is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [key for key in self._resident if now - self._stats[key]["last_used"] > self.idle_timeout]
+        return sum(self.evict(key) for key in idle)
+
+    def resident_bytes(self) -> int:
+        """Estimated domain-specific bytes of all resident domains."""
+        with self._lock:
+            return sum(self._stats[key]["bytes"] for key in self._resident)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-domain residency and load/evict latency, plus shared adapter size.
+
+        Returns:
+            {"resident": [domains, LRU first], "resident_bytes": int,
+             "shared_adapter_bytes": int, "domains": {domain: {...}}}
+        """
+        now = time.monotonic()
+        with self._lock:
+            domains = {}
+            for key, stats in self._stats.items():
+                entry = {k: v for k, v in stats.items() if k not in ("loaded_at", "last_used")}
+                entry["resident"] = key in self._resident
+                if entry["resident"]:
+                    entry["resident_seconds"] += now - stats["loaded_at"]
+                    entry["idle_seconds"] = now - stats["last_used"]
+                domains[key] = entry
+            resident = list(self._resident)
+            adapters = list(self.adapter_cache.values())
+        return {
+            "resident": resident,
+            "resident_bytes": sum(domains[key]["bytes"] for key in resident),
+            "shared_adapter_bytes": sum(_tensor_bytes(adapter) for adapter in adapters),
+            "domains": domains
+        }
+
+    def start(self, interval: float = 30.0) -> None:
+        """Sweep idle domains every `interval` seconds in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="octopus-router-evict", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the idle sweeper."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.evict_idle()
+
+    def _touch(self, domain: str) -> Optional[OctopusTranslator]:
+        with self._lock:
+            translator = self._resident.get(domain)
+            if translator is not None:
+                self._resident.move_to_end(domain)
+                self._stats[domain]["last_used"] = time.monotonic()
+                self._stats[domain]["requests"] += 1
+            return translator
+
+    def _load(self, domain: str) -> OctopusTranslator:
+        spec = self.domains[domain]
+        start = time.monotonic()
+        translator = OctopusTranslatorFactory.create_from_config(spec["config"], adapter_cache=self.adapter_cache)
+        if spec.get("checkpoint"):
+            translator.load(spec["checkpoint"])
+        translator.eval()
+        size = _domain_bytes(translator, self._shared_tensor_ids())
+        now = time.monotonic()
+
+        with self._lock:
+            stats = self._stats[domain]
+            stats["loads"] += 1
+            stats["last_load_seconds"] = now - start
+            stats["bytes"] = size
+            stats["loaded_at"] = stats["last_used"] = now
+            stats["requests"] += 1
+            self._resident[domain] = translator
+        return translator
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Evict LRU domains (never `keep`) until within the memory budget."""
+        if self.memory_budget is None:
+            return
+        while self.resident_bytes() > self.memory_budget:
+            with self._lock:
+                victim = next((key for key in self._resident if key != keep), None)
+            if victim is None:
+                break  # Only the requested domain is left; it must stay resident
+            self.evict(victim)
+
+    def _shared_tensor_ids(self) -> Set[int]:
+        with self._lock:
+            adapters = list(self.adapter_cache.values())
+        return {id(t) for adapter in adapters for t in _tensors(adapter)}
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "loads": 0, "evictions": 0, "requests": 0, "bytes": 0,
+            "last_load_seconds": None, "last_evict_seconds": None,
+            "resident_seconds": 0.0, "loaded_at": None, "last_used": None
+        }
+
+
+def _tensors(module: torch.nn.Module):
+    yield from module.parameters()
+    yield from module.buffers()
+
+
+def _tensor_bytes(module: torch.nn.Module) -> int:
+    return sum(t.numel() * t.element_size() for t in _tensors(module))
+
+
+def _domain_bytes(translator: OctopusTranslator, shared: Set[int]) -> int:
+    """Estimated size of a translator's state, excluding shared adapter tensors."""
+    seen = set(shared)
+    size = 0
+    for module in [*translator.subnets, translator.coordinator]:
+        for tensor in _tensors(module):
+            if id(tensor) not in seen:
+                seen.add(id(tensor))
+                size += tensor.numel() * tensor.element_size()
+    if translator.domain_knowledge is not None:
+        size += _knowledge_bytes(translator.domain_knowledge)
+    return size
+
+
+def _knowledge_bytes(knowledge: DomainKnowledge) -> int:
+    """Rough in-memory size of the domain tables (mapped files count at file size)."""
+    size = 0
+    for table in (knowledge.terms, knowledge.rules, knowledge.abbreviations):
+        if isinstance(table, CompactDict):
+            size += os.path.getsize(table.path)
+        elif isinstance(table, dict):
+            size += sys.getsizeof(table) + sum(
+                sys.getsizeof(k) + sys.getsizeof(v) for k, v in table.items()
+            )
+    return size
@@ -1,10 +1,32 @@
 # src/translator.py
 
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import deque, Counter
+from typing import List, Dict, Optional, Iterator, Any, Tuple
 import torch
+from src.degradation import DegradationPolicy, FULL, MEMORY, RULES, DICTIONARY
 from src.interfaces.adapter import BaseLanguageAdapter
 from src.interfaces.subnet import BaseSubnet
 from src.interfaces.coordinator import BaseCoordinator
+from src.modules.knowledge import DomainKnowledge
+from src.pipeline import Stage, StagedPipeline
+from src.utils.capture import TrafficRecorder
+from src.utils.lazy import materialize
+from src.utils.memory import GenericMemoryBank, SampleStore
+from src.utils.sync import ReadWriteGate
+from src.utils.text import split_sentences
+
+# Readiness of the neural modules (see OctopusTranslatorFactory.create_progressive)
+LOADING = "loading"  # Adapters/coordinator still loading; dictionary, memory and rule paths only
+READY = "ready"      # Full pipeline available
+FAILED = "failed"    # Loading failed; string-only paths keep serving
+
+# Stages of the batch pipeline (see OctopusTranslator.pipeline), in order
+PIPELINE_STAGES = ("tokenize", "rules", "encode", "coordinate")
+
+# State dict prefixes of the adapters a subnet shares with the translator
+_ADAPTER_PREFIXES = ("src_adapter.", "tgt_adapter.")
 
 
 class OctopusTranslator:
@@ -15,39 +37,509 @@ class OctopusTranslator:
 
     def __init__(
         self,
-        src_adapter: BaseLanguageAdapter,
-        tgt_adapter: BaseLanguageAdapter,
+        src_adapter: Optional[BaseLanguageAdapter],
+        tgt_adapter: Optional[BaseLanguageAdapter],
         subnets: List[BaseSubnet],
-        coordinator: BaseCoordinator
+        coordinator: Optional[BaseCoordinator],
+        domain_knowledge: Optional[DomainKnowledge] = None,
+        degradation: Optional[DegradationPolicy] = None,
+        dictionary_threshold: Optional[float] = None,
+        sample_store: Optional[SampleStore] = None,
+        recorder: Optional[TrafficRecorder] = None,
+        pipeline_options: Optional[Dict[str, Any]] = None
     ):
         self.src_adapter = src_adapter
         self.tgt_adapter = tgt_adapter
         self.subnets = subnets
         self.coordinator = coordinator
+        self.domain_knowledge = domain_knowledge
+        self.degradation = degradation or DegradationPolicy()
+        self.sample_store = sample_store  # Shared memory store behind subnet views (optional)
+        
+        # Dictionary fast path: answer from domain terms alone when they cover
+        # at least this fraction of the input (None disables the pre-check)
+        self.dictionary_threshold = dictionary_threshold
+        
+        # Traffic capture for offline replay (None disables recording)
+        self.recorder = recorder
+        
+        # Defaults for pipeline(): {"workers": {stage: count}, "queue_size": int}
+        self.pipeline_options = pipeline_options or {}
+        
+        # Requests served per path ("dictionary", "full", "memory", "rules")
+        self.path_counts: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        
+        # Hot-swap support: requests hold the gate for reading, swaps for writing
+        self.version = 0  # Bumped on every swap; stamps state-dependent caches
+        self._gate = ReadWriteGate()
+        
+        # Progressive startup: built without adapters/coordinator, they are attached later
+        neural_ready = src_adapter is not None and tgt_adapter is not None and coordinator is not None
+        self.readiness = READY if neural_ready else LOADING
+        self.load_error: Optional[str] = None
+        self._created = time.monotonic()
+        self._load_seconds: Optional[float] = 0.0 if neural_ready else None
+        self._settled = threading.Event()  # Set once loading succeeded or failed
+        if neural_ready:
+            self._settled.set()
 
-    def translate(self, text: str, context: str = "") -> str:
+    def translate(self, text: str, context: str = "", deadline: Optional[float] = None) -> str:
         """Translate text from source to target language.
         
         Args:
             text: Source language text to translate
             context: Optional context for disambiguation
+            deadline: Optional absolute time.monotonic() deadline; when the budget
+                runs low the request degrades along `self.degradation`
         
         Returns:
             Final translated text
         """
+        return self.translate_with_metadata(text, context, deadline)["translation"]
+
+    def translate_with_metadata(
+        self,
+        text: str,
+        context: str = "",
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Translate text and report how the result was produced.
+        
+        Returns:
+            {"translation": str, "path": "dictionary" | "full" | "memory" | "rules",
+             "coordinator_skipped": bool, "deadline_exceeded": bool,
+             "elapsed": seconds, "version": state version,
+             "stages": {stage name: seconds}}
+        """
+        timestamp = time.time()
+        start = time.monotonic()
+        stages: Dict[str, float] = {}
+        with self._gate.reading():
+            result = {"coordinator_skipped": False, "deadline_exceeded": False, "version": self.version}
+            fast = self._dictionary_fast_path(text, stages)
+            if fast is not None:
+                result.update(fast)
+            elif self.readiness != READY:
+                result.update(self._translate_string_only(text, context, stages))
+            else:
+                result.update(self._translate_along_ladder(text, context, deadline, stages))
+        return self._finish(result, text, context, timestamp, start, stages)
+
+    def _finish(
+        self,
+        result: Dict[str, Any],
+        text: str,
+        context: str,
+        timestamp: float,
+        start: float,
+        stages: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Stamp timing onto a result, count its path and record the request."""
+        result["elapsed"] = time.monotonic() - start
+        result["stages"] = stages
+        with self._stats_lock:
+            self.path_counts[result["path"]] += 1
+        if self.recorder is not None:
+            self.recorder.record(text, context, timestamp, result["elapsed"], result["path"])
+        return result
+
+    def _dictionary_fast_path(self, text: str, stages: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """Dictionary translation if domain terms cover enough of the input."""
+        if self.dictionary_threshold is None or self.domain_knowledge is None:
+            return None
+        tick = time.perf_counter()
+        translation, coverage = self.domain_knowledge.dictionary_translation(text)
+        stages["dictionary"] = time.perf_counter() - tick
+        if coverage < self.dictionary_threshold:
+            return None
+        return {"translation": translation, "path": DICTIONARY, "coverage": coverage}
+
+    def _translate_along_ladder(
+        self,
+        text: str,
+        context: str,
+        deadline: Optional[float],
+        stages: Dict[str, float]
+    ) -> Dict[str, Any]:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        exceeded = False
+        for path in self.degradation.plan(remaining):
+            if path == FULL:
+                result = self._translate_full(text, context, deadline, stages)
+                if result is not None:
+                    return result
+                exceeded = True  # Ran out of time mid-pipeline; continue down the ladder
+            elif path == MEMORY:
+                tick = time.perf_counter()
+                hit = self._recall(text, context)
+                stages[MEMORY] = time.perf_counter() - tick
+                if hit is not None:
+                    return {"translation": hit, "path": MEMORY, "deadline_exceeded": exceeded}
+            elif path == RULES:
+                break
+        tick = time.perf_counter()
+        translation = self._rule_output(text, context)
+        stages[RULES] = time.perf_counter() - tick
+        return {"translation": translation, "path": RULES, "deadline_exceeded": exceeded}
+
+    def _translate_string_only(self, text: str, context: str, stages: Dict[str, float]) -> Dict[str, Any]:
+        """Memory hit or rule output, used until the neural modules are ready."""
+        tick = time.perf_counter()
+        hit = self._recall(text, context)
+        stages[MEMORY] = time.perf_counter() - tick
+        if hit is not None:
+            return {"translation": hit, "path": MEMORY}
+        tick = time.perf_counter()
+        translation = self._rule_output(text, context)
+        stages[RULES] = time.perf_counter() - tick
+        return {"translation": translation, "path": RULES}
+
+    def attach_neural_modules(
+        self,
+        src_adapter: BaseLanguageAdapter,
+        tgt_adapter: BaseLanguageAdapter,
+        coordinator: BaseCoordinator,
+        checkpoint: Optional[Dict] = None
+    ) -> int:
+        """Swap in adapters and coordinator loaded after construction and mark ready.
+        
+        Args:
+            src_adapter: Source language adapter (shared with all subnets)
+            tgt_adapter: Target language adapter (shared with all subnets)
+            coordinator: Coordinator built for these subnets
+            checkpoint: Optional loaded checkpoint dict (same layout as `save`)
+        
+        Returns:
+            New state version
+        """
+        with self._gate.writing():
+            self.src_adapter = src_adapter
+            self.tgt_adapter = tgt_adapter
+            for subnet in self.subnets:
+                subnet.src_adapter = src_adapter
+                subnet.tgt_adapter = tgt_adapter
+            self.coordinator = coordinator
+            if checkpoint is not None:
+                self._load_checkpoint(checkpoint)
+            self.eval()  # Progressive startup is a serving mode
+            self.readiness = READY
+            self.load_error = None
+            self._load_seconds = time.monotonic() - self._created
+            self.version += 1
+            for subnet in self.subnets:
+                subnet.clear_caches()
+        self._settled.set()
+        return self.version
+
+    def mark_load_failed(self, error: BaseException) -> None:
+        """Record that the neural modules could not be loaded (string-only paths keep serving)."""
+        self.readiness = FAILED
+        self.load_error = f"{type(error).__name__}: {error}"
+        self._settled.set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until loading finishes (or `timeout` seconds pass); True if ready."""
+        self._settled.wait(timeout)
+        return self.readiness == READY
+
+    def health(self) -> Dict[str, Any]:
+        """Readiness for health checks.
+        
+        Returns:
+            {"readiness": "loading" | "ready" | "failed", "version": int,
+             "uptime": seconds, "load_seconds": seconds or None, "error": str or None}
+        """
+        return {
+            "readiness": self.readiness,
+            "version": self.version,
+            "uptime": time.monotonic() - self._created,
+            "load_seconds": self._load_seconds,
+            "error": self.load_error
+        }
+
+    def _translate_full(
+        self,
+        text: str,
+        context: str,
+        deadline: Optional[float],
+        stages: Dict[str, float]
+    ) -> Optional[Dict[str, Any]]:
+        """Full pipeline; returns None if the deadline passes before it completes.
+
+        Subnet features and the input embedding are computed only if the
+        coordinator declares it consumes them. Time spent per subnet (keyed by
+        class name), on subnet features, on the input embedding and in the
+        coordinator is added to `stages`.
+        """
+        ran = self._run_subnets(text, context, deadline, stages)
+        if ran is None:
+            return None
+        subnet_outputs, subnet_features = ran
+
+        # Nothing to choose between: skip the input embedding and coordinator scoring
+        if len(set(subnet_outputs)) == 1:
+            return {"translation": subnet_outputs[0], "path": FULL, "coordinator_skipped": True}
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+
+        encoded = self._encode_inputs(text, subnet_features, deadline, stages)
+        if encoded is None:
+            return None
+        return self._coordinate(subnet_outputs, *encoded, stages)
+
+    def _run_subnets(
+        self,
+        text: str,
+        context: str,
+        deadline: Optional[float],
+        stages: Dict[str, float]
+    ) -> Optional[Tuple[List[str], List[Any]]]:
+        """Subnet outputs and (lazy) features; None if the deadline passes."""
         # Run subnets in parallel (simulated; use torch.multiprocessing for true parallelism)
         subnet_outputs = []
         subnet_features = []
         for subnet in self.subnets:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            tick = time.perf_counter()
             output, feature = subnet.forward(text, context)
+            name = type(subnet).__name__
+            stages[name] = stages.get(name, 0.0) + time.perf_counter() - tick
             subnet_outputs.append(output)
             subnet_features.append(feature)
+        return subnet_outputs, subnet_features
+
+    def _encode_inputs(
+        self,
+        text: str,
+        subnet_features: List[Any],
+        deadline: Optional[float],
+        stages: Dict[str, float]
+    ) -> Optional[Tuple[List[Any], Optional[torch.Tensor]]]:
+        """Evaluate what the coordinator consumes: subnet features and/or the input embedding."""
+        # Evaluate deferred subnet features only for coordinators that read them
+        consumes = self.coordinator.consumes
+        if "subnet_features" in consumes:
+            tick = time.perf_counter()
+            subnet_features = [materialize(feature) for feature in subnet_features]
+            stages["subnet_features"] = time.perf_counter() - tick
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
 
         # Generate input embedding for coordinator
-        input_embed = self.src_adapter.embed(text)
+        input_embed = None
+        if "input_embed" in consumes:
+            tick = time.perf_counter()
+            input_embed = self.src_adapter.embed(text)
+            stages["input_embed"] = time.perf_counter() - tick
+        return subnet_features, input_embed
+
+    def _coordinate(
+        self,
+        subnet_outputs: List[str],
+        subnet_features: List[Any],
+        input_embed: Optional[torch.Tensor],
+        stages: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Coordinate subnet outputs into the final result."""
+        tick = time.perf_counter()
+        translation = self.coordinator.forward(subnet_outputs, subnet_features, input_embed)
+        stages["coordinator"] = time.perf_counter() - tick
+        return {"translation": translation, "path": FULL}
 
-        # Coordinate to get final result
-        return self.coordinator.forward(subnet_outputs, subnet_features, input_embed)
+    def _recall(self, text: str, context: str) -> Optional[str]:
+        """Exact memory-bank hit from any subnet."""
+        for subnet in self.subnets:
+            hit = subnet.recall(text, context)
+            if hit is not None:
+                return hit
+        return None
+
+    def _rule_output(self, text: str, context: str) -> str:
+        """String-only output of the configured rule subnet (no neural modules)."""
+        if self.degradation.rule_subnet is not None:
+            output = self.subnets[self.degradation.rule_subnet].transform(text, context)
+            return text if output is None else output
+        for subnet in reversed(self.subnets):
+            output = subnet.transform(text, context)
+            if output is not None:
+                return output
+        return text
+
+    def translate_batch(self, texts: List[str], contexts: Optional[List[str]] = None) -> List[str]:
+        """Translate a batch of texts, translating each distinct (text, context) once.
+        
+        Args:
+            texts: Source language texts
+            contexts: Optional per-text contexts (defaults to no context)
+        
+        Returns:
+            Translations aligned with `texts`
+        """
+        contexts = contexts if contexts is not None else [""] * len(texts)
+        if len(contexts) != len(texts):
+            raise ValueError("texts and contexts must have the same length")
+        
+        # Tokenize all distinct inputs in one batched call; translate() reuses the encodings
+        self.src_adapter.encode_batch(list(dict.fromkeys(texts)))
+        
+        translations: Dict = {}
+        for pair in zip(texts, contexts):
+            if pair not in translations:
+                translations[pair] = self.translate(*pair)
+        return [translations[pair] for pair in zip(texts, contexts)]
+
+    def pipeline(self, workers: Optional[Dict[str, int]] = None, queue_size: Optional[int] = None) -> StagedPipeline:
+        """Staged executor translating batches of (text, context) pairs.
+        
+        Batches move through four stages with bounded queues between them, so
+        batch N+1 is tokenized and run through the string-based subnet rules
+        while BERT encodes batch N:
+        
+            tokenize   → batched tokenization of inputs and expanded inputs
+            rules      → dictionary fast path, memory/rules while loading,
+                         subnet outputs (DomainKnowledge transformations)
+            encode     → subnet features / input embedding (adapter forward passes)
+            coordinate → coordinator scoring
+        
+        Deadlines do not apply. A batch that sees a hot swap between stages
+        is translated again under the new state.
+        
+        Args:
+            workers: Worker threads per stage name (default: the config's
+                `pipeline.workers`, else 1 each)
+            queue_size: Batches queued in front of each stage (default: the
+                config's `pipeline.queue_size`, else 2)
+        
+        Returns:
+            StagedPipeline whose items are lists of (text, context) pairs and
+            whose outputs are aligned lists of translate_with_metadata() results
+        """
+        workers = {**self.pipeline_options.get("workers", {}), **(workers or {})}
+        if queue_size is None:
+            queue_size = self.pipeline_options.get("queue_size", 2)
+        unknown = set(workers) - set(PIPELINE_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages {sorted(unknown)}. Available: {list(PIPELINE_STAGES)}")
+        functions = {
+            "tokenize": self._tokenize_stage,
+            "rules": self._rules_stage,
+            "encode": self._encode_stage,
+            "coordinate": self._coordinate_stage
+        }
+        return StagedPipeline(
+            [Stage(name, functions[name], workers.get(name, 1)) for name in PIPELINE_STAGES],
+            queue_size=queue_size
+        )
+
+    def _tokenize_stage(self, pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Pipeline stage: open per-request state and tokenize the batch at once."""
+        job = {"pairs": pairs, "version": self.version, "requests": {}}
+        for text, context in pairs:
+            if (text, context) not in job["requests"]:
+                job["requests"][(text, context)] = {
+                    "timestamp": time.time(), "start": time.monotonic(), "stages": {}, "result": None
+                }
+        with self._gate.reading():
+            job["version"] = self.version
+            if self.readiness != READY:
+                return job
+            tick = time.perf_counter()
+            texts = []
+            for text, context in job["requests"]:
+                texts.append(text)
+                texts.extend(split_sentences(context))  # Pooled per sentence by ContextSubnet
+                if self.domain_knowledge is not None:
+                    texts.append(self.domain_knowledge.expand_abbreviations(text))  # Tokenized by LexicalSubnet
+            self.src_adapter.encode_batch(list(dict.fromkeys(texts)))
+            self._stage_time(job, "tokenize", time.perf_counter() - tick)
+        return job
+
+    def _rules_stage(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Pipeline stage: string-only results and subnet outputs (lazy features)."""
+        with self._gate.reading():
+            if job["version"] != self.version:
+                return job
+            for (text, context), request in job["requests"].items():
+                stages = request["stages"]
+                result = {"coordinator_skipped": False, "deadline_exceeded": False, "version": self.version}
+                fast = self._dictionary_fast_path(text, stages)
+                if fast is not None:
+                    request["result"] = {**result, **fast}
+                elif self.readiness != READY:
+                    request["result"] = {**result, **self._translate_string_only(text, context, stages)}
+                else:
+                    outputs, features = self._run_subnets(text, context, None, stages)
+                    if len(set(outputs)) == 1:
+                        request["result"] = {
+                            **result, "translation": outputs[0], "path": FULL, "coordinator_skipped": True
+                        }
+                    else:
+                        request["outputs"], request["features"] = outputs, features
+        return job
+
+    def _encode_stage(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Pipeline stage: evaluate the features the coordinator consumes."""
+        with self._gate.reading():
+            if job["version"] != self.version:
+                return job
+            for (text, _), request in job["requests"].items():
+                if request["result"] is None:
+                    request["features"], request["input_embed"] = self._encode_inputs(
+                        text, request["features"], None, request["stages"]
+                    )
+        return job
+
+    def _coordinate_stage(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pipeline stage: coordinator scoring, then per-request bookkeeping."""
+        with self._gate.reading():
+            stale = job["version"] != self.version
+            if not stale:
+                for request in job["requests"].values():
+                    if request["result"] is None:
+                        request["result"] = {
+                            "coordinator_skipped": False, "deadline_exceeded": False, "version": self.version,
+                            **self._coordinate(
+                                request["outputs"], request["features"], request["input_embed"], request["stages"]
+                            )
+                        }
+        results = {}
+        for (text, context), request in job["requests"].items():
+            if stale:  # State was swapped mid-pipeline: redo under the new state
+                results[(text, context)] = self.translate_with_metadata(text, context)
+            else:
+                results[(text, context)] = self._finish(
+                    request["result"], text, context, request["timestamp"], request["start"], request["stages"]
+                )
+        return [results[pair] for pair in job["pairs"]]
+
+    @staticmethod
+    def _stage_time(job: Dict[str, Any], name: str, seconds: float) -> None:
+        """Charge a batch-level stage time to every request in the batch."""
+        for request in job["requests"].values():
+            request["stages"][name] = seconds
+
+    def translate_document(self, document: str, window: int = 3) -> Iterator[str]:
+        """Translate a long document sentence by sentence, streaming results.
+        
+        Each sentence is translated with the previous `window` sentences as
+        context. Those sentences were already encoded when they were translated,
+        so subnets that cache sentence embeddings (ContextSubnet) reuse them and
+        per-sentence cost stays bounded regardless of document length.
+        
+        Args:
+            document: Source language document (any number of sentences)
+            window: Number of preceding sentences passed as context
+        
+        Yields:
+            Translated text for each sentence, in document order
+        """
+        history = deque(maxlen=window)
+        for sentence in split_sentences(document):
+            # Newline-joined so split_sentences(context) gives back exactly these sentences
+            yield self.translate(sentence, "\n".join(history))
+            history.append(sentence)
 
     def update_memory(self, samples: List[Dict]) -> None:
         """Update all subnets with new training samples.
@@ -57,6 +549,59 @@ class OctopusTranslator:
         """
         for subnet in self.subnets:
             subnet.update_memory(samples)
+        
+        # Subnet views only record sample IDs; persist the shared store once
+        if self.sample_store is not None and self.sample_store.save_path:
+            self.sample_store.save()
+
+    def swap_state(
+        self,
+        domain_knowledge: Optional[DomainKnowledge] = None,
+        checkpoint: Optional[Dict] = None,
+        coordinator: Optional[BaseCoordinator] = None
+    ) -> int:
+        """Atomically swap in new domain data and/or weights between requests.
+        
+        Waits for in-flight requests to finish, blocks new ones for the duration
+        of the swap, then bumps `version` and clears caches derived from the old
+        state. Expensive preparation (parsing files, torch.load, building a new
+        coordinator) should happen before calling this; see src/reload.py.
+        The checkpoint is validated and converted before the gate is taken;
+        inside it, parameters are replaced by reference (`assign=True`) rather
+        than copied, so requests are blocked only for the pointer swaps.
+        
+        Args:
+            domain_knowledge: Replacement DomainKnowledge for all subnets (the
+                replaced one is closed once no request can reach it)
+            checkpoint: Loaded checkpoint dict (same layout as `save`)
+            coordinator: Pre-built coordinator replacing the current one
+        
+        Returns:
+            New state version
+        """
+        if (checkpoint is not None or coordinator is not None) and self.readiness != READY:
+            raise ValueError(f"Cannot swap weights while neural modules are {self.readiness}.")
+        prepared = []
+        if checkpoint is not None:
+            prepared = self._prepare_checkpoint(checkpoint, load_coordinator=coordinator is None)
+        replaced = None
+        with self._gate.writing():
+            if domain_knowledge is not None:
+                replaced = self.domain_knowledge
+                self.domain_knowledge = domain_knowledge
+                for subnet in self.subnets:
+                    subnet.domain_knowledge = domain_knowledge
+            self._apply_checkpoint(prepared, assign=True)
+            if coordinator is not None:
+                self.coordinator = coordinator
+            self.version += 1
+            for subnet in self.subnets:
+                subnet.clear_caches()
+            version = self.version
+        # Requests that could still see the old tables drained before the swap
+        if replaced is not None and replaced is not domain_knowledge:
+            replaced.close()
+        return version
 
     def save(self, path: str) -> None:
         """Save model state to disk.
@@ -64,12 +609,7 @@ class OctopusTranslator:
         Args:
             path: Path to save checkpoint (.pth file)
         """
-        torch.save({
-            "src_adapter": self.src_adapter.state_dict(),
-            "tgt_adapter": self.tgt_adapter.state_dict(),
-            "subnets": [s.state_dict() for s in self.subnets],
-            "coordinator": self.coordinator.state_dict()
-        }, path)
+        torch.save(self.state_dict(), path)
 
     def load(self, path: str) -> None:
         """Load model state from disk.
@@ -78,26 +618,126 @@ class OctopusTranslator:
             path: Path to checkpoint (.pth file)
         """
         checkpoint = torch.load(path, map_location=torch.device("cpu"))
-        self.src_adapter.load_state_dict(checkpoint["src_adapter"])
-        self.tgt_adapter.load_state_dict(checkpoint["tgt_adapter"])
+        self._load_checkpoint(checkpoint)
+
+    def state_dict(self) -> Dict:
+        """Module states in checkpoint layout (see `save`)."""
+        return {
+            "src_adapter": self.src_adapter.state_dict(),
+            "tgt_adapter": self.tgt_adapter.state_dict(),
+            "subnets": [s.state_dict() for s in self.subnets],
+            "coordinator": self.coordinator.state_dict()
+        }
+
+    def load_state_dict(self, state: Dict) -> None:
+        """Load module states produced by `state_dict`."""
+        self._load_checkpoint(state)
+
+    def parameters(self) -> Iterator[torch.nn.Parameter]:
+        """All parameters, each once (subnets share the adapters' parameters)."""
+        seen = set()
+        for module in self._modules():
+            for param in module.parameters():
+                if id(param) not in seen:
+                    seen.add(id(param))
+                    yield param
+
+    def memory_state_dict(self) -> Dict:
+        """Snapshot of subnet memories: the shared sample store, or each subnet's bank."""
+        if self.sample_store is not None:
+            return {"sample_store": self.sample_store.state_dict()}
+        return {"subnets": [
+            subnet.memory.state_dict() if isinstance(getattr(subnet, "memory", None), GenericMemoryBank) else None
+            for subnet in self.subnets
+        ]}
+
+    def load_memory_state_dict(self, state: Dict) -> None:
+        """Restore subnet memories from `memory_state_dict` output."""
+        if "sample_store" in state:
+            if self.sample_store is None:
+                raise ValueError("Memory snapshot is for a shared sample store, but none is configured.")
+            self.sample_store.load_state_dict(state["sample_store"])
+            return
+        for subnet, samples in zip(self.subnets, state.get("subnets", [])):
+            if samples is not None and isinstance(getattr(subnet, "memory", None), GenericMemoryBank):
+                subnet.memory.load_state_dict(samples)
+
+    def _load_checkpoint(self, checkpoint: Dict, load_coordinator: bool = True) -> None:
+        """Load module states from an in-memory checkpoint dict."""
+        self._apply_checkpoint(self._prepare_checkpoint(checkpoint, load_coordinator))
+
+    def _prepare_checkpoint(
+        self,
+        checkpoint: Dict,
+        load_coordinator: bool = True
+    ) -> List[Tuple[torch.nn.Module, Dict[str, torch.Tensor]]]:
+        """Match checkpoint entries to the modules that take them, without loading.
         
-        for i, subnet in enumerate(self.subnets):
-            subnet.load_state_dict(checkpoint["subnets"][i])
+        Each adapter is loaded once: the adapter entries inside every subnet's
+        state are skipped, since subnets share the translator's adapters.
+        Entries for tensors a module no longer has (e.g. layers removed by
+        `num_layers`) are ignored.
         
-        self.coordinator.load_state_dict(checkpoint["coordinator"])
+        Raises:
+            ValueError: If the checkpoint is missing a tensor or has a different shape
+        """
+        if len(checkpoint["subnets"]) != len(self.subnets):
+            raise ValueError(
+                f"Checkpoint has {len(checkpoint['subnets'])} subnets, translator has {len(self.subnets)}"
+            )
+        prepared = [
+            (self.src_adapter, _matching_state(self.src_adapter, checkpoint["src_adapter"], "src_adapter")),
+            (self.tgt_adapter, _matching_state(self.tgt_adapter, checkpoint["tgt_adapter"], "tgt_adapter"))
+        ]
+        for i, (subnet, state) in enumerate(zip(self.subnets, checkpoint["subnets"])):
+            own = _matching_state(subnet, state, f"subnet {i}", skip=_ADAPTER_PREFIXES)
+            if own:
+                prepared.append((subnet, own))
+        if load_coordinator:
+            coordinator_state = _matching_state(self.coordinator, checkpoint["coordinator"], "coordinator")
+            prepared.append((self.coordinator, coordinator_state))
+        return prepared
+
+    @staticmethod
+    def _apply_checkpoint(
+        prepared: List[Tuple[torch.nn.Module, Dict[str, torch.Tensor]]],
+        assign: bool = False
+    ) -> None:
+        """Load `_prepare_checkpoint` output (assign=True swaps tensors in instead of copying)."""
+        for module, state in prepared:
+            module.load_state_dict(state, strict=False, assign=assign)
 
     def train(self) -> None:
         """Set all modules to training mode."""
-        self.src_adapter.train()
-        self.tgt_adapter.train()
-        for subnet in self.subnets:
-            subnet.train()
-        self.coordinator.train()
+        for module in self._modules():
+            module.train()
 
     def eval(self) -> None:
         """Set all modules to evaluation mode."""
-        self.src_adapter.eval()
-        self.tgt_adapter.eval()
-        for subnet in self.subnets:
-            subnet.eval()
-        self.coordinator.eval()
\ No newline at end of file
+        for module in self._modules():
+            module.eval()
+
+    def _modules(self) -> List[torch.nn.Module]:
+        """Modules present so far (adapters/coordinator may still be loading)."""
+        modules = [self.src_adapter, self.tgt_adapter, *self.subnets, self.coordinator]
+        return [module for module in modules if module is not None]
+
+
+def _matching_state(
+    module: torch.nn.Module,
+    state: Dict[str, torch.Tensor],
+    name: str,
+    skip: Tuple[str, ...] = ()
+) -> Dict[str, torch.Tensor]:
+    """Entries of `state` for each of `module`'s tensors (except `skip` prefixes), in its dtype/device."""
+    expected = {k: v for k, v in module.state_dict().items() if not k.startswith(skip)}
+    missing = [k for k in expected if k not in state]
+    if missing:
+        raise ValueError(f"Checkpoint is missing {len(missing)} {name} entries, e.g. '{missing[0]}'")
+    for key, tensor in expected.items():
+        if state[key].shape != tensor.shape:
+            raise ValueError(
+                f"Checkpoint entry '{key}' for {name} has shape {tuple(state[key].shape)}, "
+                f"expected {tuple(tensor.shape)}"
+            )
+    return {k: state[k].to(dtype=v.dtype, device=v.device) for k, v in expected.items()}
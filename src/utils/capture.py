@@ -0,0 +1,145 @@
+import json
+import os
+import random
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_DIGITS = re.compile(r"[0-9０-９]")
+
+
+def mask_digits(text: str) -> str:
+    """Default anonymizer: replace every digit with 0 (ages, dates, IDs, phone numbers).
+
+    Lengths are preserved, so replayed traffic keeps the recorded size distribution.
+    """
+    return _DIGITS.sub("0", text)
+
+
+class TrafficRecorder:
+    """Opt-in request log for replaying production traffic.
+
+    Each translate call is appended as one compact JSON line:
+    {"t": wall-clock start (epoch seconds), "x": text, "c": context (omitted if
+    empty), "l": latency (seconds), "p": path}. When the active file would grow
+    past `max_bytes` it is rotated to `<path>.1`, older files shift up, and at
+    most `backup_count` rotated files are kept.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+        anonymize: bool = False,
+        anonymizer: Optional[Callable[[str], str]] = None,
+        sample_rate: float = 1.0
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        # Applied to text and context before they reach disk
+        self.anonymizer = anonymizer or (mask_digits if anonymize else None)
+        self.sample_rate = sample_rate    # Fraction of requests recorded
+        self.dropped = 0                  # Records lost to write errors
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TrafficRecorder":
+        """Build from the optional `capture` section of a YAML config."""
+        return cls(
+            path=config["path"],
+            max_bytes=int(config.get("max_bytes", 64 * 1024 * 1024)),
+            backup_count=int(config.get("backup_count", 5)),
+            anonymize=bool(config.get("anonymize", False)),
+            sample_rate=float(config.get("sample_rate", 1.0))
+        )
+
+    def record(
+        self,
+        text: str,
+        context: str,
+        timestamp: float,
+        latency: float,
+        path: Optional[str] = None
+    ) -> None:
+        """Append one request; write errors are counted, never raised to the caller."""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        if self.anonymizer is not None:
+            text = self.anonymizer(text)
+            context = self.anonymizer(context) if context else context
+
+        entry = {"t": round(timestamp, 6), "x": text}
+        if context:
+            entry["c"] = context
+        entry["l"] = round(latency, 6)
+        if path is not None:
+            entry["p"] = path
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        size = len(line.encode("utf-8"))
+
+        with self._lock:
+            try:
+                if self._size and self._size + size > self.max_bytes:
+                    self._rotate()
+                self._file.write(line)
+                self._file.flush()
+                self._size += size
+            except (OSError, ValueError):
+                self.dropped += 1
+
+    def log_files(self) -> List[str]:
+        """Existing log files, oldest first."""
+        return log_files(self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(f"{self.path}.{i}"):
+                    os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._size = 0
+
+
+def log_files(path: str) -> List[str]:
+    """A capture log and its rotated files, oldest first."""
+    rotated = []
+    i = 1
+    while os.path.exists(f"{path}.{i}"):
+        rotated.append(f"{path}.{i}")
+        i += 1
+    files = list(reversed(rotated))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield captured requests in recording order as
+    {"timestamp", "text", "context", "latency", "path"} dicts."""
+    for file_path in log_files(path):
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                yield {
+                    "timestamp": entry["t"],
+                    "text": entry["x"],
+                    "context": entry.get("c", ""),
+                    "latency": entry.get("l"),
+                    "path": entry.get("p")
+                }
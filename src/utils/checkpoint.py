@@ -0,0 +1,156 @@
+import json
+import os
+import queue
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import torch
+
+
+def snapshot(state: Any) -> Any:
+    """Copy a (nested) state dict so later training steps cannot change it.
+
+    Tensors are detached and copied to CPU memory; containers are rebuilt and
+    other values are kept as they are (they are immutable in state dicts).
+    """
+    if isinstance(state, torch.Tensor):
+        return state.detach().to("cpu", copy=True)
+    if isinstance(state, dict):
+        return {key: snapshot(value) for key, value in state.items()}
+    if isinstance(state, (list, tuple)):
+        return type(state)(snapshot(value) for value in state)
+    return state
+
+
+class AsyncCheckpointer:
+    """Periodic training checkpoints written off the training thread.
+
+    `save` snapshots the state to CPU memory (the only part the caller waits
+    for) and hands it to a writer thread, which serializes it to a temporary
+    file and renames it into place, so a crash never leaves a partial
+    checkpoint behind. Memory banks are written next to each checkpoint as
+    `<name>.memory.json`, and only the newest `keep` checkpoints are kept.
+    At most one snapshot waits for the writer; a further `save` blocks until
+    it is picked up, which bounds host memory.
+    """
+
+    _PATTERN = re.compile(r"^(?P<prefix>.+)_step(?P<step>\d+)\.pth$")
+
+    def __init__(self, directory: str, keep: int = 3, prefix: str = "checkpoint"):
+        self.directory = directory
+        self.keep = keep            # Checkpoints retained (older ones are deleted)
+        self.prefix = prefix
+        os.makedirs(directory, exist_ok=True)
+
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict, Optional[Dict]]]]" = queue.Queue(maxsize=1)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="octopus-checkpoint", daemon=True)
+        self._thread.start()
+
+    def path_for(self, step: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}_step{step:08d}.pth")
+
+    def save(self, step: int, state: Dict, memory: Optional[Dict] = None) -> str:
+        """Snapshot `state` and write it (with `memory`) in the background.
+        
+        Args:
+            step: Global training step (names the file)
+            state: Nested dict of tensors and plain values (model, optimizer, progress)
+            memory: JSON-serializable memory snapshot, e.g.
+                OctopusTranslator.memory_state_dict() (already a copy)
+
+        Returns:
+            Path the checkpoint will have once written
+        """
+        self._raise_if_failed()
+        path = self.path_for(step)
+        self._queue.put((path, snapshot(state), memory))
+        return path
+
+    def wait(self) -> None:
+        """Block until every queued checkpoint is on disk."""
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """Flush pending checkpoints and stop the writer thread."""
+        self._queue.join()
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_if_failed()
+
+    def checkpoints(self) -> List[str]:
+        """Complete checkpoints in this directory, oldest first."""
+        return list_checkpoints(self.directory, self.prefix)
+
+    def latest(self) -> Optional[str]:
+        checkpoints = self.checkpoints()
+        return checkpoints[-1] if checkpoints else None
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+                self._rotate()
+            except BaseException as e:  # Surfaced to the training thread on the next call
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, state: Dict, memory: Optional[Dict]) -> None:
+        # Memory first: a visible .pth always has its memory file next to it
+        if memory is not None:
+            _atomic_write(memory_path(path), lambda f: f.write(
+                json.dumps(memory, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            ))
+        _atomic_write(path, lambda f: torch.save(state, f))
+
+    def _rotate(self) -> None:
+        for path in self.checkpoints()[:-self.keep] if self.keep > 0 else []:
+            for stale in (path, memory_path(path)):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Background checkpoint write failed: {error}") from error
+
+
+def memory_path(checkpoint_path: str) -> str:
+    """Memory bank file written alongside a checkpoint."""
+    return f"{os.path.splitext(checkpoint_path)[0]}.memory.json"
+
+
+def list_checkpoints(directory: str, prefix: str = "checkpoint") -> List[str]:
+    """Checkpoints written by AsyncCheckpointer in `directory`, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = AsyncCheckpointer._PATTERN.match(name)
+        if match and match.group("prefix") == prefix:
+            found.append((int(match.group("step")), os.path.join(directory, name)))
+    return [path for _, path in sorted(found)]
+
+
+def load_checkpoint(path: str) -> Tuple[Dict, Optional[Dict]]:
+    """Load a checkpoint and its memory banks (None if none were saved)."""
+    state = torch.load(path, map_location=torch.device("cpu"))
+    memory = None
+    if os.path.exists(memory_path(path)):
+        with open(memory_path(path), "r", encoding="utf-8") as f:
+            memory = json.load(f)
+    return state, memory
+
+
+def _atomic_write(path: str, write) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -0,0 +1,116 @@
+import mmap
+import os
+import struct
+import sys
+from typing import Iterator, Mapping, Optional
+
+MAGIC = b"OCTD"
+FORMAT_VERSION = 1
+# magic, format version, entry count, longest key (in characters)
+_HEADER = struct.Struct("<4sIII")
+
+
+def compile_compact_dict(mapping: Mapping[str, str], path: str) -> None:
+    """Write a string → string mapping in the compact binary layout.
+
+    Layout (little-endian): header, key offsets [count + 1] (uint64), value
+    offsets [count + 1] (uint64), UTF-8 key blob sorted by bytes, UTF-8 value
+    blob in the same order. The file is written to a temporary name and
+    renamed into place, so readers never observe a partial file.
+    """
+    _check_byteorder()
+    entries = sorted((k.encode("utf-8"), v.encode("utf-8")) for k, v in mapping.items())
+    max_key_len = max((len(k) for k in mapping), default=0)
+
+    key_offsets, value_offsets = [0], [0]
+    for key, value in entries:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), max_key_len))
+        f.write(struct.pack(f"<{len(key_offsets)}Q", *key_offsets))
+        f.write(struct.pack(f"<{len(value_offsets)}Q", *value_offsets))
+        for key, _ in entries:
+            f.write(key)
+        for _, value in entries:
+            f.write(value)
+    os.replace(tmp_path, path)
+
+
+class CompactDict(Mapping):
+    """Read-only, memory-mapped string → string mapping.
+
+    Lookups binary-search the sorted key table directly in the mapped file, so
+    nothing is deserialized up front and every process mapping the same file
+    shares its physical pages.
+    """
+
+    def __init__(self, path: str):
+        _check_byteorder()
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, max_key_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a compact dictionary (v{FORMAT_VERSION}): {path}")
+        self._count = count
+        self.max_key_length = max_key_len  # Longest key in characters
+
+        view = memoryview(self._mm)
+        table_size = 8 * (count + 1)
+        start = _HEADER.size
+        self._key_offsets = view[start:start + table_size].cast("Q")
+        self._value_offsets = view[start + table_size:start + 2 * table_size].cast("Q")
+        self._keys_start = start + 2 * table_size
+        self._values_start = self._keys_start + self._key_offsets[count]
+
+    def _key_bytes(self, i: int) -> bytes:
+        return self._mm[self._keys_start + self._key_offsets[i]:self._keys_start + self._key_offsets[i + 1]]
+
+    def _value(self, i: int) -> str:
+        start = self._values_start + self._value_offsets[i]
+        end = self._values_start + self._value_offsets[i + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def _find(self, key: str) -> Optional[int]:
+        target = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._key_bytes(lo) == target:
+            return lo
+        return None
+
+    def __getitem__(self, key: str) -> str:
+        i = self._find(key) if isinstance(key, str) else None
+        if i is None:
+            raise KeyError(key)
+        return self._value(i)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key_bytes(i).decode("utf-8")
+
+    def close(self) -> None:
+        """Unmap the file (the mapping must not be used afterwards)."""
+        self._key_offsets.release()
+        self._value_offsets.release()
+        self._mm.close()
+
+
+def _check_byteorder() -> None:
+    if sys.byteorder != "little":
+        raise ValueError("Compact dictionaries are only supported on little-endian hosts.")
@@ -0,0 +1,34 @@
+from typing import Callable, Union
+import torch
+
+
+class LazyFeature:
+    """Deferred subnet feature vector.
+
+    Wraps the computation of a feature (usually an adapter `embed` pass) so it
+    runs only when the feature is read, at most once. Subnets return these from
+    `forward`; the translator materializes them only for coordinators that
+    consume subnet features.
+    """
+
+    __slots__ = ("_compute", "_value")
+
+    def __init__(self, compute: Callable[[], torch.Tensor]):
+        self._compute = compute
+        self._value = None
+
+    @property
+    def evaluated(self) -> bool:
+        return self._value is not None
+
+    def materialize(self) -> torch.Tensor:
+        """Compute (once) and return the feature tensor."""
+        if self._value is None:
+            self._value = self._compute()
+            self._compute = None  # Release references held by the closure
+        return self._value
+
+
+def materialize(feature: Union[torch.Tensor, LazyFeature]) -> torch.Tensor:
+    """Return the tensor behind a feature, evaluating it if it is lazy."""
+    return feature.materialize() if isinstance(feature, LazyFeature) else feature
@@ -1,6 +1,8 @@
-from typing import List, Dict, Optional
+from array import array
+from typing import List, Dict, Optional, Tuple
 import json
 import os
+import time
 from datetime import datetime
 
 
@@ -21,6 +23,7 @@ class GenericMemoryBank:
         self.save_path = save_path    # Path for persistence (optional)
         self.auto_save = auto_save    # Auto-save on update
         self.memory: List[Dict] = []  # Stores {"src":..., "tgt":..., "context":..., "timestamp":...}
+        self._index: Dict[Tuple[str, str], str] = {}  # (src, context) → tgt for exact recall
 
         # Load existing memory if available
         if self.save_path and os.path.exists(self.save_path):
@@ -37,11 +40,22 @@ class GenericMemoryBank:
         # Truncate to max size (keep most recent)
         if len(self.memory) > self.max_size:
             self.memory = self.memory[-self.max_size:]
+        self._rebuild_index()
         
         # Auto-save if enabled
         if self.auto_save and self.save_path:
             self.save()
 
+    def lookup(self, src: str, context: str = "") -> Optional[str]:
+        """Return the stored target for an exact (src, context) match, if any."""
+        return self._index.get((src, context))
+
+    def _rebuild_index(self) -> None:
+        self._index = {
+            (s["src"], s.get("context", "")): s["tgt"]
+            for s in self.memory if "src" in s and "tgt" in s
+        }
+
     def get_recent(self, n: int = 10) -> List[Dict]:
         """Retrieve n most recent samples (excluding timestamps)."""
         recent = self.memory[-n:] if len(self.memory) >= n else self.memory
@@ -64,4 +78,240 @@ class GenericMemoryBank:
             return
         
         with open(self.save_path, "r", encoding="utf-8") as f:
-            self.memory = json.load(f)
\ No newline at end of file
+            self.load_state_dict(json.load(f))
+
+    def state_dict(self) -> List[Dict]:
+        """Snapshot of the stored samples (safe to serialize from another thread)."""
+        return [dict(sample) for sample in self.memory]
+
+    def load_state_dict(self, samples: List[Dict]) -> None:
+        """Replace the stored samples (e.g. from a training checkpoint)."""
+        self.memory = list(samples)
+        self._rebuild_index()
+
+class SampleStore:
+    """Content-addressed sample store shared by all subnet memory views.
+    
+    Each distinct (src, tgt, context) triple is stored once, as interned string
+    IDs in array-backed columns with a float timestamp, instead of one dict per
+    sample per subnet. Subnets keep lightweight SampleViews (lists of sample IDs
+    with their own retention), and the whole store is persisted in one write.
+    """
+
+    def __init__(self, save_path: Optional[str] = None):
+        self.save_path = save_path
+
+        # Interned strings (src/tgt/context texts are heavily repeated)
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+        # Columns indexed by sample ID
+        self._src = array("I")
+        self._tgt = array("I")
+        self._ctx = array("I")
+        self._timestamps = array("d")
+
+        self._by_content: Dict[Tuple[int, int, int], int] = {}  # Content address → sample ID
+        self._by_source: Dict[Tuple[int, int], int] = {}        # (src, context) → latest sample ID
+        self._views: Dict[str, "SampleView"] = {}
+        self._saved_views: Dict[str, List[int]] = {}
+
+        if self.save_path and os.path.exists(self.save_path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._src)
+
+    def _intern(self, text: str) -> int:
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(text)
+            self._string_ids[text] = string_id
+        return string_id
+
+    def add(self, samples: List[Dict]) -> List[int]:
+        """Store samples (deduplicated by content) and return their IDs."""
+        now = time.time()
+        ids = []
+        for sample in samples:
+            src = self._intern(sample["src"])
+            tgt = self._intern(sample.get("tgt", ""))
+            ctx = self._intern(sample.get("context", ""))
+            sample_id = self._by_content.get((src, tgt, ctx))
+            if sample_id is None:
+                sample_id = len(self._src)
+                self._src.append(src)
+                self._tgt.append(tgt)
+                self._ctx.append(ctx)
+                self._timestamps.append(now)
+                self._by_content[(src, tgt, ctx)] = sample_id
+            self._by_source[(src, ctx)] = sample_id
+            ids.append(sample_id)
+        return ids
+
+    def get(self, sample_id: int) -> Dict:
+        """Materialize a sample as {"src":..., "tgt":..., "context":...}."""
+        return {
+            "src": self._strings[self._src[sample_id]],
+            "tgt": self._strings[self._tgt[sample_id]],
+            "context": self._strings[self._ctx[sample_id]],
+        }
+
+    def latest(self, src: str, context: str = "") -> Optional[int]:
+        """ID of the most recently added sample for (src, context), if any."""
+        src_id = self._string_ids.get(src)
+        ctx_id = self._string_ids.get(context)
+        if src_id is None or ctx_id is None:
+            return None
+        return self._by_source.get((src_id, ctx_id))
+
+    def target(self, sample_id: int) -> str:
+        return self._strings[self._tgt[sample_id]]
+
+    def view(self, name: str, max_size: int = 1000) -> "SampleView":
+        """Get (or create) the named view, restoring its IDs from disk if saved."""
+        if name not in self._views:
+            view = SampleView(self, name, max_size)
+            view.extend_ids(self._saved_views.pop(name, []))
+            self._views[name] = view
+        return self._views[name]
+
+    def save(self) -> None:
+        """Persist the store and all views in a single write.
+        
+        Samples no longer referenced by any view are dropped first.
+        """
+        if not self.save_path:
+            raise ValueError("No save path specified for sample store.")
+        state = self.state_dict()
+
+        directory = os.path.dirname(self.save_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.save_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.save_path)
+
+    def load(self) -> None:
+        """Load the store from disk (views are restored when requested)."""
+        with open(self.save_path, "r", encoding="utf-8") as f:
+            self.load_state_dict(json.load(f))
+
+    def state_dict(self) -> Dict:
+        """Compact the store and return a JSON-serializable copy of it and all views."""
+        self._compact()
+        views = {name: list(view.ids) for name, view in self._views.items()}
+        views.update(self._saved_views)  # Views not yet claimed by a subnet
+        return {
+            "strings": list(self._strings),
+            "src": list(self._src),
+            "tgt": list(self._tgt),
+            "context": list(self._ctx),
+            "timestamp": list(self._timestamps),
+            "views": views,
+        }
+
+    def load_state_dict(self, state: Dict) -> None:
+        """Replace the store's contents; views already handed out are reset in place."""
+        self._strings = list(state["strings"])
+        self._string_ids = {text: i for i, text in enumerate(self._strings)}
+        self._src = array("I", state["src"])
+        self._tgt = array("I", state["tgt"])
+        self._ctx = array("I", state["context"])
+        self._timestamps = array("d", state["timestamp"])
+        self._rebuild_indexes()
+        self._saved_views = {}
+        for name, ids in state.get("views", {}).items():
+            if name in self._views:
+                self._views[name].reset(ids)
+            else:
+                self._saved_views[name] = list(ids)
+        for name, view in self._views.items():
+            if name not in state.get("views", {}):
+                view.reset([])
+
+    def _compact(self) -> None:
+        """Drop samples and strings no view references, renumbering IDs."""
+        referenced = set()
+        for view in self._views.values():
+            referenced.update(view.ids)
+        for ids in self._saved_views.values():
+            referenced.update(ids)
+        if len(referenced) == len(self._src):
+            return
+
+        keep = sorted(referenced)
+        remap = {old: new for new, old in enumerate(keep)}
+        used = sorted({self._src[i] for i in keep} | {self._tgt[i] for i in keep} | {self._ctx[i] for i in keep})
+        string_remap = {old: new for new, old in enumerate(used)}
+
+        self._strings = [self._strings[i] for i in used]
+        self._string_ids = {text: i for i, text in enumerate(self._strings)}
+        self._src = array("I", (string_remap[self._src[i]] for i in keep))
+        self._tgt = array("I", (string_remap[self._tgt[i]] for i in keep))
+        self._ctx = array("I", (string_remap[self._ctx[i]] for i in keep))
+        self._timestamps = array("d", (self._timestamps[i] for i in keep))
+        self._rebuild_indexes()
+
+        for view in self._views.values():
+            view.reset([remap[i] for i in view.ids])
+        self._saved_views = {name: [remap[i] for i in ids] for name, ids in self._saved_views.items()}
+
+    def _rebuild_indexes(self) -> None:
+        self._by_content = {}
+        self._by_source = {}
+        for sample_id, key in enumerate(zip(self._src, self._tgt, self._ctx)):
+            self._by_content[key] = sample_id
+            self._by_source[(key[0], key[2])] = sample_id
+
+
+class SampleView:
+    """A subnet's view of the shared SampleStore: sample IDs with its own retention.
+    
+    Offers the same API subnets use on GenericMemoryBank (add_samples,
+    get_recent, lookup, save).
+    """
+
+    def __init__(self, store: SampleStore, name: str, max_size: int = 1000):
+        self.store = store
+        self.name = name
+        self.max_size = max_size  # Max samples retained by this view
+        self.ids = array("I")
+        self._members = set()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_samples(self, samples: List[Dict]) -> None:
+        """Add samples to the store and reference them from this view."""
+        self.extend_ids(self.store.add(samples))
+
+    def extend_ids(self, ids: List[int]) -> None:
+        for sample_id in ids:
+            if sample_id not in self._members:
+                self.ids.append(sample_id)
+                self._members.add(sample_id)
+        # Truncate to max size (keep most recent)
+        if len(self.ids) > self.max_size:
+            self.reset(self.ids[-self.max_size:])
+
+    def reset(self, ids: List[int]) -> None:
+        self.ids = array("I", ids)
+        self._members = set(self.ids)
+
+    def get_recent(self, n: int = 10) -> List[Dict]:
+        """Retrieve n most recent samples."""
+        return [self.store.get(i) for i in self.ids[-n:]] if n > 0 else []
+
+    def lookup(self, src: str, context: str = "") -> Optional[str]:
+        """Return the stored target for an exact (src, context) match in this view."""
+        sample_id = self.store.latest(src, context)
+        if sample_id is None or sample_id not in self._members:
+            return None
+        return self.store.target(sample_id)
+
+    def save(self) -> None:
+        """Persist the shared store (all views are written together)."""
+        self.store.save()
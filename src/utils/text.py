@@ -0,0 +1,13 @@
+import re
+from typing import List
+
+# Split after sentence-final punctuation (keeping it attached), after a period
+# followed by whitespace, or on line breaks. Closing quotes stay with the sentence.
+_SENTENCE_BOUNDARY = re.compile(
+    r"(?<=[。！？!?；])(?![。！？!?；”’」』）)])\s*|(?<=\.)\s+|\n+"
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split a document into sentences (Chinese and Western punctuation)."""
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(text) if s and s.strip()]
@@ -1,8 +1,13 @@
 # tests/test_adapters.py
 
+import os
+import tempfile
 import unittest
 import torch
 from src.registry import global_registry
+from src.modules.adapters.depth import encoder_states, resolve_pool_layers, truncate_encoder
+from src.modules.adapters.windowing import content_states, pool_content, window_starts
+from src.modules.adapters.student import CharCNNEncoder
 
 
 class TestChineseAdapter(unittest.TestCase):
@@ -27,7 +32,7 @@ class TestChineseAdapter(unittest.TestCase):
 
     def test_embed_shape(self):
         embed = self.adapter.embed(self.test_text)
-        self.assertEqual(embed.shape, (1, 128, 768))  # [batch, seq_len, dim]
+        self.assertEqual(embed.shape, (1, 3, 768))  # [batch, real_tokens, dim]
 
     def test_parse_syntax(self):
         syntax = self.adapter.parse_syntax(self.test_text)
@@ -56,7 +61,124 @@ class TestEnglishAdapter(unittest.TestCase):
 
     def test_embed_shape(self):
         embed = self.adapter.embed(self.test_text)
-        self.assertEqual(embed.shape, (1, 128, 768))
+        self.assertEqual(embed.shape, (1, 2, 768))
+
+
+class TestWindowing(unittest.TestCase):
+    """Test cases for long-input window planning."""
+
+    def test_short_input_single_window(self):
+        self.assertEqual(window_starts(50, span=126, overlap=32, max_windows=8), [0])
+
+    def test_windows_cover_input_with_overlap(self):
+        starts = window_starts(300, span=126, overlap=32, max_windows=8)
+        self.assertEqual(starts[0], 0)
+        self.assertEqual(starts[-1] + 126, 300)
+        for prev, nxt in zip(starts, starts[1:]):
+            self.assertLessEqual(nxt - prev, 126 - 32)
+
+    def test_window_budget_caps_window_count(self):
+        starts = window_starts(5000, span=126, overlap=32, max_windows=4)
+        self.assertEqual(len(starts), 4)
+        self.assertEqual(starts[-1] + 126, 5000)  # Budget spreads windows over the whole input
+
+
+def save_tiny_bert(directory: str) -> None:
+    """Randomly initialized 2-layer BERT with a character vocabulary, saved for from_pretrained."""
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + list("心脏病患者需要手术高血压") + list("abcdefghijklmnopqrstuvwxyz")
+    vocab_file = os.path.join(directory, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab))
+    BertTokenizerFast(vocab_file=vocab_file).save_pretrained(directory)
+    config = BertConfig(
+        vocab_size=len(vocab), hidden_size=16, num_hidden_layers=2, num_attention_heads=2, intermediate_size=32
+    )
+    torch.manual_seed(0)
+    BertModel(config).save_pretrained(directory)
+
+
+class TestPaddingFreeEmbeddings(unittest.TestCase):
+    """Test that adapter output holds real tokens only, whatever the input length."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        save_tiny_bert(cls.tmpdir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def adapter(self, **params):
+        return global_registry.get_adapter("chinese_adapter_v1", embed_dim=16, model_name=self.tmpdir.name, **params)
+
+    def test_short_input_excludes_padding(self):
+        embed = self.adapter(max_seq_len=16).embed("心脏病")
+        self.assertEqual(embed.shape, (1, 3, 16))
+        # Pooled features no longer depend on how much padding max_seq_len adds
+        wider = self.adapter(max_seq_len=32).embed("心脏病")
+        self.assertTrue(torch.allclose(embed.mean(dim=1), wider.mean(dim=1), atol=1e-5))
+
+    def test_batched_pooling_matches_content_states(self):
+        hidden = torch.randn(2, 6, 4)
+        attention_mask = torch.tensor([[1, 1, 1, 1, 0, 0], [1, 1, 0, 0, 0, 0]])
+        pooled = pool_content(hidden, attention_mask)
+        self.assertTrue(torch.allclose(pooled[0], content_states(hidden[:1], attention_mask[:1]).mean(dim=1)[0]))
+        self.assertTrue(torch.allclose(pooled[1], hidden[1, 0]))  # Empty text falls back to [CLS]
+
+
+class TestCharCNNEncoder(unittest.TestCase):
+    """Test cases for the distilled student encoder."""
+
+    def test_output_shape(self):
+        encoder = CharCNNEncoder(vocab_size=100, embed_dim=16, char_dim=8, hidden_dim=12, num_layers=3)
+        features = encoder(torch.randint(0, 100, (2, 10)))
+        self.assertEqual(features.shape, (2, 10, 16))
+
+    def test_pooled_features_are_trainable(self):
+        encoder = CharCNNEncoder(vocab_size=100, embed_dim=16)
+        pooled = encoder(torch.randint(1, 100, (1, 6))).mean(dim=1)
+        pooled.sum().backward()
+        self.assertIsNotNone(encoder.embedding.weight.grad)
+
+
+class TestEncoderDepth(unittest.TestCase):
+    """Test cases for encoder truncation and layer pooling."""
+
+    def setUp(self):
+        from transformers import BertConfig, BertModel
+        config = BertConfig(
+            vocab_size=50, hidden_size=16, num_hidden_layers=4, num_attention_heads=2, intermediate_size=32
+        )
+        torch.manual_seed(0)
+        self.model = BertModel(config).eval()
+        self.input_ids = torch.randint(1, 50, (1, 8))
+        self.attention_mask = torch.ones(1, 8, dtype=torch.long)
+
+    def test_truncated_encoder_matches_intermediate_layer(self):
+        with torch.no_grad():
+            hidden_states = self.model(
+                input_ids=self.input_ids, attention_mask=self.attention_mask, output_hidden_states=True
+            ).hidden_states
+            full_state = self.model.state_dict()
+            truncate_encoder(self.model, 2)
+            states = encoder_states(self.model, self.input_ids, self.attention_mask)
+        self.assertEqual(len(self.model.encoder.layer), 2)
+        self.assertTrue(torch.allclose(states, hidden_states[2], atol=1e-6))
+        self.model.load_state_dict(full_state)  # Full-depth checkpoints still load
+
+    def test_pool_layers(self):
+        self.assertEqual(resolve_pool_layers([-1, 2, 2], depth=4), [2, 4])
+        self.assertIsNone(resolve_pool_layers(None, depth=4))
+        with self.assertRaises(ValueError):
+            resolve_pool_layers([5], depth=4)
+        with torch.no_grad():
+            hidden_states = self.model(
+                input_ids=self.input_ids, attention_mask=self.attention_mask, output_hidden_states=True
+            ).hidden_states
+            pooled = encoder_states(self.model, self.input_ids, self.attention_mask, [2, 4])
+        self.assertTrue(torch.allclose(pooled, (hidden_states[2] + hidden_states[4]) / 2, atol=1e-6))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+# tests/test_capture.py
+
+import os
+import tempfile
+import unittest
+from src.utils.capture import TrafficRecorder, mask_digits, read_records
+
+
+class TestTrafficRecorder(unittest.TestCase):
+    """Test cases for request capture and log rotation."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "traffic.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_round_trip(self):
+        recorder = TrafficRecorder(self.path)
+        recorder.record("心梗", "", 100.0, 0.25, "full")
+        recorder.record("高血压", "患者", 101.5, 0.01, "dictionary")
+        recorder.close()
+
+        records = list(read_records(self.path))
+        self.assertEqual([r["text"] for r in records], ["心梗", "高血压"])
+        self.assertEqual(records[0]["context"], "")
+        self.assertEqual(records[1]["context"], "患者")
+        self.assertEqual(records[1]["timestamp"], 101.5)
+        self.assertEqual(records[0]["path"], "full")
+
+    def test_anonymize_masks_digits(self):
+        self.assertEqual(mask_digits("患者65岁，ID ４２"), "患者00岁，ID 00")
+        recorder = TrafficRecorder(self.path, anonymize=True)
+        recorder.record("患者65岁", "电话13800000000", 0.0, 0.1)
+        recorder.close()
+        record = next(read_records(self.path))
+        self.assertEqual(record["text"], "患者00岁")
+        self.assertEqual(record["context"], "电话00000000000")
+
+    def test_rotation_keeps_order_and_backup_limit(self):
+        recorder = TrafficRecorder(self.path, max_bytes=60, backup_count=2)
+        for i in range(10):
+            recorder.record(f"text {i}", "", float(i), 0.0)
+        recorder.close()
+
+        files = recorder.log_files()
+        self.assertEqual(files[-1], self.path)
+        self.assertLessEqual(len(files), 3)
+        timestamps = [r["timestamp"] for r in read_records(self.path)]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(timestamps[-1], 9.0)
+        self.assertLess(len(timestamps), 10)  # Oldest records rotated out
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# tests/test_checkpoint.py
+
+import os
+import tempfile
+import unittest
+import torch
+from src.utils.checkpoint import AsyncCheckpointer, load_checkpoint, memory_path
+
+
+class TestAsyncCheckpointer(unittest.TestCase):
+    """Test cases for background checkpoint writing."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshot_is_isolated_from_later_updates(self):
+        checkpointer = AsyncCheckpointer(self.tmp.name)
+        weight = torch.zeros(3)
+        path = checkpointer.save(1, {"model": {"weight": weight}, "epoch": 0})
+        weight.add_(1.0)  # Training continues while the write is pending
+        checkpointer.close()
+
+        state, memory = load_checkpoint(path)
+        self.assertTrue(torch.equal(state["model"]["weight"], torch.zeros(3)))
+        self.assertEqual(state["epoch"], 0)
+        self.assertIsNone(memory)
+
+    def test_rotation_keeps_newest_with_memory(self):
+        checkpointer = AsyncCheckpointer(self.tmp.name, keep=2)
+        for step in (10, 20, 30):
+            checkpointer.save(step, {"step": step}, memory={"subnets": [[{"src": "心梗", "tgt": "MI"}]]})
+        checkpointer.close()
+
+        paths = checkpointer.checkpoints()
+        self.assertEqual(paths, [checkpointer.path_for(20), checkpointer.path_for(30)])
+        self.assertFalse(os.path.exists(memory_path(checkpointer.path_for(10))))
+        state, memory = load_checkpoint(checkpointer.latest())
+        self.assertEqual(state["step"], 30)
+        self.assertEqual(memory["subnets"][0][0]["tgt"], "MI")
+        self.assertFalse([name for name in os.listdir(self.tmp.name) if name.endswith(".tmp")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# tests/test_knowledge.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.modules.knowledge import DomainKnowledge
+from src.utils.compact_dict import CompactDict, compile_compact_dict
+
+
+class TestCompactDict(unittest.TestCase):
+    """Test cases for memory-mapped compact dictionaries."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "terms.bin")
+        self.mapping = {"心肌梗死": "myocardial infarction", "高血压": "hypertension", "a": "", "": "empty"}
+        compile_compact_dict(self.mapping, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_matches_source(self):
+        table = CompactDict(self.path)
+        self.assertEqual(len(table), len(self.mapping))
+        self.assertEqual(dict(table.items()), self.mapping)
+        self.assertEqual(table.get("高血压"), "hypertension")
+        self.assertIsNone(table.get("心脏病"))
+        self.assertNotIn("心脏病", table)
+        self.assertEqual(table.max_key_length, 4)
+        table.close()
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"{}" * 16)
+        with self.assertRaises(ValueError):
+            CompactDict(self.path)
+
+
+class TestDomainKnowledgeLoading(unittest.TestCase):
+    """Test cases for DomainKnowledge resource loading."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp.name, "domain_medical_terms.json")
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump({"高血压": "hypertension"}, f, ensure_ascii=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_prefers_compiled_table(self):
+        compile_compact_dict({"高血压": "HTN"}, self.json_path.replace(".json", ".bin"))
+        knowledge = DomainKnowledge("medical", data_dir=self.tmp.name)
+        self.assertIsInstance(knowledge.terms, CompactDict)
+        self.assertEqual(knowledge.translate_term("高血压"), "HTN")
+
+    def test_compiled_abbreviations_are_probed_not_loaded(self):
+        bin_path = os.path.join(self.tmp.name, "domain_medical_abbreviations.bin")
+        compile_compact_dict({"心梗": "心肌梗死", "高压": "高血压"}, bin_path)
+        with mock.patch.object(CompactDict, "__iter__", side_effect=AssertionError("table was iterated")):
+            knowledge = DomainKnowledge("medical", data_dir=self.tmp.name)
+            self.assertEqual(knowledge.expand_abbreviations("心梗伴高压"), "心肌梗死伴高血压")
+        knowledge.close()
+
+    def test_stale_compiled_table_ignored(self):
+        bin_path = self.json_path.replace(".json", ".bin")
+        compile_compact_dict({"高血压": "HTN"}, bin_path)
+        os.utime(bin_path, (0, 0))  # Older than the JSON source
+        knowledge = DomainKnowledge("medical", data_dir=self.tmp.name)
+        self.assertEqual(knowledge.translate_term("高血压"), "hypertension")
+
+
+class TestDictionaryTranslation(unittest.TestCase):
+    """Test cases for term-index segmentation and coverage."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        resources = {
+            "terms": {"心肌梗死": "myocardial infarction", "高血压": "hypertension", "高血": "blood"},
+            "abbreviations": {"心梗": "心肌梗死"},
+        }
+        for resource_type, mapping in resources.items():
+            path = os.path.join(self.tmp.name, f"domain_medical_{resource_type}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(mapping, f, ensure_ascii=False)
+        self.knowledge = DomainKnowledge("medical", data_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_full_coverage_via_abbreviation(self):
+        translation, coverage = self.knowledge.dictionary_translation("心梗，高血压")
+        self.assertEqual(coverage, 1.0)
+        self.assertEqual(translation, "myocardial infarction， hypertension")
+
+    def test_abbreviations_expand_longest_first(self):
+        self.knowledge.abbreviations = {"心梗": "心肌梗死", "心": "heart-", "梗死": "x"}
+        self.knowledge._max_abbr_len = 2
+        self.assertEqual(self.knowledge.expand_abbreviations("急性心梗死"), "急性心肌梗死死")
+        self.assertEqual(self.knowledge.expand_abbreviations("心跳"), "heart-跳")
+
+    def test_partial_coverage(self):
+        translation, coverage = self.knowledge.dictionary_translation("高血压患者")
+        self.assertAlmostEqual(coverage, 0.6)
+        self.assertEqual(translation, "hypertension 患者")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+# tests/test_lazy.py
+
+import unittest
+import torch
+from src.utils.lazy import LazyFeature, materialize
+
+
+class TestLazyFeature(unittest.TestCase):
+    """Test cases for deferred subnet features."""
+
+    def test_not_computed_until_read(self):
+        calls = []
+        feature = LazyFeature(lambda: calls.append(1) or torch.ones(1, 4))
+        self.assertFalse(feature.evaluated)
+        self.assertEqual(calls, [])
+
+        self.assertTrue(torch.equal(feature.materialize(), torch.ones(1, 4)))
+        feature.materialize()
+        self.assertTrue(feature.evaluated)
+        self.assertEqual(calls, [1])  # Computed once
+
+    def test_materialize_passes_tensors_through(self):
+        tensor = torch.zeros(1, 4)
+        self.assertIs(materialize(tensor), tensor)
+        self.assertTrue(torch.equal(materialize(LazyFeature(lambda: tensor)), tensor))
+
+
+if __name__ == "__main__":
+    unittest.main()
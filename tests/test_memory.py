@@ -0,0 +1,53 @@
+# tests/test_memory.py
+
+import os
+import tempfile
+import unittest
+from src.utils.memory import SampleStore
+
+
+class TestSampleStore(unittest.TestCase):
+    """Test cases for the shared sample store and subnet views."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "samples.json")
+        self.samples = [
+            {"src": "心梗", "tgt": "myocardial infarction", "context": ""},
+            {"src": "高血压", "tgt": "hypertension", "context": "患者65岁"},
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_views_share_deduplicated_samples(self):
+        store = SampleStore(self.path)
+        lexical, domain = store.view("lexical"), store.view("domain")
+        lexical.add_samples(self.samples)
+        domain.add_samples(self.samples)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(domain.get_recent(1), [self.samples[1]])
+        self.assertEqual(lexical.lookup("高血压", "患者65岁"), "hypertension")
+        self.assertIsNone(lexical.lookup("高血压"))
+
+    def test_view_retention(self):
+        store = SampleStore()
+        view = store.view("syntax", max_size=1)
+        view.add_samples(self.samples)
+        self.assertEqual(len(view), 1)
+        self.assertIsNone(view.lookup("心梗"))
+
+    def test_save_and_reload_compacts_unreferenced(self):
+        store = SampleStore(self.path)
+        store.view("lexical", max_size=1).add_samples(self.samples)
+        store.save()
+
+        reloaded = SampleStore(self.path)
+        self.assertEqual(len(reloaded), 1)
+        view = reloaded.view("lexical")
+        self.assertEqual(view.get_recent(), [self.samples[1]])
+        self.assertEqual(view.lookup("高血压", "患者65岁"), "hypertension")
+
+
+if __name__ == "__main__":
+    unittest.main()
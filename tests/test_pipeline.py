@@ -0,0 +1,64 @@
+# tests/test_pipeline.py
+
+import threading
+import time
+import unittest
+from src.pipeline import Stage, StagedPipeline
+
+
+class TestStagedPipeline(unittest.TestCase):
+    """Test cases for the staged executor."""
+
+    def test_outputs_in_input_order(self):
+        def jitter(x):
+            time.sleep(0.001 * (x % 3))
+            return x
+
+        stages = [Stage("double", lambda x: 2 * x), Stage("jitter", jitter, workers=3), Stage("inc", lambda x: x + 1)]
+        with StagedPipeline(stages, queue_size=1) as pipeline:
+            self.assertEqual(list(pipeline.map(range(50))), [2 * x + 1 for x in range(50)])
+        stats = pipeline.stats()
+        self.assertEqual([stats[name]["items"] for name in ("double", "jitter", "inc")], [50, 50, 50])
+        self.assertEqual(stats["jitter"]["workers"], 3)
+
+    def test_stages_overlap(self):
+        # Item 1 enters the first stage while item 0 is still in the second
+        second_started, first_saw_overlap = threading.Event(), []
+
+        def first(x):
+            if x == 1:
+                first_saw_overlap.append(second_started.wait(timeout=2))
+            return x
+
+        def second(x):
+            second_started.set()
+            time.sleep(0.05)
+            return x
+
+        with StagedPipeline([Stage("first", first), Stage("second", second)]) as pipeline:
+            self.assertEqual(list(pipeline.map([0, 1])), [0, 1])
+        self.assertEqual(first_saw_overlap, [True])
+
+    def test_errors_fail_only_their_item(self):
+        def check(x):
+            if x == 2:
+                raise ValueError("bad item")
+            return x
+
+        with StagedPipeline([Stage("check", check), Stage("same", lambda x: x)]) as pipeline:
+            futures = [pipeline.submit(x) for x in range(4)]
+            with self.assertRaises(ValueError):
+                futures[2].result()
+            self.assertEqual([futures[i].result() for i in (0, 1, 3)], [0, 1, 3])
+        self.assertEqual(pipeline.stats()["same"]["items"], 3)
+
+    def test_closed_pipeline_rejects_work(self):
+        pipeline = StagedPipeline([Stage("same", lambda x: x)])
+        self.assertEqual(pipeline.submit(1).result(), 1)
+        pipeline.close()
+        with self.assertRaises(RuntimeError):
+            pipeline.submit(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# tests/test_reload.py
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import torch
+from src.modules.knowledge import DomainKnowledge
+from src.utils.compact_dict import compile_compact_dict
+from src.reload import HotReloader
+from src.utils.sync import ReadWriteGate
+from tests.test_translator import make_translator
+
+
+class TestReadWriteGate(unittest.TestCase):
+    """Test cases for the readers-writer swap gate."""
+
+    def test_readers_share_the_gate(self):
+        gate = ReadWriteGate()
+        with gate.reading():
+            entered = threading.Event()
+
+            def read():
+                with gate.reading():
+                    entered.set()
+
+            thread = threading.Thread(target=read)
+            thread.start()
+            self.assertTrue(entered.wait(timeout=2))
+            thread.join()
+
+    def test_writer_waits_for_readers_and_blocks_new_ones(self):
+        gate = ReadWriteGate()
+        events = []
+        reader_holding, release_reader = threading.Event(), threading.Event()
+
+        def first_reader():
+            with gate.reading():
+                reader_holding.set()
+                release_reader.wait(timeout=2)
+                events.append("first reader done")
+
+        def writer():
+            with gate.writing():
+                events.append("writer")
+
+        def late_reader():
+            with gate.reading():
+                events.append("late reader")
+
+        threads = [threading.Thread(target=first_reader)]
+        threads[0].start()
+        reader_holding.wait(timeout=2)
+        threads.append(threading.Thread(target=writer))
+        threads[1].start()
+        while not gate._writers_waiting:  # Writer is queued behind the reader
+            time.sleep(0.001)
+        threads.append(threading.Thread(target=late_reader))
+        threads[2].start()
+        time.sleep(0.05)
+        self.assertEqual(events, [])  # Neither the writer nor the late reader got in
+        release_reader.set()
+        for thread in threads:
+            thread.join(timeout=2)
+        self.assertEqual(events, ["first reader done", "writer", "late reader"])
+
+
+class TestHotReloader(unittest.TestCase):
+    """Test cases for reloading domain data and checkpoints into a live translator."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.terms_path = os.path.join(self.tmp.name, "domain_test_terms.json")
+        self.checkpoint_path = os.path.join(self.tmp.name, "model.pth")
+        self.write_terms({"高血压": "hypertension"}, mtime=1000)
+        self.translator = make_translator(domain_knowledge=DomainKnowledge("test", data_dir=self.tmp.name))
+        self.reloader = HotReloader(self.translator, checkpoint_path=self.checkpoint_path, poll_interval=0.01)
+
+    def tearDown(self):
+        self.reloader.stop()
+        self.tmp.cleanup()
+
+    def write_terms(self, terms, mtime):
+        with open(self.terms_path, "w", encoding="utf-8") as f:
+            json.dump(terms, f, ensure_ascii=False)
+        os.utime(self.terms_path, (mtime, mtime))
+
+    def test_reload_swaps_changed_domain_data(self):
+        self.assertEqual(self.reloader.reload(), 0)  # Nothing changed
+        self.write_terms({"高血压": "high blood pressure"}, mtime=2000)
+        self.assertEqual(self.reloader.changed_paths(), [self.terms_path])
+        self.assertEqual(self.reloader.reload(), 1)
+        self.assertEqual(self.translator.domain_knowledge.translate_term("高血压"), "high blood pressure")
+        for subnet in self.translator.subnets:
+            self.assertIs(subnet.domain_knowledge, self.translator.domain_knowledge)
+        self.assertEqual(self.reloader.changed_paths(), [])
+
+    def test_replaced_compiled_tables_are_closed(self):
+        bin_path = self.terms_path.replace(".json", ".bin")
+        compile_compact_dict({"高血压": "HTN"}, bin_path)
+        self.reloader.reload()
+        old_terms = self.translator.domain_knowledge.terms
+        self.assertEqual(old_terms.get("高血压"), "HTN")
+
+        compile_compact_dict({"高血压": "BP"}, bin_path)
+        os.utime(bin_path, (4000, 4000))
+        self.reloader.reload()
+        self.assertTrue(old_terms._mm.closed)
+        self.assertEqual(self.translator.domain_knowledge.translate_term("高血压"), "BP")
+        self.translator.domain_knowledge.close()
+
+    def test_write_during_reload_is_not_lost(self):
+        snapshot = self.reloader._snapshot_mtimes
+
+        def snapshot_then_write():
+            mtimes = snapshot()
+            self.write_terms({"高血压": "HTN"}, mtime=3000)  # Lands after the reload looked at the files
+            return mtimes
+
+        self.reloader._snapshot_mtimes = snapshot_then_write
+        self.reloader.reload()
+        self.reloader._snapshot_mtimes = snapshot
+        self.assertEqual(self.reloader.changed_paths(), [self.terms_path])
+        self.reloader.reload()
+        self.assertEqual(self.translator.domain_knowledge.translate_term("高血压"), "HTN")
+
+    def test_checkpoint_reload_loads_shared_adapter_once(self):
+        adapter = self.translator.src_adapter
+        state = self.translator.state_dict()
+        state["src_adapter"] = state["tgt_adapter"] = {"scale": torch.full((1,), 3.0)}  # One stub adapter
+        for subnet_state in state["subnets"]:  # Stale copies inside subnet states are not used
+            subnet_state["src_adapter.scale"] = torch.full((1,), 5.0)
+        torch.save(state, self.checkpoint_path)
+
+        self.assertEqual(self.reloader.reload(), 1)
+        self.assertIs(self.translator.src_adapter, adapter)
+        self.assertEqual(adapter.scale.item(), 3.0)
+        self.assertIs(self.translator.subnets[0].src_adapter.scale, adapter.scale)
+        self.assertTrue(adapter.scale.requires_grad)
+
+    def test_bad_checkpoint_keeps_serving_and_is_logged(self):
+        torch.save({"src_adapter": {}, "tgt_adapter": {}, "subnets": [{}, {}], "coordinator": {}}, self.checkpoint_path)
+        with self.assertLogs("src.reload", level="ERROR"):
+            self.reloader.start()
+            for _ in range(200):
+                if self.reloader.last_error:
+                    break
+                time.sleep(0.01)
+        self.assertIn("ValueError", self.reloader.last_error)
+        self.assertEqual(self.translator.version, 0)
+        self.assertEqual(self.translator.src_adapter.scale.item(), 1.0)
+        self.assertEqual(self.translator.translate("abc"), "a:abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# tests/test_remote.py
+
+import os
+import tempfile
+import unittest
+import torch
+from src.interfaces.subnet import BaseSubnet
+from src.modules.subnets.remote import RemoteSubnet, SubnetServer, discard_tensor, pack_tensor, unpack_tensor
+from src.utils.lazy import LazyFeature, materialize
+
+
+class EchoSubnet(BaseSubnet):
+    """Upper-cases its input; the feature is the input length repeated."""
+
+    def __init__(self):
+        super().__init__(None, None, None)
+        self.samples = []
+
+    def forward(self, input_text, context=""):
+        return input_text.upper(), LazyFeature(lambda: torch.full((1, 4096), float(len(input_text))))
+
+    def update_memory(self, samples):
+        self.samples.extend(samples)
+
+    def recall(self, input_text, context=""):
+        return next((s["tgt"] for s in self.samples if s["src"] == input_text), None)
+
+
+class TestRemoteSubnet(unittest.TestCase):
+    """Test cases for subnets served out of process."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        address = os.path.join(self.tmpdir.name, "shard.sock")
+        self.local = EchoSubnet()
+        self.server = SubnetServer({"0:echo": self.local}, address, authkey="test")
+        self.server.start()
+        self.remote = RemoteSubnet(None, None, None, address=address, subnet="0:echo", authkey="test")
+
+    def tearDown(self):
+        self.remote.close()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_tensor_round_trip(self):
+        small, large = torch.arange(4.0), torch.randn(64, 256)
+        self.assertEqual(pack_tensor(small)[0], "inline")
+        unused = pack_tensor(large[:1].clone(), inline_below=0)
+        self.assertEqual(unused[0], "shm")
+        discard_tensor(unused)
+        self.assertTrue(torch.equal(unpack_tensor(pack_tensor(large, inline_below=0)), large))
+
+    def test_batched_forward_and_lazy_features(self):
+        results = self.remote.forward_batch([("ab", ""), ("abc", "")])
+        self.assertEqual([output for output, _ in results], ["AB", "ABC"])
+        self.assertFalse(results[0][1].evaluated)  # Fetched only when read
+
+        feature = materialize(results[1][1])
+        self.assertEqual(tuple(feature.shape), (1, 4096))
+        self.assertTrue(torch.all(feature == 3.0))
+
+    def test_memory_calls_are_forwarded(self):
+        self.remote.update_memory([{"src": "x", "tgt": "y", "context": ""}])
+        self.assertEqual(self.local.samples[0]["tgt"], "y")
+        self.assertEqual(self.remote.recall("x"), "y")
+        self.assertIsNone(self.remote.transform("x"))
+
+    def test_server_errors_are_raised(self):
+        bad = RemoteSubnet(None, None, None, address=self.remote.address, subnet="9:missing", authkey="test")
+        with self.assertRaises(RuntimeError):
+            bad.forward("x")
+        bad.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests/test_rules.py
+
+import unittest
+from src.modules.rules import RuleEngine
+
+
+class TestRuleEngine(unittest.TestCase):
+    """Test cases for the compiled rule engine."""
+
+    def test_literal_rules_single_pass(self):
+        engine = RuleEngine.from_mapping({"心梗": "心肌梗死", "心肌梗死": "MI"})
+        # Rewritten text is not re-scanned, so expansions do not chain
+        self.assertEqual(engine.apply("心梗患者"), "心肌梗死患者")
+
+    def test_longest_match_wins(self):
+        engine = RuleEngine.from_mapping({"心": "heart", "心脏病": "heart disease"})
+        self.assertEqual(engine.apply("心脏病和心"), "heart disease和heart")
+
+    def test_template_slot_capture(self):
+        engine = RuleEngine()
+        engine.add_template("因为{X}", "because he has {X}")
+        self.assertEqual(engine.apply("他因为心脏病，需要手术"), "他because he has 心脏病，需要手术")
+
+    def test_leading_slot_stops_at_clause_boundary(self):
+        engine = RuleEngine()
+        engine.add_template("{X}需要手术", "{X} needs surgery")
+        self.assertEqual(engine.apply("患者65岁，他需要手术"), "患者65岁，他 needs surgery")
+
+    def test_repeated_slot_must_match_same_text(self):
+        engine = RuleEngine()
+        engine.add_template("{X}和{X}", "both {X}")
+        self.assertEqual(engine.apply("药和药"), "both 药")
+        self.assertEqual(engine.apply("药和酒"), "药和酒")
+
+    def test_template_without_literal_rejected(self):
+        with self.assertRaises(ValueError):
+            RuleEngine().add_template("{X}", "{X}")
+
+    def test_many_rules(self):
+        mapping = {f"词{i}": f"w{i}" for i in range(5000)}
+        engine = RuleEngine.from_mapping(mapping)
+        self.assertEqual(engine.apply("词12和词4999"), "w12和w4999")
+
+
+if __name__ == "__main__":
+    unittest.main()
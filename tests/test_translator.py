@@ -0,0 +1,108 @@
+# tests/test_translator.py
+
+import unittest
+from typing import Dict, List
+import torch
+from src.interfaces.adapter import BaseLanguageAdapter
+from src.interfaces.coordinator import BaseCoordinator
+from src.interfaces.subnet import BaseSubnet
+from src.translator import OctopusTranslator
+from src.utils.lazy import LazyFeature
+from src.utils.text import split_sentences
+
+
+class StubAdapter(BaseLanguageAdapter):
+    """Adapter without a model: one-dimensional "embeddings" of the text length."""
+
+    def __init__(self):
+        super().__init__()
+        self.embed_dim = 1
+        self.scale = torch.nn.Parameter(torch.ones(1))
+        self.batches: List[List[str]] = []
+
+    def tokenize(self, text):
+        return list(text)
+
+    def detokenize(self, tokens):
+        return "".join(tokens)
+
+    def embed(self, text):
+        return self.scale * torch.full((1, 1, 1), float(len(text)))
+
+    def parse_syntax(self, text):
+        return {"tokens": list(text)}
+
+    def encode_batch(self, texts):
+        self.batches.append(list(texts))
+        return list(texts)
+
+
+class StubSubnet(BaseSubnet):
+    """Tags its input; `transform` upper-cases it; remembers samples exactly."""
+
+    def __init__(self, tag: str, adapter=None):
+        super().__init__(adapter, adapter, None)
+        self.tag = tag
+        self.samples: Dict = {}
+        self.calls: List = []
+
+    def forward(self, input_text, context=""):
+        self.calls.append((input_text, context))
+        return f"{self.tag}:{input_text}", LazyFeature(lambda: self.src_adapter.embed(input_text).mean(dim=1))
+
+    def transform(self, input_text, context=""):
+        return input_text.upper()
+
+    def recall(self, input_text, context=""):
+        return self.samples.get((input_text, context))
+
+    def update_memory(self, samples):
+        for s in samples:
+            self.samples[(s["src"], s.get("context", ""))] = s["tgt"]
+
+
+class FirstCoordinator(BaseCoordinator):
+    """Picks the first subnet output."""
+
+    consumes = frozenset({"subnet_outputs", "input_embed"})
+
+    def __init__(self, subnet_count: int = 2, embed_dim: int = 1):
+        super().__init__(subnet_count, embed_dim)
+        self.calls = 0
+
+    def forward(self, subnet_outputs, subnet_features, input_embed):
+        self.calls += 1
+        return subnet_outputs[0]
+
+
+def make_translator(**kwargs) -> OctopusTranslator:
+    adapter = StubAdapter()
+    subnets = [StubSubnet("a", adapter), StubSubnet("b", adapter)]
+    return OctopusTranslator(adapter, adapter, subnets, FirstCoordinator(), **kwargs)
+
+
+class TestTranslateDocument(unittest.TestCase):
+    """Test cases for streaming document translation."""
+
+    def test_context_window_matches_split_sentences(self):
+        translator = make_translator()
+        document = "他头痛。她发烧！\n无标点的一行\n又一行\n最后一句."
+        translations = list(translator.translate_document(document, window=2))
+
+        sentences = split_sentences(document)
+        self.assertEqual(translations, [f"a:{s}" for s in sentences])
+        contexts = [context for _, context in translator.subnets[0].calls]
+        self.assertEqual(contexts[0], "")
+        for i, context in enumerate(contexts[1:], start=1):
+            # Each context splits back into exactly the previous `window` sentences
+            self.assertEqual(split_sentences(context), sentences[max(0, i - 2):i])
+
+    def test_results_stream(self):
+        translator = make_translator()
+        stream = translator.translate_document("一。二。三。")
+        self.assertEqual(next(stream), "a:一。")
+        self.assertEqual(len(translator.subnets[0].calls), 1)  # Later sentences not yet translated
+
+
+if __name__ == "__main__":
+    unittest.main()